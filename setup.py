@@ -181,6 +181,7 @@ setup(
     # pip to create the appropriate form of executable for the target platform.
     entry_points={
         'console_scripts': [
+            'elisa-run=elisa.runner:main',
         ],
     },
 )
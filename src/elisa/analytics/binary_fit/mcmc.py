@@ -1,5 +1,4 @@
 from abc import ABCMeta, abstractmethod
-from multiprocessing import Pool
 from typing import Dict
 
 import emcee
@@ -22,6 +21,7 @@ from .. params import parameters
 from .. params.conf import NUISANCE_PARSER, PARAM_PARSER
 from .. tools.utils import time_layer_resolver
 
+from ... observer import mp_manager
 from ... observer.utils import normalize_light_curve
 from ... base.error import ElisaError
 from ... import settings
@@ -149,17 +149,20 @@ class MCMCFit(AbstractFit, MCMCMixin, metaclass=ABCMeta):
 
         logger.info('starting mcmc')
         kwargs = dict(nwalkers=nwalkers, ndim=ndim, log_prob_fn=self.ln_probability)
-        if settings.NUMBER_OF_MCMC_PROCESSES > 1:
-            with Pool(processes=settings.NUMBER_OF_MCMC_PROCESSES) as pool:
-                logger.info('starting parallel mcmc')
+        n_walker_processes, n_phase_processes = self.split_processes(nwalkers)
+        if n_walker_processes > 1:
+            with mp_manager.nested_pool(n_walker_processes, n_phase_processes) as pool:
+                logger.info(f'starting parallel mcmc with {n_walker_processes} walker processes and '
+                            f'{n_phase_processes} phase processes per walker')
                 sampler = emcee.EnsembleSampler(pool=pool, **kwargs)
                 self.worker(sampler, p0, nsteps, nsteps_burn_in, save=save, fit_id=fit_id, fitable=self.fitable,
                             normalization=self.normalization, progress=progress)
         else:
             logger.info('starting singlecore mcmc')
             sampler = emcee.EnsembleSampler(**kwargs)
-            self.worker(sampler, p0, nsteps, nsteps_burn_in, save=save, fit_id=fit_id, fitable=self.fitable,
-                        normalization=self.normalization, progress=progress)
+            with settings.context(NUMBER_OF_PROCESSES=n_phase_processes):
+                self.worker(sampler, p0, nsteps, nsteps_burn_in, save=save, fit_id=fit_id, fitable=self.fitable,
+                            normalization=self.normalization, progress=progress)
 
         self.last_sampler = sampler
         self.last_normalization = self.normalization
@@ -170,6 +173,25 @@ class MCMCFit(AbstractFit, MCMCMixin, metaclass=ABCMeta):
 
         return sampler
 
+    def split_processes(self, nwalkers):
+        """
+        Splits available cores between parallel evaluation of walkers and parallel evaluation of phases within
+        each walker. If `settings.MCMC_CORE_BUDGET` is set, the budget is split to minimize the wall time,
+        otherwise `settings.NUMBER_OF_MCMC_PROCESSES` walker processes are used and phases are evaluated serially
+        within them (daemonic walker processes cannot start their own pools).
+
+        :param nwalkers: int; The number of walkers in the ensemble.
+        :return: Tuple[int, int]; number of walker processes, number of phase processes per walker process
+        """
+        if settings.MCMC_CORE_BUDGET > 1:
+            x_data = getattr(self, 'x_data_reduced', None)
+            n_points = 1 if x_data is None else len(x_data)
+            # emcee evaluates half of the ensemble at once
+            return mp_manager.split_core_budget(settings.MCMC_CORE_BUDGET, nwalkers // 2, n_points)
+        if settings.NUMBER_OF_MCMC_PROCESSES > 1:
+            return settings.NUMBER_OF_MCMC_PROCESSES, 1
+        return 1, settings.NUMBER_OF_PROCESSES
+
     @staticmethod
     def generate_initial_states(initial_state, nwalkers, ndim, x0_vector=None):
         """
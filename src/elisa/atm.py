@@ -1083,8 +1083,9 @@ def read_unique_atm_tables(fpaths):
     # check if the atm table is in the buffer
     models, load_fpaths = [], []
     for fpath in fpaths:
-        if fpath in buffer.ATMOSPHERE_TABLES:
-            models.append(buffer.ATMOSPHERE_TABLES[fpath])
+        model = buffer.ATMOSPHERE_TABLES.get(fpath)
+        if model is not None:
+            models.append(model)
         else:
             load_fpaths.append(fpath)
 
@@ -1093,7 +1094,7 @@ def read_unique_atm_tables(fpaths):
         loaded_models = [qval[1] for qval in utils.IterableQueue(result_queue) if qval[1] is not None]
         # add loaded atmospheres to atm buffer
         for ii, fpath in enumerate(load_fpaths):
-            buffer.ATMOSPHERE_TABLES[fpath] = loaded_models[ii]
+            buffer.store(buffer.ATMOSPHERE_TABLES, fpath, loaded_models[ii])
         models += loaded_models
     # clean buffer
     buffer.reduce_buffer(buffer.ATMOSPHERE_TABLES)
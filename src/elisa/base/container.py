@@ -4,10 +4,7 @@ from abc import abstractmethod
 
 from .. import const
 from .. logger import getLogger
-from copy import (
-    deepcopy,
-    copy
-)
+from copy import copy
 from .. import (
     utils,
     umpy as up
@@ -117,16 +114,19 @@ class PositionContainer(object):
         """
         Rotate quantities defined in __PROPERTIES_TO_ROTATE__.
         Rotation is made in orbital plane (around z-axis) and inclination (y-axis) direction in respective order.
-        Angle are defined in self.position and self.inclination.
+        Angle are defined in self.position and self.inclination. Rotation is lazy, quantities are rotated only when
+        they are accessed (see `StarContainer.transform_property`).
 
         :return: elisa.base.PositionContainer;
         """
         __PROPERTIES_TO_ROTATE__ = ["points", "normals", "velocities", "face_centres"]
 
+        # both rotations composed into a single matrix, vectors are rotated as `vectors @ matrix`
+        matrix = utils.rotate_item(np.eye(3), self.position, self.inclination)
         for component in self._components:
             star_container = getattr(self, component)
             for prop in __PROPERTIES_TO_ROTATE__:
-                self.rotate_property(star_container, prop)
+                star_container.transform_property(prop, matrix)
         return self
 
     def rotate_property(self, container, prop):
@@ -148,7 +148,7 @@ class PositionContainer(object):
         gamma = getattr(self, "gamma")
         for component in self._components:
             star = getattr(self, component)
-            star.velocities[:, 0] += gamma
+            star.transform_property('velocities', np.eye(3), shift=np.array([gamma, 0.0, 0.0]))
         return self
 
     def apply_darkside_filter(self):
@@ -174,8 +174,8 @@ class PositionContainer(object):
         """
         for component in self._components:
             star_container = getattr(self, component)
-            normals = getattr(star_container, "normals")
-            los_cosines = self.return_cosines(normals, line_of_sight=line_of_sight)
+            # cosines are evaluated without rotation of all normals to the observer's frame of reference
+            los_cosines = star_container.calculate_projections("normals", np.array(line_of_sight, dtype=float))
             setattr(star_container, "los_cosines", los_cosines)
 
     @staticmethod
@@ -205,10 +205,40 @@ class PositionContainer(object):
 
     def copy(self):
         """
-        Return deepcopy of PositionContainer instance.
+        Return copy-on-write copy of PositionContainer instance. Component containers are copied via
+        `StarContainer.copy`, therefore surface arrays are shared with the original container until they are
+        replaced (e.g. by rotation).
+
         :return: elisa.base.container.PositionContainer;
         """
-        return deepcopy(self)
+        container = copy(self)
+        for component in self._components:
+            setattr(container, component, getattr(self, component).copy())
+        return container
+
+
+class TransformedProperty(object):
+    """
+    Descriptor of vector quantity of StarContainer (e.g. points, normals) which is transformed from co-rotating frame
+    of reference to the observer's frame of reference lazily. Pending transformation scheduled by
+    `StarContainer.transform_property` is applied when the quantity is accessed for the first time.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name)
+        if self.name in instance._transformations:
+            matrix, shift = instance._transformations.pop(self.name)
+            value = up.matmul(value, matrix) if shift is None else up.matmul(value, matrix) + shift
+            instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance._transformations.pop(self.name, None)
+        instance.__dict__[self.name] = value
 
 
 class StarContainer(object):
@@ -337,6 +367,10 @@ class StarContainer(object):
     :normal_radiance: numpy.array;
     :los_cosines: numpy.array;
     """
+    points = TransformedProperty()
+    normals = TransformedProperty()
+    velocities = TransformedProperty()
+    face_centres = TransformedProperty()
 
     def __init__(self,
                  points=None,
@@ -356,6 +390,9 @@ class StarContainer(object):
                  normal_radiance=None,
                  los_cosines=None):
 
+        # pending transformations of vector quantities {prop: (matrix, shift), ...}, see `transform_property`
+        self._transformations = dict()
+
         self.points = points
         self.normals = normals
         self.faces = faces
@@ -391,6 +428,10 @@ class StarContainer(object):
         self.azimuth_args = np.array([])
         # --------------------------------------------------------------------------------------------------------------
 
+        # 3D convex hull of the surface in co-rotating frame (set only for components with constant shape)
+        self.outline_simplices = np.array([])
+        self.outline_normals = np.array([])
+
         self.spots = dict()
         self.pulsations = dict()
         self.polar_potential_gradient_magnitude = np.nan
@@ -463,11 +504,69 @@ class StarContainer(object):
 
     def copy(self):
         """
-        Return deepcopy of StarContainer instance.
+        Return copy-on-write copy of StarContainer instance. Spots and pulsation modes are copied shallowly and all
+        numpy arrays (points, faces, areas, temperatures, ...) are shared with the original container. Quantities
+        changed in a copy are always rebound to newly allocated arrays, thus surface arrays of the container can not
+        be modified in place.
 
         :return: elisa.base.container.StarContainer;
         """
-        return deepcopy(self)
+        container = copy(self)
+        container._transformations = copy(self._transformations)
+        container.spots = {idx: copy(spot) for idx, spot in self.spots.items()} \
+            if self.has_spots() else copy(self.spots)
+        container.pulsations = {idx: copy(mode) for idx, mode in self.pulsations.items()} \
+            if self.has_pulsations() else copy(self.pulsations)
+        return container
+
+    def transform_property(self, prop, matrix, shift=None):
+        """
+        Schedules transformation `value @ matrix + shift` of the vector quantity `prop` (see `TransformedProperty`).
+        Transformation is composed with previously scheduled ones and it is evaluated only when the quantity is
+        accessed.
+
+        :param prop: str; name of the property (e.g. 'points')
+        :param matrix: numpy.array; 3x3 transformation matrix
+        :param shift: numpy.array; vector added after transformation by `matrix`
+        """
+        if self.__dict__.get(prop) is None:
+            return
+        if prop in self._transformations:
+            old_matrix, old_shift = self._transformations[prop]
+            if old_shift is not None:
+                shift = up.matmul(old_shift, matrix) if shift is None else up.matmul(old_shift, matrix) + shift
+            matrix = up.matmul(old_matrix, matrix)
+        self._transformations[prop] = (matrix, shift)
+
+    def get_transformed_subset(self, prop, indices):
+        """
+        Returns rows `indices` of the vector quantity `prop` without evaluation of the pending transformation on the
+        whole array.
+
+        :param prop: str; name of the property (e.g. 'points')
+        :param indices: numpy.array; indices or mask of requested rows
+        :return: numpy.array;
+        """
+        if prop not in self._transformations:
+            return getattr(self, prop)[indices]
+        matrix, shift = self._transformations[prop]
+        subset = up.matmul(self.__dict__[prop][indices], matrix)
+        return subset if shift is None else subset + shift
+
+    def calculate_projections(self, prop, direction):
+        """
+        Returns projections of the vector quantity `prop` onto the unit vector `direction` without evaluation of the
+        pending transformation of the quantity.
+
+        :param prop: str; name of the property (e.g. 'normals')
+        :param direction: numpy.array; unit vector
+        :return: numpy.array;
+        """
+        if prop not in self._transformations:
+            return up.matmul(getattr(self, prop), direction)
+        matrix, shift = self._transformations[prop]
+        projections = up.matmul(self.__dict__[prop], up.matmul(matrix, direction))
+        return projections if shift is None else projections + np.dot(shift, direction)
 
     def remove_spot(self, spot_index: int):
         """
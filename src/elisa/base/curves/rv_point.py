@@ -10,7 +10,7 @@ def _calculate_rv_point(star):
     :return: Union[numpy.float, numpy.nan];
     """
     indices = getattr(star, 'indices')
-    velocities = getattr(star, 'velocities')[indices]
+    velocities = star.get_transformed_subset('velocities', indices)
     fluxes = crv_utils.calculate_surface_element_fluxes('rv_band', star)
     return np.sum(velocities[:, 0] * fluxes) / np.sum(fluxes) \
         if np.sum(fluxes) != 0 else np.NaN
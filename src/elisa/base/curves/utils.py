@@ -5,16 +5,18 @@ from ...observer.passband import init_rv_passband
 
 def include_passband_data_to_kwargs(**kwargs):
     """
-    Including dummy passband from which radiometric radial velocities will be calculated.
+    Including dummy passband from which radiometric radial velocities will be calculated. If `kwargs` already contain
+    photometric passbands (joint light curve and radial velocity observation), the dummy passband is added to them and
+    the bandwidth is extended accordingly.
 
     :param kwargs: Tuple;
     :return: Tuple;
     """
     psbnd, right_bandwidth, left_bandwidth = init_rv_passband()
     kwargs.update({
-        'passband': {'rv_band': psbnd},
-        'left_bandwidth': left_bandwidth,
-        'right_bandwidth': right_bandwidth
+        'passband': {**kwargs.get('passband', dict()), 'rv_band': psbnd},
+        'left_bandwidth': min(kwargs.get('left_bandwidth', left_bandwidth), left_bandwidth),
+        'right_bandwidth': max(kwargs.get('right_bandwidth', right_bandwidth), right_bandwidth)
     })
     return kwargs
 
@@ -52,6 +54,24 @@ def flux_from_star_container(band, star):
     return up.sum(calculate_surface_element_fluxes(band, star))
 
 
+def cast_surface_params(normal_radiance, ld_cfs):
+    """
+    Casts normal radiances and limb darkening coefficients to single precision if
+    `settings.USE_SINGLE_PRECISION_SURFACE_PARAMS` is enabled.
+
+    :param normal_radiance: Dict; {component: {passband: numpy.array, ...}, ...}
+    :param ld_cfs: Dict; {component: {passband: numpy.array, ...}, ...}
+    :return: Tuple[Dict, Dict]; normal radiances and limb darkening coefficients
+    """
+    if not settings.USE_SINGLE_PRECISION_SURFACE_PARAMS:
+        return normal_radiance, ld_cfs
+
+    def _cast(values):
+        return {component: {band: np.asarray(vals, dtype=np.float32) for band, vals in bands.items()}
+                for component, bands in values.items()}
+    return _cast(normal_radiance), _cast(ld_cfs)
+
+
 def generate_teff_logg_for_ld_cfs(component_instance, symmetry_test):
     """
     Generates temperatures and log_g parameters either for full star or symmetrical part based on the symmetry test.
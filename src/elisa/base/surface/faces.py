@@ -2,7 +2,18 @@ import gc
 import numpy as np
 
 from copy import copy
+from scipy.spatial.qhull import Delaunay
 from ... import umpy as up
+from ... buffer import buffer
+from ... logger import getLogger
+
+
+logger = getLogger("base.surface.faces")
+
+# maximal number of rounds of edge flips repairing stored triangulation before falling back to Delaunay triangulation
+TOPOLOGY_REPAIR_ITERATIONS = 5
+# heights of vertices above the plane of the adjacent face, relative to the size of the surface, considered planar
+PLANARITY_TOLERANCE = 1e-10
 
 
 def initialize_model_container(vertices_map):
@@ -248,3 +259,192 @@ def symmetry_face_reduction(values, base_symmetry_faces_number):
     :return: numpy.array; reduced surface distribution array
     """
     return values[:base_symmetry_faces_number]
+
+
+def get_surface_topology(faces):
+    """
+    Returns topology of closed triangulated surface as pairing of half-edges. Half-edge `3 * i + j` is the edge
+    of `i`-th face starting in its `j`-th vertex.
+
+    :param faces: numpy.array; (m, 3) vertex indices of faces
+    :return: Union[numpy.array, None]; (3m, ) index of the half-edge of adjacent face sharing the same edge,
+                                       None if surface is not closed
+    """
+    edges = np.sort(np.stack([faces, np.roll(faces, -1, axis=1)], axis=-1).reshape(-1, 2), axis=1)
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    # each edge of closed surface is shared exactly by two faces
+    first, second = order[0::2], order[1::2]
+    if first.shape != second.shape or not np.array_equal(edges[first], edges[second]) or \
+            np.any(np.all(edges[first][1:] == edges[first][:-1], axis=1)):
+        return None
+    partners = np.empty(order.shape[0], dtype=order.dtype)
+    partners[first], partners[second] = second, first
+    return partners
+
+
+def get_edge_heights(points, faces, partners):
+    """
+    Returns heights of the vertices of adjacent faces opposite to the shared edge above the plane of the face for
+    each half-edge of triangulated closed surface, relative to the size of the surface.
+
+    :param points: numpy.array; (n, 3) vertices
+    :param faces: numpy.array; (m, 3) vertex indices of faces
+    :param partners: numpy.array; (3m, ) see `get_surface_topology`
+    :return: numpy.array; (3m, ) heights, NaN for degenerated faces
+    """
+    vertices = points[faces[:, 0]]
+    normals = np.cross(points[faces[:, 1]] - vertices, points[faces[:, 2]] - vertices)
+    normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    # orienting normals outwards
+    normals *= np.sign(np.sum(normals * (vertices - np.mean(points, axis=0)), axis=1))[:, np.newaxis]
+
+    # vertex of the adjacent face opposite to the shared edge
+    opposite_vertices = faces.reshape(-1)[partners - partners % 3 + (partners % 3 + 2) % 3]
+    face_indices = np.arange(partners.shape[0]) // 3
+    heights = np.sum(normals[face_indices] * (points[opposite_vertices] - vertices[face_indices]), axis=1)
+    return heights / np.max(np.ptp(points, axis=0))
+
+
+def is_enclosed(points, faces, indices):
+    """
+    Tests whether the points lie inside (or on) the convex closed surface.
+
+    :param points: numpy.array; (n, 3) vertices
+    :param faces: numpy.array; (m, 3) vertex indices of faces of convex closed surface
+    :param indices: numpy.array; indices of tested points
+    :return: bool;
+    """
+    if indices.shape[0] == 0:
+        return True
+    vertices = points[faces[:, 0]]
+    normals = np.cross(points[faces[:, 1]] - vertices, points[faces[:, 2]] - vertices)
+    normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    normals *= np.sign(np.sum(normals * (vertices - np.mean(points, axis=0)), axis=1))[:, np.newaxis]
+    heights = np.einsum('ij,kj->ki', normals, points[indices]) - np.sum(normals * vertices, axis=1)
+    return bool(np.all(heights <= PLANARITY_TOLERANCE * np.max(np.ptp(points, axis=0))))
+
+
+def get_reflex_edges(points, faces, partners):
+    """
+    Returns half-edges where triangulated closed surface is not convex, i.e. vertex of adjacent face lies above
+    the plane of the face.
+
+    :param points: numpy.array; (n, 3) vertices
+    :param faces: numpy.array; (m, 3) vertex indices of faces
+    :param partners: numpy.array; (3m, ) see `get_surface_topology`
+    :return: numpy.array; indices of reflex half-edges
+    """
+    # degenerated faces are reflex as well
+    return np.flatnonzero(~(get_edge_heights(points, faces, partners) <= PLANARITY_TOLERANCE))
+
+
+def flip_edges(faces, partners, half_edges):
+    """
+    Replaces shared edges of pairs of adjacent faces by the other diagonal of the quadrilateral formed by them.
+    Edges sharing a face with previously flipped edge and edges whose other diagonal is already an edge of the
+    surface are skipped.
+
+    :param faces: numpy.array; (m, 3) vertex indices of faces
+    :param partners: numpy.array; (3m, ) see `get_surface_topology`
+    :param half_edges: numpy.array; half-edges to flip
+    :return: numpy.array; (m, 3) new faces
+    """
+    n_vertices = np.max(faces) + 1
+    flat_faces = faces.reshape(-1)
+    edges = np.sort(np.stack([flat_faces, np.roll(faces, -1, axis=1).reshape(-1)], axis=1), axis=1)
+    diagonals = np.sort(np.stack([flat_faces[half_edges - half_edges % 3 + (half_edges % 3 + 2) % 3],
+                                  flat_faces[partners[half_edges] - partners[half_edges] % 3 +
+                                             (partners[half_edges] % 3 + 2) % 3]], axis=1), axis=1)
+    half_edges = half_edges[~np.isin(diagonals[:, 0] * n_vertices + diagonals[:, 1],
+                                     edges[:, 0] * n_vertices + edges[:, 1])]
+
+    faces = faces.copy()
+    flipped = np.zeros(faces.shape[0], dtype=bool)
+    for half_edge in half_edges:
+        face, adjacent = half_edge // 3, partners[half_edge] // 3
+        if flipped[face] or flipped[adjacent]:
+            continue
+        a, b, c = np.roll(faces[face], -(half_edge % 3))
+        d = faces[adjacent][(partners[half_edge] % 3 + 2) % 3]
+        faces[face], faces[adjacent] = (a, d, c), (d, b, c)
+        flipped[[face, adjacent]] = True
+    return faces
+
+
+def canonical_triangulation(points, faces, partners):
+    """
+    Brings convex triangulation of the points to the canonical form. Planar quadrilaterals formed by pairs of
+    adjacent faces are split by the diagonal with the lower vertex indices and faces are sorted, so all convex
+    triangulations of the points yield the same faces. Triangulation of planar regions of more than four points
+    is not unique and it is kept.
+
+    :param points: numpy.array; (n, 3) vertices
+    :param faces: numpy.array; (m, 3) vertex indices of faces of convex closed surface
+    :param partners: numpy.array; (3m, ) see `get_surface_topology`
+    :return: Tuple[numpy.array, bool]; (m, 3) faces and True if triangulation does not contain planar regions of
+                                       more than four points (i.e. faces are unique)
+    """
+    planar = np.abs(get_edge_heights(points, faces, partners)) <= PLANARITY_TOLERANCE
+    planar_per_face = np.bincount(np.flatnonzero(planar) // 3, minlength=faces.shape[0])
+    # each face of planar quadrilateral contains only the diagonal of the quadrilateral
+    quadrilaterals = planar & (planar_per_face[np.arange(partners.shape[0]) // 3] == 1) & \
+        (planar_per_face[partners // 3] == 1)
+    unique = np.array_equal(quadrilaterals, planar)
+
+    half_edges = np.flatnonzero(quadrilaterals & (np.arange(partners.shape[0]) < partners))
+    flat_faces = faces.reshape(-1)
+    diagonal = np.sort(np.stack([flat_faces[half_edges], flat_faces[half_edges - half_edges % 3 +
+                                                                    (half_edges % 3 + 1) % 3]], axis=1), axis=1)
+    other_diagonal = np.sort(np.stack([flat_faces[half_edges - half_edges % 3 + (half_edges % 3 + 2) % 3],
+                                       flat_faces[partners[half_edges] - partners[half_edges] % 3 +
+                                                  (partners[half_edges] % 3 + 2) % 3]], axis=1), axis=1)
+    to_flip = (other_diagonal[:, 0] < diagonal[:, 0]) | \
+        ((other_diagonal[:, 0] == diagonal[:, 0]) & (other_diagonal[:, 1] < diagonal[:, 1]))
+    if np.any(to_flip):
+        faces = flip_edges(faces, partners, half_edges[to_flip])
+
+    faces = np.sort(faces, axis=1)
+    return faces[np.lexsort(faces.T[::-1])], unique
+
+
+def convex_hull_triangulation(points, template_key):
+    """
+    Returns faces of the convex hull of `points` in canonical form (see `canonical_triangulation`). Topology of the
+    triangulation is stored in the buffer under `template_key` and reused for points with the same layout. If the
+    stored triangulation is not convex on the given points, it is repaired by flipping of its reflex edges, so the
+    Delaunay triangulation runs only if layout of the points changes or if the convex hull contains planar regions
+    of more than four points. Faces therefore do not depend on previously triangulated surfaces.
+
+    :param points: numpy.array; (n, 3) points on convex surface
+    :param template_key: Tuple; identifier of the layout of the points
+    :return: numpy.array; (m, 3) vertex indices of faces
+    """
+    template = buffer.SURFACE_TOPOLOGIES.get(template_key)
+    if template is not None and template[2].shape[0] + np.unique(template[0]).shape[0] == points.shape[0]:
+        faces, partners, omitted = template
+        for _ in range(TOPOLOGY_REPAIR_ITERATIONS):
+            reflex_edges = get_reflex_edges(points, faces, partners)
+            if reflex_edges.shape[0] == 0:
+                # convexity of the triangulation does not reveal points omitted by the triangulation outside of it
+                if not is_enclosed(points, faces, omitted):
+                    break
+                canonical_faces, unique = canonical_triangulation(points, faces, partners)
+                if unique:
+                    buffer.store(buffer.SURFACE_TOPOLOGIES, template_key, (faces, partners, omitted))
+                    return canonical_faces
+                break
+            faces = flip_edges(faces, partners, reflex_edges)
+            partners = get_surface_topology(faces)
+            if partners is None:
+                break
+        logger.debug('topology of triangulation changed, running Delaunay triangulation')
+
+    faces = Delaunay(points).convex_hull
+    partners = get_surface_topology(faces)
+    if partners is None:
+        return faces
+    # points inside of the convex hull are not vertices of the triangulation
+    omitted = np.setdiff1d(np.arange(points.shape[0]), faces)
+    buffer.store(buffer.SURFACE_TOPOLOGIES, template_key, (faces, partners, omitted))
+    buffer.reduce_buffer(buffer.SURFACE_TOPOLOGIES, max_storage=buffer.SURFACE_TOPOLOGIES_MAX_STORAGE)
+    return canonical_triangulation(points, faces, partners)[0]
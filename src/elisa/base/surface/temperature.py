@@ -66,10 +66,10 @@ def renormalize_temperatures(star):
 
     coefficient = up.power(desired_flux_value / current_flux, 0.25)
     logger.debug(f'surface temperature map renormalized by a factor {coefficient}')
-    star.temperatures *= coefficient
+    star.temperatures = star.temperatures * coefficient
     if star.spots:
         for spot_index, spot in star.spots.items():
-            spot.temperatures *= coefficient
+            spot.temperatures = spot.temperatures * coefficient
 
 
 def interpolate_bolometric_gravity_darkening(temperature):
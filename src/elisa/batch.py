@@ -0,0 +1,251 @@
+import signal
+import threading
+import numpy as np
+import pandas as pd
+
+from multiprocessing.pool import Pool
+
+from . import settings
+from . binary_system.system import BinarySystem
+from . observer.observer import Observer
+from . logger import getLogger
+from . import units as u
+
+logger = getLogger('batch')
+
+# worker-level observers keyed by passband tuple, kept alive between systems evaluated within the same process
+# (in case of serial evaluation, they are released once the batch is finished)
+_OBSERVERS = dict()
+
+
+class BatchTimeoutError(TimeoutError):
+    pass
+
+
+def flat_to_nested(definition):
+    """
+    Converts flat binary system definition in form {'component@parameter': value, } (e.g. row of the table)
+    to the nested JSON format accepted by `BinarySystem.from_json`. Nested definitions are returned untouched.
+
+    :param definition: Dict;
+    :return: Dict;
+    """
+    if not any('@' in key for key in definition.keys()):
+        return definition
+
+    nested = {"system": dict(), "primary": dict(), "secondary": dict()}
+    for key, value in definition.items():
+        if '@' not in key:
+            continue
+        # missing values in tables are represented as NaN
+        if isinstance(value, float) and np.isnan(value):
+            continue
+        component, param = key.split('@', 1)
+        nested[component][param] = value
+    return nested
+
+
+def _iter_definitions(systems):
+    """
+    Unified iteration over table (pandas.DataFrame) or iterable of binary system definitions.
+
+    :param systems: Union[pandas.DataFrame, Iterable[Dict]];
+    :return: Generator[Dict];
+    """
+    if isinstance(systems, pd.DataFrame):
+        systems = (row.to_dict() for _, row in systems.iterrows())
+    for definition in systems:
+        yield flat_to_nested(definition)
+
+
+def _get_observer(passband):
+    """
+    Returns cached worker-level Observer instance for given set of passbands.
+
+    :param passband: Tuple[str];
+    :return: elisa.observer.observer.Observer;
+    """
+    if passband not in _OBSERVERS:
+        _OBSERVERS[passband] = Observer(passband=list(passband), system=None)
+    return _OBSERVERS[passband]
+
+
+def _timeout_handler(signum, frame):
+    raise BatchTimeoutError("Evaluation of the binary system exceeded the time limit.")
+
+
+def init_worker(config=None):
+    """
+    Initializer of the batch worker processes. Curves of each system are computed in a single process to avoid
+    nested pools inside daemonic workers.
+
+    :param config: Dict; settings applied in each worker
+    """
+    config = dict() if config is None else config
+    settings.configure(**{**config, **dict(NUMBER_OF_PROCESSES=1)})
+
+
+def evaluate(definition, observation):
+    """
+    Computes synthetic observations of a single binary system.
+
+    :param definition: Dict; binary system definition in format accepted by `BinarySystem.from_json`
+    :param observation: Dict;
+    :**observation options**:
+        * ** passband ** * - Tuple[str]; passbands of light curves
+        * ** phases ** * - numpy.array; photometric phases
+        * ** lc ** * - bool; compute light curves
+        * ** rv ** * - bool; compute radial velocities
+        * ** normalize ** * - bool; normalize light curves
+        * ** rv_method ** * - str; `kinematic` or `radiometric`
+
+    :return: Dict[str, numpy.array]; curves in flat format {'lc@passband': flux, 'rv@component': rv, }
+    """
+    binary = BinarySystem.from_json(definition)
+    observer = _get_observer(tuple(observation['passband']))
+    observer._system = binary
+    observer.system_cls = BinarySystem
+
+    retval = dict()
+    if observation.get('lc', True):
+        normalize = observation.get('normalize', False)
+        # observer is shared between systems, flux unit has to be set explicitly on each call
+        flux_unit = None if normalize else u.W / u.m ** 2
+        _, fluxes = observer.lc(phases=observation['phases'], normalize=normalize, flux_unit=flux_unit)
+        retval.update({f'lc@{band}': np.asarray(flux) for band, flux in fluxes.items()})
+    if observation.get('rv', False):
+        _, rvs = observer.rv(phases=observation['phases'], method=observation.get('rv_method'))
+        retval.update({f'rv@{component}': np.asarray(rv) for component, rv in rvs.items()})
+    return retval
+
+
+def _evaluate_task(args):
+    """
+    Evaluates one system within time limit and captures errors, so a single invalid system will not stop the batch.
+
+    :param args: Tuple; (index, definition, observation, timeout)
+    :return: Tuple[int, str, Union[Dict, str]]; (index, status, curves or error message)
+    """
+    idx, definition, observation, timeout = args
+    # signals can be handled only in the main thread
+    use_alarm = timeout is not None and hasattr(signal, 'SIGALRM') and \
+        threading.current_thread() is threading.main_thread()
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _timeout_handler)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return idx, 'ok', evaluate(definition, observation)
+    except BatchTimeoutError as e:
+        return idx, 'timeout', str(e)
+    except Exception as e:
+        return idx, 'error', f'{type(e).__name__}: {e}'
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+def iter_batch(systems, observation, n_processes=None, timeout=None, chunksize=1, config=None, skip=None,
+               ordered=True):
+    """
+    Lazily evaluates synthetic observations of many binary systems using a pool of worker processes.
+    Results are yielded in the order of the input systems unless `ordered` is False, in which case they are yielded
+    as soon as they are available.
+
+    :param systems: Union[pandas.DataFrame, Iterable[Dict]]; binary system definitions
+    :param observation: Dict; see `evaluate`
+    :param n_processes: int; number of worker processes, default is `settings.NUMBER_OF_PROCESSES`
+    :param timeout: float; time limit in seconds for evaluation of each system (POSIX only)
+    :param chunksize: int; number of systems sent to the worker at once
+    :param config: Dict; settings applied in each worker
+    :param skip: Container[int]; indices of systems which will not be evaluated
+    :param ordered: bool; yield results in the order of the input systems
+    :return: Generator[Tuple[int, str, Union[Dict, str]]]; (index, status, curves or error message)
+    """
+    n_processes = settings.NUMBER_OF_PROCESSES if n_processes is None else n_processes
+    skip = set() if skip is None else skip
+    observation = dict(observation, phases=np.asarray(observation['phases']),
+                       passband=tuple(str(band) for band in np.atleast_1d(observation.get('passband', 'bolometric'))))
+    tasks = ((idx, definition, observation, timeout) for idx, definition in enumerate(_iter_definitions(systems))
+             if idx not in skip)
+
+    if n_processes > 1:
+        logger.info(f"starting {n_processes} batch workers")
+        with Pool(processes=n_processes, initializer=init_worker, initargs=(config, )) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            for result in imap(_evaluate_task, tasks, chunksize=chunksize):
+                yield result
+    else:
+        config = dict() if config is None else config
+        try:
+            for task in tasks:
+                # settings of the caller are changed only for the evaluation itself
+                with settings.context(**config):
+                    result = _evaluate_task(task)
+                yield result
+        finally:
+            # observers must not keep the last evaluated system alive in the caller's process
+            _OBSERVERS.clear()
+
+
+def compute_batch(systems, passband='bolometric', phases=None, lc=True, rv=False, normalize=False, rv_method=None,
+                  n_processes=None, timeout=None, chunksize=1, config=None, output=None):
+    """
+    Computes light curves and/or radial velocity curves of many binary systems at common phases (e.g. synthetic
+    training sets). Systems are distributed among worker processes which keep their atmosphere and limb darkening
+    buffers warm across the systems they evaluate.
+    ::
+
+        from elisa import batch
+
+        results = batch.compute_batch(definitions, passband=['Generic.Bessell.V'], phases=np.linspace(0, 1, 100),
+                                      n_processes=4, timeout=60, output='population.npz')
+
+    :param systems: Union[pandas.DataFrame, Iterable[Dict]]; binary system definitions in JSON format accepted by
+                    `BinarySystem.from_json` or table (flat dictionaries) with columns in `component@parameter` format
+    :param passband: Union[str, Iterable[str]]; passbands of light curves
+    :param phases: numpy.array; photometric phases
+    :param lc: bool; compute light curves
+    :param rv: bool; compute radial velocity curves
+    :param normalize: bool; normalize light curves
+    :param rv_method: str; `kinematic` or `radiometric`, default is `settings.RV_METHOD`
+    :param n_processes: int; number of worker processes, default is `settings.NUMBER_OF_PROCESSES`
+    :param timeout: float; time limit in seconds for evaluation of each system (POSIX only)
+    :param chunksize: int; number of systems sent to the worker at once
+    :param config: Dict; settings applied in each worker
+    :param output: str; path to `.npz` file where columnar results will be stored
+    :return: Dict[str, numpy.array]; columns `index`, `status`, `error`, `phases` and curves
+                                     {'lc@passband': (n_systems, n_phases), 'rv@component': (n_systems, n_phases)}
+    """
+    if phases is None:
+        raise ValueError('Missing argument `phases`.')
+    phases = np.asarray(phases)
+    passband = tuple(str(band) for band in np.atleast_1d(passband))
+    observation = dict(passband=passband, phases=phases, lc=lc, rv=rv, normalize=normalize, rv_method=rv_method)
+
+    labels = [f'lc@{band}' for band in passband] if lc else list()
+    labels += [f'rv@{component}' for component in settings.BINARY_COUNTERPARTS] if rv else list()
+
+    status, errors, curves = list(), list(), {label: list() for label in labels}
+    nan_curve = np.full(phases.shape, np.nan)
+    for idx, state, result in iter_batch(systems, observation, n_processes, timeout, chunksize, config):
+        status.append(state)
+        errors.append('' if state == 'ok' else result)
+        for label in labels:
+            curves[label].append(result[label] if state == 'ok' else nan_curve)
+
+    n_failed = len(status) - status.count('ok')
+    if n_failed > 0:
+        logger.warning(f'evaluation of {n_failed} out of {len(status)} systems failed')
+
+    retval = dict(
+        index=np.arange(len(status)),
+        status=np.array(status, dtype=str),
+        error=np.array(errors, dtype=str),
+        phases=phases,
+        **{label: np.array(vals).reshape(-1, phases.shape[0]) for label, vals in curves.items()}
+    )
+
+    if output is not None:
+        np.savez_compressed(output, **retval)
+    return retval
@@ -1,6 +1,7 @@
 import numpy as np
 
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from . surface import (
     mesh,
     faces,
@@ -9,7 +10,7 @@ from . surface import (
     pulsations
 )
 from .. logger import getLogger
-from .. import utils
+from .. import utils, settings
 from .. base.container import (
     StarContainer,
     PositionContainer
@@ -106,10 +107,6 @@ class OrbitalPositionContainer(PositionContainer):
         secondary.assign_radii(radii['secondary'])
         return cls(primary, secondary, position, **binary_system.properties_serializer())
 
-    def copy(self):
-        """Returns a deep copy of the OrbitalPositionContainer."""
-        return deepcopy(self)
-
     def has_spots(self):
         """Returns True if at least one component contains spots."""
         return self.primary.has_spots() or self.secondary.has_spots()
@@ -141,8 +138,11 @@ class OrbitalPositionContainer(PositionContainer):
         """
 
         components_distance = self._components_distance(components_distance)
-        self.build_mesh(components_distance, component)
-        self.build_from_points(components_distance, component)
+        if settings.USE_CONCURRENT_COMPONENT_BUILD and component in ["all", "both"]:
+            self.build_components_concurrently(components_distance)
+        else:
+            self.build_mesh(components_distance, component)
+            self.build_from_points(components_distance, component)
 
         # flatt it: from this point we do not require separated information about spots
         self.flat_it()
@@ -150,6 +150,37 @@ class OrbitalPositionContainer(PositionContainer):
             self.build_pulsations(components_distance=components_distance, component=component)
         return self
 
+    def build_components_concurrently(self, components_distance=None):
+        """
+        Builds surfaces of both components up to their temperature distributions in separate threads. Components are
+        synchronized only before the calculation of the reflection effect. Settings overridden in the current context
+        (see `settings.context`) apply in both threads.
+
+        :param components_distance: Union[None, float]; distance of components is SMA units.
+                                                        If None, OrbitalPositionContainer.position.distance is used
+        :return: OrbitalPositionContainer;
+        """
+        components_distance = self._components_distance(components_distance)
+        with ThreadPoolExecutor(max_workers=len(settings.BINARY_COUNTERPARTS)) as executor:
+            futures = [executor.submit(copy_context().run, self._build_component, components_distance, component)
+                       for component in settings.BINARY_COUNTERPARTS]
+            for future in futures:
+                future.result()
+
+        logger.debug(f'calculating reflection effect with {settings.REFLECTION_EFFECT_ITERATIONS} iterations.')
+        temperature.apply_reflection_effect(self, components_distance, settings.REFLECTION_EFFECT_ITERATIONS)
+        return self
+
+    def _build_component(self, components_distance, component):
+        """
+        Builds surface of a single component without the reflection effect.
+
+        :param components_distance: float; distance of components is SMA units
+        :param component: str; `primary` or `secondary`
+        """
+        self.build_mesh(components_distance, component)
+        self.build_from_points(components_distance, component)
+
     def build_pulsations(self, components_distance=None, component="all"):
         """
         Incorporating user-defined pulsation modes into the model.
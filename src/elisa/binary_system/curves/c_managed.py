@@ -3,6 +3,11 @@ from copy import copy
 
 from . import utils as crv_utils
 from .. surface.mesh import add_spots_to_mesh
+from .. surface.temperature import (
+    apply_reflection_effect,
+    get_face_directions,
+    get_rigid_spot_temperature_factors
+)
 from .. import (
     utils as bsutils,
     dynamic
@@ -11,6 +16,7 @@ from .. container import OrbitalPositionContainer
 from .. surface.coverage import compute_surface_coverage
 from .. orbit.container import OrbitalSupplements
 from ... import utils, const
+from ... base.surface.temperature import renormalize_temperatures
 from ... import settings
 
 
@@ -146,6 +152,75 @@ def produce_circ_spotty_async_curves_mp(*args):
     return curves
 
 
+def produce_circ_spotty_async_rigid_curves_mp(*args):
+    """
+    Curve generator function for circular asynchronous spotty systems where spots are rigidly rotated over
+    the stationary surface of the components (see `settings.USE_RIGID_SPOT_ROTATION`). Faces covered by spots
+    in given phase are resolved from the spot longitudes, surface is not rebuilt.
+
+    :param args: Tuple;
+
+    ::
+
+        Tuple[
+                binary: elisa.binary_system.BinarySystem,
+                initial_system: elisa.binary_system.container.OrbitalPositionContainer, spot-free system container
+                with built geometry and temperatures without reflection effect
+                motion_batch: List; orbital positions at which to calculate curves,
+                ecl_boundaries: boundaries for both eclipses
+                crv_labels: List;
+                curves_fn: function to calculate curve points at given orbital positions,
+                kwargs: Dict,
+            ]
+
+    :return: Dict;
+    """
+    binary, initial_system, motion_batch, ecl_boundaries, crv_labels, curve_fn, kwargs = args
+
+    # pre-calculate the longitudes of each spot for each phase
+    phases = np.array([val.phase for val in motion_batch])
+    in_eclipse = dynamic.in_eclipse_test([position.azimuth for position in motion_batch], ecl_boundaries)
+    spots_longitudes = dynamic.calculate_spot_longitudes(binary, phases, component="all", correct_libration=False)
+    pulsation_tests = {'primary': False, 'secondary': False}
+    primary_reducer, secondary_reducer = \
+        dynamic.resolve_spots_geometry_update(spots_longitudes, len(phases), pulsation_tests)
+    combined_reducer = primary_reducer | secondary_reducer
+
+    face_directions = {component: get_face_directions(initial_system, component, 1.0)
+                       for component in settings.BINARY_COUNTERPARTS}
+
+    curves = {key: np.empty(len(motion_batch)) for key in crv_labels}
+    spotty_system, normal_radiance, ld_cfs = None, None, None
+    for pos_idx, orbital_position in enumerate(motion_batch):
+        # temperatures are re-evaluated only if spots moved
+        if combined_reducer[pos_idx]:
+            spotty_system = initial_system.copy()
+            for component in settings.BINARY_COUNTERPARTS:
+                star = getattr(spotty_system, component)
+                longitudes = {spot_index: longitude[pos_idx]
+                              for spot_index, longitude in spots_longitudes[component].items()}
+                star.temperatures = star.temperatures * get_rigid_spot_temperature_factors(
+                    face_directions[component], getattr(binary, component).spots, longitudes
+                )
+                renormalize_temperatures(star)
+            apply_reflection_effect(spotty_system, 1.0, settings.REFLECTION_EFFECT_ITERATIONS, use_symmetry=False)
+
+        spotty_system.set_on_position_params(position=orbital_position)
+        spotty_system.time = spotty_system.set_time()
+        on_pos = bsutils.move_sys_onpos(spotty_system, orbital_position, on_copy=True)
+
+        # if spots did not move, use previously computed radiances and limbdarkening
+        on_pos, normal_radiance, ld_cfs = \
+            crv_utils.update_surface_params(combined_reducer[pos_idx], on_pos, normal_radiance, ld_cfs, **kwargs)
+
+        _kwargs = dict(in_eclipse=in_eclipse[pos_idx], return_values=False, write_to_containers=True)
+        compute_surface_coverage(on_pos, binary.semi_major_axis, **_kwargs)
+
+        curves = curve_fn(curves, pos_idx, crv_labels, on_pos)
+
+    return curves
+
+
 def produce_circ_pulsating_curves_mp(*args):
     """
     Curve generator function for circular pulsating systems.
@@ -362,7 +437,7 @@ def integrate_eccentric_curve_w_orbital_symmetry(*args):
         else:
             # orbital velocities are not symmetrical along apsidal lines
             d_distance = mirror_orb_pos.distance - base_orb_pos.distance
-            initial_system.secondary.points[:, 0] += d_distance
+            initial_system.secondary.points = initial_system.secondary.points + np.array([d_distance, 0.0, 0.0])
             _kwargs = dict(recalculate_velocities=True, on_copy=True)
             on_pos_mirror = bsutils.move_sys_onpos(initial_system, mirror_orb_pos, **_kwargs)
             _kwargs = dict(in_eclipse=True, return_values=False, write_to_containers=True)
@@ -24,7 +24,7 @@ def resolve_curve_method(system, curve: str):
     """
     Resolves which curve calculating method to use based on the properties of the BinarySystem.
 
-    :param curve: str; choose one of `lc` or `rv`
+    :param curve: str; choose one of `lc`, `rv` or `lc_rv` (joint light curves and radiometric radial velocities)
     :param system: elisa.binary_system.BinarySystem;
     :return: callable, curve calculating method
     """
@@ -44,8 +44,16 @@ def resolve_curve_method(system, curve: str):
             getattr(system, '_compute_eccentric_spotty_rv_curve'),
             getattr(system, '_compute_eccentric_rv_curve_no_spots')
         )
+    elif curve == 'lc_rv':
+        fn_array = (
+            getattr(system, '_compute_circular_synchronous_lc_rv_curve'),
+            getattr(system, '_compute_circular_spotty_asynchronous_lc_rv_curve'),
+            getattr(system, '_compute_circular_pulsating_lc_rv_curve'),
+            getattr(system, '_compute_eccentric_spotty_lc_rv_curve'),
+            getattr(system, '_compute_eccentric_lc_rv_curve_no_spots')
+        )
     else:
-        raise ValueError('Invalid value of argument `curve`. Only `lc` and `rv` are allowed')
+        raise ValueError('Invalid value of argument `curve`. Only `lc`, `rv` and `lc_rv` are allowed')
 
     is_circular = system.eccentricity == 0
     is_eccentric = 1 > system.eccentricity > 0
@@ -91,6 +99,35 @@ def prep_initial_system(binary, **kwargs):
     return initial_system
 
 
+def prep_rigid_spotty_system(binary):
+    """
+    Prepares spot-free base system with stationary surface over which the spots are rigidly rotated in case of
+    circular asynchronous binaries. Surface of each component is discretized with the finest discretization factor
+    of the component and its spots. Temperatures are calculated without reflection effect, since it depends on
+    the current position of spots. Surface symmetries are not utilized for temperature dependent quantities.
+
+    :param binary: elisa.binary_system.system.BinarySystem
+    :return: elisa.binary_system.container.OrbitalPositionContainer
+    """
+    from_this = dict(binary_system=binary, position=const.Position(0, 1.0, 0.0, 0.0, 0.0))
+    initial_system = OrbitalPositionContainer.from_binary_system(**from_this)
+    for component in settings.BINARY_COUNTERPARTS:
+        star = getattr(initial_system, component)
+        spot_alphas = [spot.discretization_factor for spot in star.spots.values()]
+        star.discretization_factor = min([star.discretization_factor] + spot_alphas)
+        star.spots = dict()
+
+    initial_system.build_mesh(components_distance=1.0)
+    initial_system.build_faces_and_kinematic_quantities(components_distance=1.0)
+    for component in settings.BINARY_COUNTERPARTS:
+        initial_system.build_temperature_distribution(components_distance=1.0, component=component)
+        # temperatures of rigidly rotated spots are not symmetrical, surface symmetries are not utilized further
+        star = getattr(initial_system, component)
+        star.base_symmetry_faces_number = star.faces.shape[0]
+        star.face_symmetry_vector = np.arange(star.faces.shape[0])
+    return initial_system
+
+
 def produce_circular_sync_curves(binary, initial_system, phases, curve_fn, crv_labels, **kwargs):
     """
     Auxiliary function to produce curve from circular synchronous binary system.
@@ -112,6 +149,8 @@ def produce_circular_sync_curves(binary, initial_system, phases, curve_fn, crv_l
     """
 
     crv_utils.prep_surface_params(initial_system, return_values=False, write_to_containers=True, **kwargs)
+    # shape of the components is constant, eclipse outlines are derived from the same convex hulls in each phase
+    surface.coverage.prepare_eclipse_outlines(initial_system)
     fn = c_managed.produce_circ_sync_curves_mp
     fn_args = (binary, initial_system, crv_labels, curve_fn)
     return manage_observations(fn=fn, fn_args=fn_args, position=phases, **kwargs)
@@ -137,6 +176,15 @@ def produce_circular_spotty_async_curves(binary, curve_fn, crv_labels, **kwargs)
     orbital_motion = position_method(input_argument=phases, return_nparray=False, calculate_from='phase')
     ecl_boundaries = dynamic.get_eclipse_boundaries(binary, 1.0)
 
+    if settings.USE_RIGID_SPOT_ROTATION and not binary.has_pulsations():
+        logger.debug('spots are rigidly rotated over the stationary surface of the components')
+        initial_system = prep_rigid_spotty_system(binary)
+        # shape of the components is constant, eclipse outlines are derived from the same convex hulls in each phase
+        surface.coverage.prepare_eclipse_outlines(initial_system)
+        fn_args = binary, initial_system, ecl_boundaries, crv_labels, curve_fn
+        fn = c_managed.produce_circ_spotty_async_rigid_curves_mp
+        return manage_observations(fn=fn, fn_args=fn_args, position=orbital_motion, **kwargs)
+
     from_this = dict(binary_system=binary, position=const.Position(0, 1.0, 0.0, 0.0, 0.0))
     initial_system = OrbitalPositionContainer.from_binary_system(**from_this)
 
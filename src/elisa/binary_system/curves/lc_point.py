@@ -1,4 +1,5 @@
 from ... base.curves import utils as crv_utils
+from ... base.curves import rv_point
 from ... import settings
 
 
@@ -32,3 +33,20 @@ def compute_lc_on_pos(band_curves, pos_idx, passbands, system):
     for band in passbands:
         band_curves[band][pos_idx] = _calculate_lc_point(band, system)
     return band_curves
+
+
+def compute_lc_rv_on_pos(curves, pos_idx, crv_labels, system):
+    """
+    Calculates lc points and radiometric rv points for given orbital position at once.
+
+    :param curves: Dict; {str; passband or component : numpy.array; light curve or rvs, ...} result will be written
+                         to the corresponding `pos_idx` position
+    :param pos_idx: int; position in `curves` to which calculated points will be assigned
+    :param crv_labels: List; list of passbands and components
+    :param system: elisa.binary_system.container.OrbitalPositionContainer;
+    :return: Dict; updated {str; passband or component : numpy.array; light curve or rvs, ...}
+    """
+    passbands = [label for label in crv_labels if label not in settings.BINARY_COUNTERPARTS]
+    components = [label for label in crv_labels if label in settings.BINARY_COUNTERPARTS]
+    curves = compute_lc_on_pos(curves, pos_idx, passbands, system)
+    return rv_point.compute_rv_at_pos(curves, pos_idx, components, system)
@@ -0,0 +1,112 @@
+from . import (
+    lc_point,
+    c_router
+)
+from ... import settings
+
+
+def _lc_rv_labels(passband):
+    """
+    Labels of jointly calculated curves, light curves in each passband followed by radial velocities of components.
+
+    :param passband: Dict[str, elisa.observer.PassbandContainer]; passbands including `rv_band`
+    :return: List[str];
+    """
+    return [band for band in passband.keys() if band != 'rv_band'] + list(settings.BINARY_COUNTERPARTS.keys())
+
+
+def compute_circular_synchronous_lc_rv_curve(binary, **kwargs):
+    """
+    Compute light curves and radiometric radial velocity curves for synchronous circular binary system in a single pass.
+    In contrast to the light curve, the symmetry of the phase curve is not utilized since the radial velocities are
+    not symmetrical.
+
+    :param binary: elisa.binary_system.system.BinarySystem;
+    :param kwargs: Dict;
+    :**kwargs options**:
+        * ** passband ** * - Dict[str, elisa.observer.PassbandContainer]; including `rv_band`
+        * ** left_bandwidth ** * - float
+        * ** right_bandwidth ** * - float
+        * ** position_method** * - function definition; to evaluate orbital positions
+        * ** phases ** * - numpy.array
+
+    :return: Dict[str, numpy.array]; {`passband`: fluxes, `component`: radial velocities}
+    """
+    initial_system = c_router.prep_initial_system(binary)
+    crv_labels = _lc_rv_labels(kwargs["passband"])
+    args = (binary, initial_system, kwargs.pop("phases"), lc_point.compute_lc_rv_on_pos, crv_labels)
+    return c_router.produce_circular_sync_curves(*args, **kwargs)
+
+
+def compute_circular_spotty_asynchronous_lc_rv_curve(binary, **kwargs):
+    """
+    Function returns light curves and radiometric radial velocity curves of asynchronous systems with circular orbits
+    and spots.
+
+    :param binary: elisa.binary_system.system.BinarySystem;
+    :param kwargs: Dict;
+    :**kwargs options**:
+        * ** passband ** - Dict[str, elisa.observer.PassbandContainer]; including `rv_band`
+        * ** left_bandwidth ** - float
+        * ** right_bandwidth ** - float
+
+    :return: Dict; fluxes for each filter and rv for each component
+    """
+    crv_labels = _lc_rv_labels(kwargs["passband"])
+    return c_router.produce_circular_spotty_async_curves(binary, lc_point.compute_lc_rv_on_pos, crv_labels, **kwargs)
+
+
+def compute_circular_pulsating_lc_rv_curve(binary, **kwargs):
+    """
+    Function returns light curves and radiometric radial velocity curves of pulsating systems with circular orbits.
+
+    :param binary: elisa.binary_system.system.BinarySystem;
+    :param kwargs: Dict;
+    :**kwargs options**:
+        * ** passband ** - Dict[str, elisa.observer.PassbandContainer]; including `rv_band`
+        * ** left_bandwidth ** - float
+        * ** right_bandwidth ** - float
+        * ** phases ** * - numpy.array
+
+    :return: Dict; fluxes for each filter and rv for each component
+    """
+    initial_system = c_router.prep_initial_system(binary, **dict(build_pulsations=False))
+    crv_labels = _lc_rv_labels(kwargs["passband"])
+    args = (binary, initial_system, kwargs.pop("phases"), lc_point.compute_lc_rv_on_pos, crv_labels)
+    return c_router.produce_circular_pulsating_curves(*args, **kwargs)
+
+
+def compute_eccentric_lc_rv_curve_no_spots(binary, **kwargs):
+    """
+    General function for generating light curves and radiometric radial velocity curves of binaries with eccentric
+    orbit and no spots.
+
+    :param binary: elisa.binary_system.system.BinarySystem;
+    :param kwargs: Dict;
+    :**kwargs options**:
+        * ** passband ** - Dict[str, elisa.observer.PassbandContainer]; including `rv_band`
+        * ** left_bandwidth ** - float
+        * ** right_bandwidth ** - float
+
+    :return: Dict; fluxes for each filter and rv for each component
+    """
+    crv_labels = _lc_rv_labels(kwargs["passband"])
+    return c_router.produce_ecc_curves_no_spots(binary, lc_point.compute_lc_rv_on_pos, crv_labels, **kwargs)
+
+
+def compute_eccentric_spotty_lc_rv_curve(binary, **kwargs):
+    """
+    General function for generating light curves and radiometric radial velocity curves of binaries with eccentric
+    orbit and spots.
+
+    :param binary: elisa.binary_system.system.BinarySystem;
+    :param kwargs: Dict;
+    :**kwargs options**:
+        * ** passband ** - Dict[str, elisa.observer.PassbandContainer]; including `rv_band`
+        * ** left_bandwidth ** - float
+        * ** right_bandwidth ** - float
+
+    :return: Dict; fluxes for each filter and rv for each component
+    """
+    crv_labels = _lc_rv_labels(kwargs["passband"])
+    return c_router.produce_ecc_curves_with_spots(binary, lc_point.compute_lc_rv_on_pos, crv_labels, **kwargs)
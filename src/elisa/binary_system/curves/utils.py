@@ -5,7 +5,7 @@ from ... import atm, const
 from ... import settings
 from ... observer.passband import init_bolometric_passband
 from ... binary_system import radius as bsradius
-from ... base.curves.utils import get_component_limbdarkening_cfs
+from ... base.curves.utils import get_component_limbdarkening_cfs, cast_surface_params
 
 
 def get_limbdarkening_cfs(system, component="all", **kwargs):
@@ -123,6 +123,7 @@ def prep_surface_params(system, return_values=True, write_to_containers=False, *
         bol_ld_cfs = get_limbdarkening_cfs(system, **bol_kwargs)
 
     normal_radiance = atm.correct_normal_radiance_to_optical_depth(normal_radiance, bol_ld_cfs)
+    normal_radiance, ld_cfs = cast_surface_params(normal_radiance, ld_cfs)
 
     if write_to_containers:
         for component in settings.BINARY_COUNTERPARTS:
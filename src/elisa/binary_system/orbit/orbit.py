@@ -6,6 +6,7 @@ from ... import (
     umpy as up
 )
 from ... logger import getLogger
+from ... base.error import MaxIterationError
 from ... binary_system.orbit.transform import OrbitProperties
 from ... base.orbit.orbit import AbstractOrbit
 
@@ -123,6 +124,35 @@ def component_distance_from_mean_anomaly(eccentricity, true_anomaly):
     return (1.0 - up.power(eccentricity, 2)) / (1.0 + eccentricity * up.cos(true_anomaly))
 
 
+def solve_kepler_equation(mean_anomaly, eccentricity, tol=1e-12, maxiter=50):
+    """
+    Solves Kepler equation `M = E - e * sin(E)` for eccentric anomaly `E` on the whole array of mean anomalies at
+    once. Halley iterations start from the Danby initial guess `E_0 = M + 0.85 * e * sign(sin(M))` which converges
+    within a few steps for all eccentricities of bound orbits.
+
+    :param mean_anomaly: Union[numpy.array, float];
+    :param eccentricity: float;
+    :param tol: float; absolute tolerance of eccentric anomaly
+    :param maxiter: int; maximum number of iterations
+    :return: Union[numpy.array, float]; eccentric anomaly in interval [0, 2pi)
+    """
+    mean_anomaly = np.mod(mean_anomaly, const.FULL_ARC)
+    if eccentricity == 0.0:
+        return mean_anomaly
+
+    eccentric_anomaly = mean_anomaly + 0.85 * eccentricity * np.sign(up.sin(mean_anomaly))
+    for _ in range(maxiter):
+        e_sin, e_cos = eccentricity * up.sin(eccentric_anomaly), eccentricity * up.cos(eccentric_anomaly)
+        fn = eccentric_anomaly - e_sin - mean_anomaly
+        d_fn = 1.0 - e_cos
+        # Halley's step, second derivative of Kepler equation is `e * sin(E)`
+        step = fn / (d_fn - 0.5 * fn * e_sin / d_fn)
+        eccentric_anomaly = eccentric_anomaly - step
+        if np.all(up.abs(step) <= tol):
+            return np.mod(eccentric_anomaly, const.FULL_ARC)
+    raise MaxIterationError(f"Kepler equation solver exceeded max iteration limit - {maxiter}")
+
+
 def get_approx_ecl_angular_width(forward_radius1, forward_radius2, components_distance, inclination):
     """
     Returns angular width of the eclipse assuming spherical components.
@@ -229,7 +259,7 @@ class Orbit(AbstractOrbit):
 
     def mean_anomaly_fn(self, eccentric_anomaly: float, *args) -> float:
         """
-        Definition of Kepler equation for scipy _solver in Orbit.eccentric_anomaly.
+        Definition of Kepler equation.
 
         :param eccentric_anomaly: float;
         :param args: Tuple; (mean_anomaly, )
@@ -238,26 +268,14 @@ class Orbit(AbstractOrbit):
         mean_anomaly, = args
         return eccentric_anomaly - self.eccentricity * up.sin(eccentric_anomaly) - mean_anomaly
 
-    def mean_anomaly_to_eccentric_anomaly(self, mean_anomaly: float) -> float:
+    def mean_anomaly_to_eccentric_anomaly(self, mean_anomaly):
         """
         Solves Kepler equation for eccentric anomaly via mean anomaly.
 
-        :param mean_anomaly: float;
-        :return: float;
+        :param mean_anomaly: Union[numpy.array, float];
+        :return: Union[numpy.array, float];
         """
-        import scipy.optimize
-        try:
-            solution = scipy.optimize.newton(self.mean_anomaly_fn, 1.0, args=(mean_anomaly, ), tol=1e-10)
-            if not up.isnan(solution):
-                if solution < 0:
-                    solution += const.FULL_ARC
-                return solution
-            else:
-                return False
-        except Exception as e:
-            logger.debug(f"solver scipy.optimize.newton in function Orbit.eccentric_anomaly did not provide "
-                         f"solution.\n Reason: {e}")
-            return False
+        return solve_kepler_equation(mean_anomaly, self.eccentricity)
 
     def eccentric_anomaly_to_mean_anomaly(self, eccentric_anomaly):
         """
@@ -350,8 +368,7 @@ class Orbit(AbstractOrbit):
         true_phase = self.true_phase(phase=phase, phase_shift=self.conjunctions['primary_eclipse']['true_phase'])
 
         mean_anomaly = self.phase_to_mean_anomaly(phase=true_phase)
-        eccentric_anomaly = np.array([self.mean_anomaly_to_eccentric_anomaly(mean_anomaly=xx)
-                                      for xx in mean_anomaly])
+        eccentric_anomaly = self.mean_anomaly_to_eccentric_anomaly(mean_anomaly=mean_anomaly)
         true_anomaly = self.eccentric_anomaly_to_true_anomaly(eccentric_anomaly=eccentric_anomaly)
         distance = self.relative_radius(true_anomaly=true_anomaly)
         azimut_angle = self.true_anomaly_to_azimuth(true_anomaly=true_anomaly)
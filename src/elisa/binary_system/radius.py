@@ -3,9 +3,82 @@ import numpy as np
 from . import model
 from .. import (
     const,
+    settings,
     umpy as up
 )
+from .. base.error import MaxIterationError
+from .. buffer import buffer
 from .. opt.fsolver import fsolve
+from .. opt.newton import newton
+
+# number of stored solutions of each solved direction or surface used as initial guesses for other components
+# distances and surface potentials
+MAX_SOLVER_SEEDS = 10
+# maximal size of stored solutions of each solved direction or surface in bytes
+MAX_SOLVER_SEEDS_SIZE = 2 ** 20
+# warm-started solutions deviating from their initial guess more than this fraction are solved from scratch
+MAX_SEED_DEVIATION = 0.1
+
+
+def get_solver_seed(key, components_distance, surface_potential):
+    """
+    Returns stored solution of radius solver with the closest components distance and surface potential.
+    Solutions warm-started from the seed agree with solutions obtained from scratch to the relative tolerance of
+    the solver (1e-10).
+
+    :param key: Tuple; identifier of the solved direction or surface
+    :param components_distance: float;
+    :param surface_potential: float;
+    :return: Union[float, numpy.array, None]; stored solution, None if there is no solution stored under `key`
+    """
+    seeds = buffer.SOLVER_SEEDS.get(key)
+    if not seeds:
+        return None
+    distances, potentials = np.array([seed[:2] for seed in seeds]).T
+    proximity = up.abs(distances / components_distance - 1.0) + up.abs(potentials / surface_potential - 1.0)
+    return seeds[np.argmin(proximity)][2]
+
+
+def store_solver_seed(key, components_distance, surface_potential, solution):
+    """
+    Stores solution of radius solver to be used as initial guess in subsequent solutions under the same `key`.
+    The oldest solutions stored under `key` are dropped if there are more than `MAX_SOLVER_SEEDS` of them or
+    if their size exceeds `MAX_SOLVER_SEEDS_SIZE` (the latest solution is always kept).
+
+    :param key: Tuple; identifier of the solved direction or surface
+    :param components_distance: float;
+    :param surface_potential: float;
+    :param solution: Union[float, numpy.array];
+    """
+    with buffer.LOCK:
+        seeds = buffer.SOLVER_SEEDS.setdefault(key, list())
+        seeds.append((components_distance, surface_potential, solution))
+        del seeds[:-MAX_SOLVER_SEEDS]
+        sizes = np.cumsum([np.asarray(seed[2]).nbytes for seed in reversed(seeds)])
+        del seeds[:-max(np.count_nonzero(sizes <= MAX_SOLVER_SEEDS_SIZE), 1)]
+    buffer.reduce_buffer(buffer.SOLVER_SEEDS, max_storage=buffer.SOLVER_SEEDS_MAX_STORAGE)
+
+
+def warm_start_newton(fn, fprime, seed, args):
+    """
+    Solves radius by Newton method starting from the stored solution `seed`. Solution is accepted only if the solver
+    converged and the solution does not deviate from `seed` by more than `MAX_SEED_DEVIATION`, so it belongs to the
+    same surface.
+
+    :param fn: callable; potential function
+    :param fprime: callable; radial derivative of potential function
+    :param seed: Union[float, numpy.array]; initial guess
+    :param args: Tuple; arguments of `fn`, see `elisa.opt.newton.newton`
+    :return: Union[float, numpy.array, None]; None if solution is not accepted
+    """
+    try:
+        with np.errstate(all='ignore'):
+            solution = newton(fn, seed, fprime=fprime, args=args, maxiter=settings.MAX_SOLVER_ITERS, rtol=1e-10)
+    except MaxIterationError:
+        return None
+    if not np.all(np.isfinite(solution)) or np.any(up.abs(solution / seed - 1.0) > MAX_SEED_DEVIATION):
+        return None
+    return solution
 
 
 def calculate_radius(synchronicity, mass_ratio, surface_potential, component, *args):
@@ -32,26 +105,36 @@ def calculate_radius(synchronicity, mass_ratio, surface_potential, component, *a
     """
     if component == 'primary':
         fn = model.potential_primary_fn
+        fprime = model.radial_primary_potential_derivative
         precalc = model.pre_calculate_for_potential_value_primary
     elif component == 'secondary':
         fn = model.potential_secondary_fn
+        fprime = model.radial_secondary_potential_derivative
         precalc = model.pre_calculate_for_potential_value_secondary
     else:
         raise ValueError(f'Invalid value of `component` argument {component}. \n'
                          f'Expecting `primary` or `secondary`.')
 
     precalc_args = (synchronicity, mass_ratio) + args
-    scipy_solver_init_value = np.array([1e-4])
     argss = ((mass_ratio,) + precalc(*precalc_args), surface_potential)
+
+    # solution in the same direction for the closest components distance and potential is used as initial guess
+    seed_key = ('radius', component, synchronicity, mass_ratio) + tuple(args[1:])
+    seed = get_solver_seed(seed_key, args[0], surface_potential)
+    if seed is not None:
+        solution = warm_start_newton(fn, fprime, seed, argss)
+        if solution is not None:
+            store_solver_seed(seed_key, args[0], surface_potential, solution)
+            return solution
+
+    scipy_solver_init_value = np.array([1e-4])
     solution, _, ier, _ = fsolve(fn, scipy_solver_init_value, full_output=True, args=argss, xtol=1e-10)
 
     # check for regular solution
-    if ier == 1 and not up.isnan(solution[0]) and 30 >= solution[0] >= 0:
-        return solution[0]
-    else:
-        if not (0 < solution[0] < 1.0):
-            raise ValueError(f'Invalid value of radius {solution} was calculated.')
-        return solution[0]
+    if not (ier == 1 and not up.isnan(solution[0]) and 30 >= solution[0] >= 0) and not (0 < solution[0] < 1.0):
+        raise ValueError(f'Invalid value of radius {solution} was calculated.')
+    store_solver_seed(seed_key, args[0], surface_potential, solution[0])
+    return solution[0]
 
 
 def calculate_polar_radius(synchronicity, mass_ratio, components_distance, surface_potential, component):
@@ -4,7 +4,6 @@ import matplotlib.path as mpltpath
 from scipy.spatial.qhull import ConvexHull
 from copy import copy
 
-from .. import utils as bsutils
 from ... import settings
 from ... logger import getLogger
 from ... import (
@@ -13,6 +12,7 @@ from ... import (
     const
 )
 from ... base.surface import coverage as bcoverage
+from ... numba_functions import clipping
 
 
 logger = getLogger('binary_system.surface.coverage')
@@ -25,22 +25,18 @@ def partial_visible_faces_surface_coverage(points, faces, normals, hull):
     :param points: numpy.array;
     :param faces: numpy.array;
     :param normals: numpy.array;
-    :param hull: numpy.array; sorted clockwise to create
-                              matplotlib.path.Path; path of points boundary of infront component projection
+    :param hull: numpy.array; vertices of the convex boundary of infront component projection ordered
+                              clockwise or counter-clockwise
     :return: numpy.array;
     """
-    pypex_hull = bsutils.hull_to_pypex_poly(hull)
-    pypex_faces = bsutils.faces_to_pypex_poly(points[faces])
-    # it is possible to None happens in intersection, tkae care about it latter
-    pypex_intersection = bsutils.pypex_poly_hull_intersection(pypex_faces, pypex_hull)
-
-    # think about surface normalisation like and avoid surface areas like 1e-6 which lead to loss in precission
-    pypex_polys_surface_area = np.array(bsutils.pypex_poly_surface_area(pypex_intersection), dtype=np.float)
+    # areas of covered parts of faces are computed at once by clipping of the faces by the convex hull
+    triangles = np.asarray(points[faces], dtype=float)
+    covered_surface_area = clipping.triangle_hull_intersection_areas(triangles, np.asarray(hull, dtype=float))
 
     inplane_points_3d = np.column_stack((points, np.zeros(points.shape[0])))
     inplane_surface_area = utils.triangle_areas(triangles=faces, points=inplane_points_3d)
     correction_cosine = utils.calculate_cos_theta_los_x(normals)
-    retval = (inplane_surface_area - pypex_polys_surface_area) / correction_cosine
+    retval = (inplane_surface_area - covered_surface_area) / correction_cosine
     return retval
 
 
@@ -112,6 +108,22 @@ def visibility_out_of_eclipse(undercover_object):
     return full_visible, placeholder, placeholder
 
 
+def faces_visibility_mask(undercover_object, visible_point_indices):
+    """
+    Marks vertices of the near side faces which are not eclipsed.
+
+    :param undercover_object: StarContainer; eclipsed component
+    :param visible_point_indices: numpy.array; indices of not eclipsed points on the near side of eclipsed component
+    :return: numpy.array; bool mask in shape of faces, vertices of far side faces are always False
+    """
+    points_visibility = np.zeros(undercover_object.points.shape[0], dtype=bool)
+    points_visibility[visible_point_indices] = True
+
+    faces_visibility = np.zeros(undercover_object.faces.shape, dtype=bool)
+    faces_visibility[undercover_object.indices] = points_visibility[undercover_object.faces[undercover_object.indices]]
+    return faces_visibility
+
+
 def visibility_similar_objects(undercover_visible_projection, undercover_object, undercover_visible_point_indices,
                                cover_outline):
     """
@@ -125,13 +137,11 @@ def visibility_similar_objects(undercover_visible_projection, undercover_object,
     :return: tuple; full_visible, invisible, partial_visible triangles observer-facing part of eclipsed component
     """
     # obtain points out of eclipse (out of boundary defined by hull of 'infront' object)
-    out_of_bound = up.invert(cover_outline.contains_points(undercover_visible_projection))
+    out_of_bound = up.invert(clipping.points_in_convex_polygon(undercover_visible_projection,
+                                                               np.asarray(cover_outline.vertices, dtype=float)))
 
     undercover_visible_point_indices = undercover_visible_point_indices[out_of_bound]
-    undercover_faces = np.full(undercover_object.normals.shape, -1, dtype=np.int)
-    undercover_faces[undercover_object.indices] = undercover_object.faces[undercover_object.indices]
-
-    eclipse_faces_visibility = np.isin(undercover_faces, undercover_visible_point_indices)
+    eclipse_faces_visibility = faces_visibility_mask(undercover_object, undercover_visible_point_indices)
 
     # get indices of full visible, invisible and partial visible faces
     full_visible = np.all(eclipse_faces_visibility, axis=1)
@@ -164,10 +174,7 @@ def visibility_disimilar_objects(undercover_visible_projection, undercover_objec
     out_of_bound = ~np.logical_and(max_condition, min_condition)
 
     undercover_visible_point_indices = undercover_visible_point_indices[out_of_bound]
-    undercover_faces = np.full(undercover_object.normals.shape, -1, dtype=np.int)
-    undercover_faces[undercover_object.indices] = undercover_object.faces[undercover_object.indices]
-
-    eclipse_faces_visibility = np.isin(undercover_faces, undercover_visible_point_indices)
+    eclipse_faces_visibility = faces_visibility_mask(undercover_object, undercover_visible_point_indices)
 
     full_visible = np.all(eclipse_faces_visibility, axis=1)
     invisible = np.full(full_visible.shape, False, dtype=bool)
@@ -206,7 +213,8 @@ def compute_surface_coverage(system, semi_major_axis, in_eclipse=True, return_va
         undercover_visible_point_indices = np.unique(undercover_object.faces[undercover_object.indices])
 
         # outline of the eclipsing component
-        bb_path = get_eclipse_boundary_path(cover_object_obs_visible_projection)
+        bb_path = get_eclipse_boundary_path(cover_object_obs_visible_projection) \
+            if utils.is_empty(cover_object.outline_simplices) else get_cached_eclipse_boundary_path(system, cover_object)
 
         similar_size_test = test_size_similarity(cover_object, undercover_object)
         args = (undercover_object_obs_visible_projection, undercover_object, undercover_visible_point_indices, bb_path)
@@ -217,7 +225,7 @@ def compute_surface_coverage(system, semi_major_axis, in_eclipse=True, return_va
 
     # process partial and full visible faces (get surface area of 3d polygon) of undercover object
     partial_visible_faces = undercover_object.faces[partial_visible]
-    partial_visible_normals = undercover_object.normals[partial_visible]
+    partial_visible_normals = undercover_object.get_transformed_subset('normals', partial_visible)
     undercover_object_pts_projection = utils.plane_projection(undercover_object.points, "yz", keep_3d=False)
     if in_eclipse:
         partial_coverage = partial_visible_faces_surface_coverage(
@@ -234,7 +242,7 @@ def compute_surface_coverage(system, semi_major_axis, in_eclipse=True, return_va
     visible_coverage = undercover_object.areas[full_visible]
 
     undercover_obj_coverage = bcoverage.surface_area_coverage(
-        size=np.shape(undercover_object.normals)[0],
+        size=np.shape(undercover_object.faces)[0],
         visible=full_visible, visible_coverage=visible_coverage,
         partial=partial_visible, partial_coverage=partial_coverage
     )
@@ -270,6 +278,52 @@ def get_eclipse_boundary_path(hull):
     return bb_path
 
 
+def prepare_eclipse_outlines(system):
+    """
+    Computes 3D convex hulls of the component surfaces in co-rotating frame of reference and stores them in the
+    star containers. Outlines of eclipsing components in each orbital position are then derived from these hulls
+    (see `get_cached_eclipse_boundary_path`) without triangulation of the projected surface. Applicable only if the
+    shape of the components is the same in each orbital position (circular synchronous orbits or spots rigidly
+    rotated over the surface of asynchronous components, see `settings.USE_RIGID_SPOT_ROTATION`). Components of
+    over-contact systems are not convex near the neck, their outlines are left to the triangulation in each phase.
+
+    :param system: elisa.binary_system.container.OrbitalPositionContainer; system in co-rotating frame of reference
+    """
+    if system.morphology == 'over-contact':
+        return
+    for component in settings.BINARY_COUNTERPARTS:
+        star = getattr(system, component)
+        hull = ConvexHull(star.get_flatten_parameter('points'))
+        star.outline_simplices = hull.simplices
+        # outward normals of hull facets
+        star.outline_normals = hull.equations[:, :3]
+
+
+def get_cached_eclipse_boundary_path(system, cover_object):
+    """
+    Return `matplotlib.path.Path` object which represents boundary of component projection to plane `yz` derived
+    from the 3D convex hull prepared by `prepare_eclipse_outlines`. Outline is formed by the vertices of the hull
+    shared by facets facing towards and away from the observer, ordered by their position angle around the projected
+    centre of the component.
+
+    :param system: elisa.binary_system.container.OrbitalPositionContainer; system on orbital position
+    :param cover_object: StarContainer; flattened and rotated eclipsing component
+    :return: matplotlib.path.Path;
+    """
+    normals = utils.rotate_item(cover_object.outline_normals, system.position, system.inclination)
+    front = normals[:, 0] > 0
+
+    front_vertices = np.zeros(cover_object.points.shape[0], dtype=bool)
+    back_vertices = np.zeros(cover_object.points.shape[0], dtype=bool)
+    front_vertices[cover_object.outline_simplices[front]] = True
+    back_vertices[cover_object.outline_simplices[~front]] = True
+
+    outline = cover_object.points[front_vertices & back_vertices][:, 1:]
+    centre = np.mean(cover_object.points[:, 1:], axis=0)
+    order = np.argsort(np.arctan2(outline[:, 1] - centre[1], outline[:, 0] - centre[0]))
+    return mpltpath.Path(outline[order])
+
+
 def calculate_coverage_with_cosines(system, semi_major_axis, in_eclipse=True):
     """
     Function prepares surface-related parameters such as coverage(area of visibility
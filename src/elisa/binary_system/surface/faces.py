@@ -1,7 +1,6 @@
 import numpy as np
 
 from copy import copy
-from scipy.spatial.qhull import Delaunay
 from .. import utils as bsutils
 from .. orbit import orbit
 from ... base import spot
@@ -17,7 +16,8 @@ from ... base.surface.faces import (
     split_spots_and_component_faces,
     set_all_surface_centres,
     calculate_normals,
-    mirror_triangulation
+    mirror_triangulation,
+    convex_hull_triangulation
 )
 
 logger = getLogger("binary_system.surface.faces")
@@ -222,8 +222,9 @@ def detached_system_surface(system, components_distance, points=None, component=
         else system.secondary.surface_potential
     if potential - critical_pot > 0.01:
         logger.debug(f'triangulating surface of {component} component using standard method')
-        triangulation = Delaunay(points)
-        triangles_indices = triangulation.convex_hull
+        template_key = (system.morphology, component, component_instance.discretization_factor, points.shape[0],
+                        'standard')
+        triangles_indices = convex_hull_triangulation(points, template_key)
     else:
         logger.debug(f'surface of {component} component is near or at critical potential; therefore custom '
                      f'triangulation method for (near)critical potential surfaces will be used')
@@ -239,8 +240,9 @@ def detached_system_surface(system, components_distance, points=None, component=
         if component == 'secondary':
             projected_points[:, 0] += components_distance
 
-        triangulation = Delaunay(projected_points)
-        triangles_indices = triangulation.convex_hull
+        template_key = (system.morphology, component, component_instance.discretization_factor, points.shape[0],
+                        'projected')
+        triangles_indices = convex_hull_triangulation(projected_points, template_key)
 
     return triangles_indices
 
@@ -269,8 +271,9 @@ def over_contact_system_surface(system, points=None, component="all", **kwargs):
     projected_points[:, 0] -= 1 if component == 'secondary' else 0
     projected_points = neck_x * projected_points / np.linalg.norm(projected_points, axis=1)[:, None]
 
-    triangulation = Delaunay(projected_points)
-    triangles_indices = triangulation.convex_hull
+    template_key = (system.morphology, component, component_instance.discretization_factor, points.shape[0],
+                    'projected')
+    triangles_indices = convex_hull_triangulation(projected_points, template_key)
 
     # removal of faces on top of the neck
     neck_test = ~(up.equal(points[triangles_indices][:, :, 0], neck_x).all(-1))
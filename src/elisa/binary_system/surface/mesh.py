@@ -1,14 +1,15 @@
+import hashlib
 import numpy as np
 
 from .. import (
     utils as bsutils,
     model,
+    radius as bsradius
 )
 from ... base.error import MaxIterationError, SpotError
 from ... base.spot import incorporate_spots_mesh
 from ... base.surface.mesh import correct_component_mesh
 from ... import settings
-from ... opt.fsolver import fsolver
 from ... utils import is_empty
 from ... logger import getLogger
 from ... import (
@@ -52,7 +53,7 @@ def build_mesh(system, components_distance, component="all"):
         star.base_symmetry_points_number = c
         star.inverse_point_symmetry_matrix = d
 
-    add_spots_to_mesh(system, components_distance, component="all")
+        add_spots_to_mesh(system, components_distance, component=component)
 
     return system
 
@@ -446,6 +447,24 @@ def _generate_neck_zs(delta_z, component, neck_position, neck_polynomial):
     return phi, z, z_ns, r_neck, separator
 
 
+def _generate_neck_azimuths(z_ns, num):
+    """
+    Generates azimuths of the surface points on all neck slices at once. Each slice `z_ns[i]` obtains azimuths
+    `numpy.linspace(0, pi/2, num=num[i], endpoint=False)[1:]`.
+
+    :param z_ns: numpy.array; z coordinates of neck slices
+    :param num: numpy.array; number of azimuth steps on each neck slice
+    :return: Tuple; (phi: numpy.array, z: numpy.array)
+    """
+    counts = num - 1
+    slice_idx = np.repeat(np.arange(num.shape[0]), counts)
+    starts = np.cumsum(counts) - counts
+    # order of the azimuth within its slice, starting from 1 since the meridian azimuth is omitted
+    order = np.arange(slice_idx.shape[0]) - starts[slice_idx] + 1
+    phis = order * (const.HALF_PI / num[slice_idx])
+    return phis, z_ns[slice_idx]
+
+
 def trapezoidal_overcontact_neck_points(
         discretization, neck_position, neck_polynomial, polar_radius, component):
     """
@@ -463,14 +482,12 @@ def trapezoidal_overcontact_neck_points(
 
     phi, z, z_ns, r_neck, separator = _generate_neck_zs(delta_z, component, neck_position, neck_polynomial)
 
-    for ii, zz in enumerate(z_ns):
-        num = int(const.HALF_PI * r_neck[ii] // delta_z)
-        num = num + 1 if num < 5 else num
-        phis = np.linspace(0, const.HALF_PI, num=int(num), endpoint=False)[1:]
-        z_n = np.full(phis.shape, zz)
+    num = (const.HALF_PI * r_neck // delta_z).astype(int)
+    num[num < 5] += 1
+    phis, z_n = _generate_neck_azimuths(z_ns, num)
 
-        phi = np.concatenate((phi, phis))
-        z = up.concatenate((z, z_n))
+    phi = np.concatenate((phi, phis))
+    z = up.concatenate((z, z_n))
 
     separator.append(np.shape(z)[0])
 
@@ -496,19 +513,16 @@ def improved_trapezoidal_overcontact_neck_points(
     phi, z, z_ns, r_neck, separator = _generate_neck_zs(delta_z, component, neck_position, neck_polynomial)
 
     eq_coeff = side_radius / polar_radius
-    for ii, zz in enumerate(z_ns):
-        num = const.HALF_PI * r_neck[ii] // delta_z
-        num = num + 1 if num < 4 else num
-        phis = np.linspace(0, const.HALF_PI, num=int(num), endpoint=False)[1:]
-        # obliqueness correction
-        tan_phis = np.tan(phis)
-        phis += up.arctan((eq_coeff - 1) * tan_phis /
-                          (1 + eq_coeff * tan_phis ** 2))
-
-        z_n = np.full(phis.shape, zz)
+    num = const.HALF_PI * r_neck // delta_z
+    num[num < 4] += 1
+    phis, z_n = _generate_neck_azimuths(z_ns, num.astype(int))
+    # obliqueness correction
+    tan_phis = np.tan(phis)
+    phis += up.arctan((eq_coeff - 1) * tan_phis /
+                      (1 + eq_coeff * tan_phis ** 2))
 
-        phi = np.concatenate((phi, phis))
-        z = up.concatenate((z, z_n))
+    phi = np.concatenate((phi, phis))
+    z = up.concatenate((z, z_n))
 
     separator.append(np.shape(z)[0])
 
@@ -518,7 +532,9 @@ def improved_trapezoidal_overcontact_neck_points(
 def get_surface_points(*args):
     """
     Function solves radius for given azimuths that are passed in `args`.
-    It use `scipy.optimize.fsolve` method. Function to solve is specified as last parameter in `args` Tuple.
+    It use Newton method (`elisa.opt.newton.newton`). Radii of the surface with the same azimuths solved for
+    the closest components distance and surface potential are used as initial guess if available.
+
     :param args: Tuple;
 
     ::
@@ -541,11 +557,18 @@ def get_surface_points(*args):
     phi, theta, x0, components_distance, precalc_fn, potential_fn, fprime, potential, q, synchronicity = args
     max_iter = settings.MAX_SOLVER_ITERS
     precalc_vals = precalc_fn(*(synchronicity, q, components_distance, phi, theta), return_as_tuple=True)
-    x0 = x0 * np.ones(phi.shape)
     radius_kwargs = dict(fprime=fprime, maxiter=max_iter, args=((q, ) + precalc_vals, potential), rtol=1e-10)
-    radius = opt.newton.newton(potential_fn, x0, **radius_kwargs)
+
+    azimuths_hash = hashlib.sha1(np.ascontiguousarray(phi).tobytes() + np.ascontiguousarray(theta).tobytes())
+    seed_key = ('surface', potential_fn.__name__, synchronicity, q, azimuths_hash.hexdigest())
+    seed = bsradius.get_solver_seed(seed_key, components_distance, potential)
+    radius = None if seed is None else bsradius.warm_start_newton(potential_fn, fprime, seed, radius_kwargs['args'])
+    if radius is None:
+        x0 = x0 * np.ones(phi.shape)
+        radius = opt.newton.newton(potential_fn, x0, **radius_kwargs)
     if (radius < 0.0).any():
         raise ValueError('Solver found at least one point in the opposite direction. Check you points. ')
+    bsradius.store_solver_seed(seed_key, components_distance, potential, radius)
     return utils.spherical_to_cartesian(np.column_stack((radius, phi, theta)))
 
 
@@ -902,6 +925,31 @@ def mesh_over_contact(system, component="all", symmetry_output=False):
         return points
 
 
+def get_spot_azimuths(center_vector, longitude, thetas, num_azimuthal):
+    """
+    Generates azimuths of all points of the spot at once. First point of each ring (counting from the centre
+    of the spot) is rotated around the spot centre vector by the set of angles evenly distributed in the full arc,
+    generating concentric circles of points around the centre of the spot.
+
+    :param center_vector: numpy.array; unit vector pointing to the centre of the spot
+    :param longitude: float; longitude of the spot centre
+    :param thetas: numpy.array; polar angles of the first point of each ring
+    :param num_azimuthal: numpy.array; number of points in each ring
+    :return: Tuple[numpy.array, numpy.array]; (phi, theta) of spot points
+    """
+    ring_indices = np.repeat(np.arange(len(thetas)), num_azimuthal)
+    ring_starts = np.repeat(np.cumsum(num_azimuthal) - num_azimuthal, num_azimuthal)
+    deltas = (np.arange(len(ring_indices)) - ring_starts) * (const.FULL_ARC / num_azimuthal)[ring_indices]
+
+    default_spherical_vectors = np.column_stack((np.ones(ring_indices.shape),
+                                                 np.full(ring_indices.shape, longitude % const.FULL_ARC),
+                                                 thetas[ring_indices]))
+    default_vectors = np.atleast_2d(utils.spherical_to_cartesian(default_spherical_vectors))
+    delta_vectors = utils.arbitrary_rotations(deltas, center_vector, default_vectors, omega_normalized=True)
+    spherical_delta_vectors = np.atleast_2d(utils.cartesian_to_spherical(delta_vectors))
+    return spherical_delta_vectors[:, 1], spherical_delta_vectors[:, 2]
+
+
 def mesh_spots(system, components_distance, component="all"):
     """
     Compute points of each spots and assigns values to spot container instance.
@@ -913,17 +961,14 @@ def mesh_spots(system, components_distance, component="all"):
     :return: bool;
     """
 
-    def solver_condition(x, *_args):
-        if isinstance(x, np.ndarray):
-            x = x[0]
-        point = utils.spherical_to_cartesian([x, _args[1], _args[2]])
-        point[0] = point[0] if component == "primary" else components_distance - point[0]
+    def solver_condition(radius, phi, theta):
+        points = utils.spherical_to_cartesian(np.column_stack((radius, phi, theta)))
+        x = points[:, 0] if component == "primary" else components_distance - points[:, 0]
+        condition = np.isfinite(radius) & (radius > 0) & (radius < 1e15)
         # ignore also spots where one of points is situated just on the neck
         if getattr(system, "morphology") == "over-contact":
-            if (component == "primary" and point[0] >= neck_position) or \
-                    (component == "secondary" and point[0] <= neck_position):
-                return False
-        return True
+            condition &= x < neck_position if component == "primary" else x > neck_position
+        return condition
 
     components = bsutils.component_to_list(component)
     fns = {
@@ -959,45 +1004,40 @@ def mesh_spots(system, components_distance, component="all"):
             mass_ratio = system.mass_ratio
             potential = component_instance.surface_potential
 
-            # initial radial vector
-            radial_vector = np.array([1.0, lon, lat])  # unit radial vector to the center of current spot
+            # unit radial vector to the center of current spot
             center_vector = utils.spherical_to_cartesian([1.0, lon, lat])
-            args1, use = (synchronicity, mass_ratio, components_distance, radial_vector[1], radial_vector[2]), False
-            args2 = ((system.mass_ratio,) + precalc_fn(*args1), potential)
-            kwargs = {'original_kwargs': args1}
-            solution, use = fsolver(potential_fn, solver_condition, *args2, **kwargs)
 
-            if not use:
+            # radius of the spot centre and radius of the 1st point in the 1st inner ring of spot
+            # are solved at once
+            anchor_phi, anchor_theta = np.array([lon, lon]), np.array([lat, lat + alpha])
+            precalc_vals = precalc_fn(*(synchronicity, mass_ratio, components_distance, anchor_phi, anchor_theta),
+                                      return_as_tuple=True)
+            radius_kwargs = dict(fprime=fprime, maxiter=settings.MAX_SOLVER_ITERS, rtol=1e-10,
+                                 args=((mass_ratio, ) + precalc_vals, potential))
+            try:
+                x0 = np.full(anchor_phi.shape, component_instance.side_radius)
+                anchor_radii = opt.newton.newton(potential_fn, x0, **radius_kwargs)
+            except MaxIterationError:
+                anchor_radii = np.full(anchor_phi.shape, np.nan)
+            use_center, use_ring = solver_condition(anchor_radii, anchor_phi, anchor_theta)
+
+            if not (use_center and use_ring):
                 # in case of spots, each point should be usefull, otherwise remove spot from
                 # component spot list and skip current spot computation
                 if not settings.SUPPRESS_WARNINGS:
-                    logger.warning(f"center of spot {spot_instance.kwargs_serializer()} "
+                    location = "center" if not use_center else "first inner ring"
+                    logger.warning(f"{location} of spot {spot_instance.kwargs_serializer()} "
                                    f"doesn't satisfy reasonable conditions and entire spot will be omitted")
 
                 component_instance.remove_spot(spot_index=spot_index)
                 continue
 
-            spot_center_r = solution
+            spot_center_r, ring_r = anchor_radii
             spot_center = utils.spherical_to_cartesian([spot_center_r, lon, lat])
 
             # compute euclidean distance of two points on spot (x0)
             # we have to obtain distance between center and 1st point in 1st inner ring of spot
-            args1, use = (synchronicity, mass_ratio, components_distance, lon, lat + alpha), False
-            args2 = ((system.mass_ratio,) + precalc_fn(*args1), potential)
-            kwargs = {'original_kwargs': args1}
-            solution, use = fsolver(potential_fn, solver_condition, *args2, **kwargs)
-
-            if not use:
-                # in case of spots, each point should be usefull, otherwise remove spot from
-                # component spot list and skip current spot computation
-                if not settings.SUPPRESS_WARNINGS:
-                    logger.warning(f"first inner ring of spot {spot_instance.kwargs_serializer()} "
-                                   f"doesn't satisfy reasonable conditions and entire spot will be omitted")
-
-                component_instance.remove_spot(spot_index=spot_index)
-                continue
-
-            x0 = up.sqrt(spot_center_r ** 2 + solution ** 2 - (2.0 * spot_center_r * solution * up.cos(alpha)))
+            x0 = up.sqrt(spot_center_r ** 2 + ring_r ** 2 - (2.0 * spot_center_r * ring_r * up.cos(alpha)))
 
             # number of points in latitudal direction
             # + 1 to obtain same discretization as object itself
@@ -1005,29 +1045,10 @@ def mesh_spots(system, components_distance, component="all"):
             logger.debug(f'number of rings in spot {spot_instance.kwargs_serializer()} is {num_radial}')
             thetas = np.linspace(lat, lat + spot_radius, num=num_radial, endpoint=True)
 
-            num_azimuthal = [1 if i == 0 else int(i * 2.0 * const.PI * x0 // x0) for i in range(0, len(thetas))]
-            deltas = [np.linspace(0., const.FULL_ARC, num=num, endpoint=False) for num in num_azimuthal]
-
-            spot_phi, spot_theta = [], []
-            for theta_index, theta in enumerate(thetas):
-                # first point of n-th ring of spot (counting start from center)
-                default_spherical_vector = [1.0, lon % const.FULL_ARC, theta]
-
-                for delta_index, delta in enumerate(deltas[theta_index]):
-                    # rotating default spherical vector around spot center vector and thus generating concentric
-                    # circle of points around centre of spot
-                    delta_vector = utils.arbitrary_rotation(theta=delta, omega=center_vector,
-                                                            vector=utils.spherical_to_cartesian(
-                                                                default_spherical_vector),
-                                                            degrees=False,
-                                                            omega_normalized=True)
+            num_azimuthal = np.array([1 if i == 0 else int(i * 2.0 * const.PI * x0 // x0)
+                                      for i in range(0, len(thetas))])
+            spot_phi, spot_theta = get_spot_azimuths(center_vector, lon, thetas, num_azimuthal)
 
-                    spherical_delta_vector = utils.cartesian_to_spherical(delta_vector)
-
-                    spot_phi.append(spherical_delta_vector[1])
-                    spot_theta.append(spherical_delta_vector[2])
-
-            spot_phi, spot_theta = np.array(spot_phi), np.array(spot_theta)
             args = spot_phi, spot_theta, spot_center_r, components_distance, precalc_fn, \
                 potential_fn, fprime, potential, mass_ratio, synchronicity
             try:
@@ -1048,20 +1069,18 @@ def mesh_spots(system, components_distance, component="all"):
                     raise SpotError(f"Your spot {spot_instance.kwargs_serializer()} "
                                     f"is intersecting neck which is currently not supported.")
 
-            boundary_points = spot_points[-len(deltas[-1]):]
+            boundary_points = spot_points[-num_azimuthal[-1]:]
 
             if component == "primary":
                 spot_instance.points = np.array(spot_points)
                 spot_instance.boundary = np.array(boundary_points)
                 spot_instance.center = np.array(spot_center)
             else:
-                spot_instance.points = np.array([np.array([components_distance - point[0], -point[1], point[2]])
-                                                 for point in spot_points])
-
-                spot_instance.boundary = np.array([np.array([components_distance - point[0], -point[1], point[2]])
-                                                   for point in boundary_points])
-
-                spot_instance.center = np.array([components_distance - spot_center[0], -spot_center[1], spot_center[2]])
+                mirror = np.array([-1.0, -1.0, 1.0])
+                shift = np.array([components_distance, 0.0, 0.0])
+                spot_instance.points = shift + mirror * spot_points
+                spot_instance.boundary = shift + mirror * boundary_points
+                spot_instance.center = shift + mirror * spot_center
 
 
 def calculate_neck_position(system, return_polynomial=False):
@@ -3,6 +3,9 @@ import numpy as np
 import json
 
 from copy import copy
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+from scipy.spatial import distance
 from ..surface import faces as bsfaces
 from .. import utils as bsutils
 from ...logger import getLogger
@@ -20,6 +23,10 @@ from elisa.numba_functions import reflection_effect as re_numba
 
 logger = getLogger("binary_system.surface.temperature")
 
+# number of (N_primary x N_secondary) float matrices allocated during calculation of reflection effect (matrices
+# to sum of both components)
+REFLECTION_MATRICES_COUNT = 2
+
 
 def redistribute_temperatures(in_system, temperatures):
     """
@@ -40,13 +47,15 @@ def redistribute_temperatures(in_system, temperatures):
     return in_system
 
 
-def apply_reflection_effect(system, components_distance, iterations):
+def apply_reflection_effect(system, components_distance, iterations, use_symmetry=True):
     """
     Alter temperatures of components to involve reflection effect.
 
     :param system: elisa.binary_system.container.OrbitalPositionContainer;
     :param iterations: int; iterations of reflection effect counts
     :param components_distance: float; components distance in SMA units
+    :param use_symmetry: bool; if False, symmetries of spot-free surfaces are not used (e.g. temperatures of
+                               rigidly rotated spots, see `get_rigid_spot_temperature_factors`)
     :return: system; elisa.binary_system.contaier.OrbitalPositionContainer; instance
     """
 
@@ -67,7 +76,7 @@ def apply_reflection_effect(system, components_distance, iterations):
     # this tests if you can use surface symmetries
     not_pulsation_test = not system.has_pulsations()
     not_spot_test = not system.has_spots()
-    use_quarter_star_test = not_pulsation_test and not_spot_test
+    use_quarter_star_test = not_pulsation_test and not_spot_test and use_symmetry
     vis_test_symmetry = {}
 
     # declaring variables
@@ -133,119 +142,62 @@ def apply_reflection_effect(system, components_distance, iterations):
     for cmp in components:
         teff4[cmp][vis_test[cmp]] = up.power(temperatures[cmp][vis_test[cmp]], 4)
 
-    if use_quarter_star_test:
-        # calculating distances and distance vectors between, join vector is already normalized
-        shp, shp_reduced = get_distance_matrix_shape(system, vis_test)
-
-        distance, join_vector = get_symmetrical_distance_matrix(shp, shp_reduced, centres, vis_test, vis_test_symmetry)
-
-        # calculating cos of angle gamma between face normal and join vector
-        # initialising gammma matrices
-        gamma = get_symmetrical_gammma(shp[:2], shp_reduced, normals, join_vector, vis_test, vis_test_symmetry)
-
-        # testing mutual visibility of faces by assigning 0 to non visible face combination
-        check_symmetric_gamma_for_negative_num(gamma, shp_reduced)
+    # irradiation is evaluated only on the base symmetry part of the surface and mirrored if possible
+    receivers = vis_test_symmetry if use_quarter_star_test else vis_test
+    ld_law = re_numba.LD_LAW_CODES[settings.LIMB_DARKENING_LAW]
+    vis_ldc = {cmp: np.ascontiguousarray(ldc[cmp][:, vis_test[cmp]], dtype=float) for cmp in components}
+    shp = (np.sum(vis_test['primary']), np.sum(vis_test['secondary']))
+    # hierarchical approximation does not allocate matrices of all pairs of faces
+    memory_bounded = settings.REFLECTION_EFFECT_OPENING_ANGLE <= 0 and \
+        get_reflection_matrices_size(shp) > settings.REFLECTION_EFFECT_MEMORY_LIMIT
+    if memory_bounded:
+        logger.debug('matrices of reflection effect exceed memory limit, reflection effect is evaluated in blocks')
+        tile_size = get_reflection_tile_size(max(shp))
+
+    with utils.numba_threads(settings.NUMBER_OF_THREADS) as parallel:
+        # precalculating matrix part of reflection effect correction Q_ab * D(gamma_b) of the irradiated component
+        matrix_to_sum2 = None if memory_bounded else \
+            get_irradiation_matrices(centres, normals, vis_ldc, vis_test, receivers, ld_law, parallel=parallel)
 
-        # calculating QAB = (cos gamma_a)*cos(gamma_b)/d**2
-        q_ab = get_symmetrical_q_ab(shp[:2], shp_reduced, gamma, distance)
-
-        # calculating limb darkening factor for each combination of surface faces
-        d_gamma = get_symmetrical_d_gamma(shp[:2], shp_reduced, ldc, gamma)
-
-        # calculating limb darkening factors for each combination of faces shape
-        # (N_faces_primary * N_faces_secondary)
-        # precalculating matrix part of reflection effect correction
-        matrix_to_sum2 = {
-            'primary': q_ab[:shp_reduced[0], :] * d_gamma['secondary'][:shp_reduced[0], :],
-            'secondary': q_ab[:, :shp_reduced[1]] * d_gamma['primary'][:, :shp_reduced[1]]
-        }
-        symmetry_to_use = {'primary': shp_reduced[0], 'secondary': shp_reduced[1]}
         for _ in range(iterations):
             for component in components:
                 star = getattr(system, component)
-                counterpart = 'primary' if component == 'secondary' else 'secondary'
-
-                # calculation of reflection effect correction as
-                # 1 + (c / t_effi) * sum_j(r_j * Q_ab * t_effj^4 * D(gamma_j) * areas_j)
-                # calculating vector part of reflection effect correction
-                vector_to_sum1 = reflection_factor[counterpart] * teff4[counterpart][vis_test[counterpart]] * \
-                                 areas[counterpart][vis_test[counterpart]]
-                counterpart_to_sum = up.matmul(vector_to_sum1, matrix_to_sum2['secondary']) \
-                    if component == 'secondary' else up.matmul(matrix_to_sum2['primary'], vector_to_sum1)
-                reflection_factor[component][:symmetry_to_use[component]] = \
-                    1 + (_c[component][vis_test_symmetry[component]] / teff4[component][vis_test_symmetry[component]]) \
-                    * counterpart_to_sum
-
-                # using symmetry to redistribute reflection factor R
-                refl_fact_aux = np.empty(shape=np.shape(temperatures[component]))
-                refl_fact_aux[vis_test_symmetry[component]] = reflection_factor[component][:symmetry_to_use[component]]
-                refl_fact_aux = star.mirror_face_values(refl_fact_aux)
-                reflection_factor[component] = refl_fact_aux[vis_test[component]]
-
-        for component in components:
-            star = getattr(system, component)
-            # assigning new temperatures according to last iteration as
-            # teff_new = teff_old * reflection_factor^0.25
-            temperatures[component][vis_test_symmetry[component]] = \
-                temperatures[component][vis_test_symmetry[component]] * \
-                up.power(reflection_factor[component][:symmetry_to_use[component]], 0.25)
-            temperatures[component] = star.mirror_face_values(temperatures[component])
-
-    else:
-        # calculating distances and distance vectors between, join vector is already normalized
-        distance, join_vector = utils.calculate_distance_matrix(points1=centres['primary'][vis_test['primary']],
-                                                                points2=centres['secondary'][vis_test['secondary']],
-                                                                return_join_vector_matrix=True)
-
-        # calculating cos of angle gamma between face normal and join vector
-        gamma = \
-            {'primary': re_numba.gamma_primary(normals['primary'][vis_test['primary']], join_vector),
-             'secondary': re_numba.gamma_secondary(normals['secondary'][vis_test['secondary']], join_vector)}
-        # negative sign is there because of reversed distance vector used for secondary component
-
-        # testing mutual visibility of faces by assigning 0 to non visible face combination
-        gamma['primary'][gamma['primary'] < 0] = 0.
-        gamma['secondary'][gamma['secondary'] < 0] = 0.
-
-        # calculating QAB = (cos gamma_a)*cos(gamma_b)/d**2
-        q_ab = up.divide(up.multiply(gamma['primary'], gamma['secondary']), up.power(distance, 2))
-
-        # calculating limb darkening factors for each combination of faces shape
-        # (N_faces_primary * N_faces_secondary)
-
-        # coefficients_primary = ld.interpolate_on_ld_grid()
-        d_gamma = \
-            {'primary': ld.limb_darkening_factor(coefficients=ldc['primary'][:, vis_test['primary']].T,
-                                                 limb_darkening_law=settings.LIMB_DARKENING_LAW,
-                                                 cos_theta=gamma['primary']),
-             'secondary': ld.limb_darkening_factor(coefficients=ldc['secondary'][:, vis_test['secondary']].T,
-                                                   limb_darkening_law=settings.LIMB_DARKENING_LAW,
-                                                   cos_theta=gamma['secondary'].T).T
-             }
-
-        # precalculating matrix part of reflection effect correction
-        matrix_to_sum2 = {cmp: q_ab * d_gamma[counterpart[cmp]] for cmp in components}
-
-        for _ in range(iterations):
-            for component in components:
-                counterpart = settings.BINARY_COUNTERPARTS[component]
+                _counterpart = counterpart[component]
 
                 # calculation of reflection effect correction as
                 # 1 + (c / t_effi) * sum_j(r_j * Q_ab * t_effj^4 * D(gamma_j) * areas_j)
                 # calculating vector part of reflection effect correction
-                vector_to_sum1 = reflection_factor[counterpart] * teff4[counterpart][vis_test[counterpart]] * \
-                                 areas[counterpart][vis_test[counterpart]]
-                counterpart_to_sum = up.matmul(vector_to_sum1, matrix_to_sum2['secondary']) \
-                    if component == 'secondary' else up.matmul(matrix_to_sum2['primary'], vector_to_sum1)
-                reflection_factor[component] = \
-                    1 + (_c[component][vis_test[component]] / teff4[component][vis_test[component]]) * \
+                vector_to_sum1 = reflection_factor[_counterpart] * teff4[_counterpart][vis_test[_counterpart]] * \
+                    areas[_counterpart][vis_test[_counterpart]]
+                if memory_bounded:
+                    counterpart_to_sum = tiled_irradiation(
+                        receiver_centres=centres[component][receivers[component]],
+                        receiver_normals=normals[component][receivers[component]],
+                        emitter_centres=centres[_counterpart][vis_test[_counterpart]],
+                        emitter_normals=normals[_counterpart][vis_test[_counterpart]],
+                        emitter_ldc=vis_ldc[_counterpart],
+                        emitter_vector=vector_to_sum1,
+                        tile_size=tile_size,
+                        parallel=parallel
+                    )
+                else:
+                    counterpart_to_sum = matrix_to_sum2[component].dot(vector_to_sum1)
+
+                refl_fact = 1 + (_c[component][receivers[component]] / teff4[component][receivers[component]]) * \
                     counterpart_to_sum
 
-        for component in components:
-            # assigning new temperatures according to last iteration as
-            # teff_new = teff_old * reflection_factor^0.25
-            temperatures[component][vis_test[component]] = \
-                temperatures[component][vis_test[component]] * up.power(reflection_factor[component], 0.25)
+                if use_quarter_star_test:
+                    # using symmetry to redistribute reflection factor R
+                    refl_fact_aux = np.empty(shape=np.shape(temperatures[component]))
+                    refl_fact_aux[receivers[component]] = refl_fact
+                    refl_fact = star.mirror_face_values(refl_fact_aux)[vis_test[component]]
+                reflection_factor[component] = refl_fact
+
+    for component in components:
+        # assigning new temperatures according to last iteration as
+        # teff_new = teff_old * reflection_factor^0.25
+        temperatures[component][vis_test[component]] = \
+            temperatures[component][vis_test[component]] * up.power(reflection_factor[component], 0.25)
 
     # redistributing temperatures back to the parent objects
     redistribute_temperatures(system, temperatures)
@@ -294,6 +246,42 @@ def build_temperature_distribution(system, components_distance, component="all")
     return system
 
 
+def get_face_directions(system, component, components_distance):
+    """
+    Returns unit vectors pointing from the centre of the component to its face centres in the frame of reference of
+    the component (frame used to define spots).
+
+    :param system: elisa.binary_system.container.OrbitalPositionContainer;
+    :param component: str; `primary` or `secondary`
+    :param components_distance: float; distance of components in SMA units
+    :return: numpy.array;
+    """
+    centres = np.array(getattr(system, component).face_centres)
+    if component == 'secondary':
+        centres[:, 0] = components_distance - centres[:, 0]
+        centres[:, 1] *= -1
+    return centres / np.linalg.norm(centres, axis=1)[:, np.newaxis]
+
+
+def get_rigid_spot_temperature_factors(face_directions, spots, longitudes):
+    """
+    Returns temperature factors of faces of the stationary spot-free surface covered by spots at given longitudes.
+    Face is covered by spot if its centre lies within the angular radius of the spot. Spot with lower index is
+    overwritten by spot with higher index if located on top of each other.
+
+    :param face_directions: numpy.array; output of `get_face_directions`
+    :param spots: Dict[int, elisa.base.spot.Spot];
+    :param longitudes: Dict[int, float]; current longitudes of spots
+    :return: numpy.array; temperature factor of each face
+    """
+    factors = np.ones(face_directions.shape[0])
+    for spot_index, spot in spots.items():
+        center_vector = utils.spherical_to_cartesian([1.0, longitudes[spot_index], spot.latitude])
+        in_spot = face_directions @ center_vector >= up.cos(spot.angular_radius)
+        factors[in_spot] = spot.temperature_factor
+    return factors
+
+
 def init_surface_variables(star):
     """
     Function copies basic parameters of the stellar surface (points, faces, normals, temperatures, areas and log_g) of
@@ -341,173 +329,212 @@ def include_spot_to_surface_variables(centres, spot_centres, normals, spot_norma
     return centres, normals, temperatures, areas, vis_test, log_g
 
 
-def get_symmetrical_distance_matrix(shape, shape_reduced, centres, vis_test, vis_test_symmetry):
+def get_reflection_matrices_size(shape):
     """
-    Function uses symmetries of the stellar component in order to reduce time in calculation distance matrix.
-
-    :param shape: Tuple[int]; desired shape of join vector matrix
-    :param shape_reduced: Tuple[int]; shape of the surface symmetries,
-                         (faces above those indices are symmetrical to the ones below)
-    :param centres: Dict;
-    :param vis_test: Dict[str, numpy.array];
-    :param vis_test_symmetry: Dict[str, numpy.array];
-    :return: Tuple; (distance, join vector)
-
-    ::
+    Estimates memory occupied by the matrices of mutual geometry of the faces of the components during calculation of
+    reflection effect.
 
-        distance - distance matrix
-        join vector - matrix of unit vectors pointing between each two faces on opposite stars
+    :param shape: Tuple[int]; numbers of mutually visible faces on primary and secondary component
+    :return: float; size in MB
     """
-    # in case of symmetries, you need to calculate only minor part of distance matrix connected with base
-    # symmetry part of the both surfaces
-    distance = np.empty(shape=shape[:-1])
-    join_vector = np.empty(shape=shape)
-
-    distance[:shape_reduced[0], :], join_vector[:shape_reduced[0], :, :] = \
-        utils.calculate_distance_matrix(
-            points1=centres['primary'][vis_test_symmetry['primary']],
-            points2=centres['secondary'][vis_test['secondary']],
-            return_join_vector_matrix=True)
-
-    aux = centres['primary'][vis_test['primary']]
-    distance[shape_reduced[0]:, :shape_reduced[1]], join_vector[shape_reduced[0]:, :shape_reduced[1], :] = \
-        utils.calculate_distance_matrix(points1=aux[shape_reduced[0]:],
-                                        points2=centres['secondary'][vis_test_symmetry['secondary']],
-                                        return_join_vector_matrix=True)
-
-    return distance, join_vector
+    return REFLECTION_MATRICES_COUNT * np.dtype(float).itemsize * shape[0] * shape[1] / 1024 ** 2
 
 
-def get_symmetrical_gammma(shape, shape_reduced, normals, join_vector, vis_test, vis_test_symmetry):
+def get_reflection_tile_size(n_emitters):
     """
-    Function uses surface symmetries to calculate cosine of angles between join vector and surface normals.
-
-    :param shape: Tuple[int]; desired shape of gamma
-    :param shape_reduced: Tuple[int]; shape of the surface symmetries, (faces above those
-                                      indices are symmetrical to the ones below)
-    :param normals: Dict[str, numpy.array];
-    :param join_vector: Dict[str, numpy.array];
-    :param vis_test: Dict[str, numpy.array];
-    :param vis_test_symmetry: Dict[str, numpy.array];
-    :return: gamma: Dict[str, numpy.array]; cos(angle(normal, join_vector))
-    """
-    gamma = {'primary': np.empty(shape=shape, dtype=np.float),
-             'secondary': np.empty(shape=shape, dtype=np.float)}
+    Returns number of irradiated faces evaluated at once so the irradiation matrix of one block fits into
+    `settings.REFLECTION_EFFECT_MEMORY_LIMIT`.
 
-    gamma['primary'][:, :shape_reduced[1]] = \
-        re_numba.gamma_primary(normals['primary'][vis_test['primary']],
-                               join_vector[:, :shape_reduced[1], :])
-    gamma['primary'][:shape_reduced[0], shape_reduced[1]:] = \
-        re_numba.gamma_primary(normals['primary'][vis_test_symmetry['primary']],
-                               join_vector[:shape_reduced[0], shape_reduced[1]:, :])
+    :param n_emitters: int; number of irradiating faces
+    :return: int;
+    """
+    row_size = np.dtype(float).itemsize * n_emitters / 1024 ** 2
+    return max(1, int(settings.REFLECTION_EFFECT_MEMORY_LIMIT / row_size))
 
-    gamma['secondary'][:shape_reduced[0], :] = \
-        re_numba.gamma_secondary(normals['secondary'][vis_test['secondary']],
-                                 join_vector[:shape_reduced[0], :, :])
-    gamma['secondary'][shape_reduced[0]:, :shape_reduced[1]] = \
-        re_numba.gamma_secondary(normals['secondary'][vis_test_symmetry['secondary']],
-                                 join_vector[shape_reduced[0]:, :shape_reduced[1], :])
 
-    return gamma
+def get_irradiation_matrix(receiver_centres, receiver_normals, emitter_centres, emitter_normals, emitter_ldc, ld_law,
+                           parallel=False):
+    """
+    Calculates matrix part of reflection effect correction::
 
+        Q_ij * D(gamma_j)
 
-def check_symmetric_gamma_for_negative_num(gamma, shape_reduced):
-    """
-    If cos < 0 it will be redefined as 0 are inplaced.
+    where QAB = (cos gamma_i)*cos(gamma_j)/d_ij**2 and D(gamma_j) is limb darkening factor of irradiating face `j`.
 
-    :param gamma: Dict[str, numpy.array];
-    :param shape_reduced: Tuple[int];
+    :param receiver_centres: numpy.array; (a, 3) centres of irradiated faces
+    :param receiver_normals: numpy.array; (a, 3) normals of irradiated faces
+    :param emitter_centres: numpy.array; (b, 3) centres of irradiating faces
+    :param emitter_normals: numpy.array; (b, 3) normals of irradiating faces
+    :param emitter_ldc: numpy.array; (c, b) limb darkening coefficients of irradiating faces
+    :param ld_law: int; code of limb darkening law from `elisa.numba_functions.reflection_effect.LD_LAW_CODES`
+    :param parallel: bool; if True, multithreaded kernel is used (see `elisa.utils.numba_threads`)
+    :return: numpy.array; (a, b)
     """
-    gamma['primary'][:, :shape_reduced[1]][gamma['primary'][:, :shape_reduced[1]] < 0] = 0.
-    gamma['primary'][:shape_reduced[0], shape_reduced[1]:][gamma['primary'][:shape_reduced[0],
-                                                           shape_reduced[1]:] < 0] = 0.
-    gamma['secondary'][:shape_reduced[0], :][gamma['secondary'][:shape_reduced[0], :] < 0] = 0.
-    gamma['secondary'][shape_reduced[0]:, :shape_reduced[1]][gamma['secondary'][shape_reduced[0]:,
-                                                             :shape_reduced[1]] < 0] = 0.
+    kernel = re_numba.irradiation_matrix_parallel if parallel else re_numba.irradiation_matrix
+    return kernel(receiver_centres, receiver_normals, emitter_centres, emitter_normals, emitter_ldc, ld_law)
 
 
-def get_symmetrical_d_gamma(shape, shape_reduced, ldc, gamma):
+def get_irradiation_matrices(centres, normals, vis_ldc, vis_test, receivers, ld_law, parallel=False):
     """
-    Function uses surface symmetries to calculate limb darkening factor matrices
-    for each component that are used in reflection effect.
-
-    :param ldc: Dict; arrays of limb darkening coefficients for each face of each component
-    :param shape: Tuple; desired shape of limb darkening matrices d_gamma
-    :param shape_reduced: Tuple; shape of the surface symmetries, (faces above those
-                                 indices are symmetrical to the ones below)
-    :param gamma: Dict; cosines of angles between join vector and surface element normal vector for both components
-    :return: Dict; limb darkening coefficient matrix
+    Returns matrix part of reflection effect correction Q_ab * D(gamma_b) for both irradiated components. If
+    `settings.REFLECTION_EFFECT_SPARSITY_THRESHOLD` is set, couplings weaker than this fraction of the strongest
+    coupling are neglected and matrices are stored as `scipy.sparse.csr_matrix`. If
+    `settings.REFLECTION_EFFECT_OPENING_ANGLE` is set, hierarchical approximation of the matrices is used instead
+    (see `get_hierarchical_irradiation_matrix`).
+
+    :param centres: Dict[str, numpy.array]; face centres of components
+    :param normals: Dict[str, numpy.array]; face normals of components
+    :param vis_ldc: Dict[str, numpy.array]; limb darkening coefficients of mutually visible faces
+    :param vis_test: Dict[str, numpy.array]; mutually visible faces (irradiating faces)
+    :param receivers: Dict[str, numpy.array]; irradiated faces
+    :param ld_law: int; code of limb darkening law from `elisa.numba_functions.reflection_effect.LD_LAW_CODES`
+    :param parallel: bool; if True, multithreaded kernel is used (see `elisa.utils.numba_threads`)
+    :return: Dict[str, Union[numpy.array, scipy.sparse.csr_matrix, scipy.sparse.linalg.LinearOperator]];
+             (irradiated, irradiating) matrices
     """
-    d_gamma = {'primary': np.empty(shape=shape, dtype=np.float),
-               'secondary': np.empty(shape=shape, dtype=np.float)}
-
-    cos_theta = gamma['primary'][:, :shape_reduced[1]]
-    d_gamma['primary'][:, :shape_reduced[1]] = ld.limb_darkening_factor(
-        coefficients=ldc['primary'][:, :shape[0]].T,
-        limb_darkening_law=settings.LIMB_DARKENING_LAW,
-        cos_theta=cos_theta)
-
-    cos_theta = gamma['primary'][:shape_reduced[0], shape_reduced[1]:]
-    d_gamma['primary'][:shape_reduced[0], shape_reduced[1]:] = ld.limb_darkening_factor(
-        coefficients=ldc['primary'][:, :shape_reduced[0]].T,
-        limb_darkening_law=settings.LIMB_DARKENING_LAW,
-        cos_theta=cos_theta)
-
-    cos_theta = gamma['secondary'][:shape_reduced[0], :]
-    d_gamma['secondary'][:shape_reduced[0], :] = ld.limb_darkening_factor(
-        coefficients=ldc['secondary'][:, :shape[1]].T,
-        limb_darkening_law=settings.LIMB_DARKENING_LAW,
-        cos_theta=cos_theta.T).T
-
-    cos_theta = gamma['secondary'][shape_reduced[0]:, :shape_reduced[1]]
-    d_gamma['secondary'][shape_reduced[0]:, :shape_reduced[1]] = ld.limb_darkening_factor(
-        coefficients=ldc['secondary'][:, :shape_reduced[1]].T,
-        limb_darkening_law=settings.LIMB_DARKENING_LAW,
-        cos_theta=cos_theta.T).T
-
-    return d_gamma
-
-
-def get_symmetrical_q_ab(shape, shape_reduced, gamma, distance):
+    threshold = settings.REFLECTION_EFFECT_SPARSITY_THRESHOLD
+    opening_angle = settings.REFLECTION_EFFECT_OPENING_ANGLE
+    components = settings.BINARY_COUNTERPARTS
+    matrices = dict()
+    for cmp, counterpart in components.items():
+        geometry = dict(
+            receiver_centres=centres[cmp][receivers[cmp]],
+            receiver_normals=normals[cmp][receivers[cmp]],
+            emitter_centres=centres[counterpart][vis_test[counterpart]],
+            emitter_normals=normals[counterpart][vis_test[counterpart]],
+            emitter_ldc=vis_ldc[counterpart],
+            ld_law=ld_law,
+            parallel=parallel
+        )
+        if opening_angle > 0:
+            matrices[cmp] = get_hierarchical_irradiation_matrix(opening_angle=opening_angle, **geometry)
+            continue
+
+        matrix = get_irradiation_matrix(**geometry)
+        if threshold > 0:
+            matrix[matrix < threshold * np.max(matrix, initial=0.0)] = 0.0
+            matrix = sparse.csr_matrix(matrix)
+        matrices[cmp] = matrix
+
+    return matrices
+
+
+def get_irradiating_patches(centres, patch_size):
     """
-    Function uses surface symmetries to calculate parameter::
-
-        QAB = (cos gamma_a)*cos(gamma_b)/d**2
-
-    in reflection effect.
+    Splits irradiating faces into spatially compact patches by recursive bisection of the faces at the median of
+    their longest extent.
 
-    :param shape: Tuple[int]; desired shape of q_ab
-    :param shape_reduced: Tuple[int]; shape of the surface symmetries,
-                                     (faces above those indices are symmetrical to the ones below)
-    :param gamma: Dict[str, numpy.array];
-    :param distance: numpy.array;
-    :return: numpy.array;
+    :param centres: numpy.array; (b, 3) centres of irradiating faces
+    :param patch_size: int; maximal number of faces in patch
+    :return: List[numpy.array]; indices of faces in each patch
     """
-    q_ab = np.empty(shape=shape, dtype=np.float)
-    q_ab[:, :shape_reduced[1]] = \
-        up.divide(up.multiply(gamma['primary'][:, :shape_reduced[1]],
-                              gamma['secondary'][:, :shape_reduced[1]]),
-                  up.power(distance[:, :shape_reduced[1]], 2))
-    q_ab[:shape_reduced[0], shape_reduced[1]:] = \
-        up.divide(up.multiply(gamma['primary'][:shape_reduced[0], shape_reduced[1]:],
-                              gamma['secondary'][:shape_reduced[0], shape_reduced[1]:]),
-                  up.power(distance[:shape_reduced[0], shape_reduced[1]:], 2))
-    return q_ab
-
-
-def get_distance_matrix_shape(system, vis_test):
+    patches, to_split = [], [np.arange(centres.shape[0])]
+    while to_split:
+        indices = to_split.pop()
+        if indices.shape[0] <= patch_size:
+            patches.append(indices)
+            continue
+        patch_centres = centres[indices]
+        axis = np.argmax(np.ptp(patch_centres, axis=0))
+        order = np.argsort(patch_centres[:, axis], kind='stable')
+        half = indices.shape[0] // 2
+        to_split.extend([indices[order[half:]], indices[order[:half]]])
+    return patches
+
+
+def get_hierarchical_irradiation_matrix(receiver_centres, receiver_normals, emitter_centres, emitter_normals,
+                                        emitter_ldc, ld_law, opening_angle, parallel=False):
     """
-    Calculates shapes of distance and join vector matrices along with shapes
-    of symmetrical parts of those matrices used in reflection effect.
-
-    :param system: elisa.binary_system.container.OrbitalPositionContainer;
-    :param vis_test: numpy.array;
-    :return: Tuple;
+    Hierarchical approximation of matrix part of reflection effect correction Q_ij * D(gamma_j) (see
+    `get_irradiation_matrix`). Irradiating faces are grouped into approximately sqrt(b) patches and each patch
+    irradiates as a single face placed in its centroid with the mean normal and the mean limb darkening
+    coefficients of its faces. Patch is treated as a single face only for irradiated faces where::
+
+        patch_radius < opening_angle * distance
+
+    couplings of the remaining (nearby) pairs of faces are evaluated exactly. Relative error of the approximated
+    couplings scales with `opening_angle` and the approximation becomes exact for `opening_angle` -> 0. Cost of the
+    evaluation scales as a * (sqrt(b) + number of nearby faces) instead of a * b.
+
+    :param receiver_centres: numpy.array; (a, 3) centres of irradiated faces
+    :param receiver_normals: numpy.array; (a, 3) normals of irradiated faces
+    :param emitter_centres: numpy.array; (b, 3) centres of irradiating faces
+    :param emitter_normals: numpy.array; (b, 3) normals of irradiating faces
+    :param emitter_ldc: numpy.array; (c, b) limb darkening coefficients of irradiating faces
+    :param ld_law: int; code of limb darkening law from `elisa.numba_functions.reflection_effect.LD_LAW_CODES`
+    :param opening_angle: float; ratio of the patch radius and its distance below which patch is treated as a single
+                                 irradiating face
+    :param parallel: bool; if True, multithreaded kernel is used (see `elisa.utils.numba_threads`)
+    :return: scipy.sparse.linalg.LinearOperator; (a, b)
+    """
+    n_receivers, n_emitters = receiver_centres.shape[0], emitter_centres.shape[0]
+    patches = get_irradiating_patches(emitter_centres, max(1, int(np.sqrt(n_emitters))))
+    patch_sizes = np.array([patch.shape[0] for patch in patches])
+
+    patch_centres = np.array([np.mean(emitter_centres[patch], axis=0) for patch in patches])
+    patch_normals = np.array([np.mean(emitter_normals[patch], axis=0) for patch in patches])
+    patch_normals /= np.linalg.norm(patch_normals, axis=1)[:, np.newaxis]
+    patch_ldc = np.ascontiguousarray(np.column_stack([np.mean(emitter_ldc[:, patch], axis=1) for patch in patches]))
+    patch_radii = np.array([np.max(np.linalg.norm(emitter_centres[patch] - centre, axis=1))
+                            for patch, centre in zip(patches, patch_centres)])
+
+    # couplings of patches, zeroed for nearby pairs evaluated exactly
+    far_matrix = get_irradiation_matrix(receiver_centres, receiver_normals, patch_centres, patch_normals, patch_ldc,
+                                        ld_law, parallel=parallel)
+    near_test = patch_radii[np.newaxis, :] >= opening_angle * distance.cdist(receiver_centres, patch_centres)
+    far_matrix[near_test] = 0.0
+
+    rows, columns, values = [np.empty(0, dtype=np.int)], [np.empty(0, dtype=np.int)], [np.empty(0)]
+    for patch_index, patch in enumerate(patches):
+        near_receivers = np.flatnonzero(near_test[:, patch_index])
+        if near_receivers.shape[0] == 0:
+            continue
+        block = get_irradiation_matrix(receiver_centres[near_receivers], receiver_normals[near_receivers],
+                                       emitter_centres[patch], emitter_normals[patch],
+                                       np.ascontiguousarray(emitter_ldc[:, patch]), ld_law, parallel=parallel)
+        rows.append(np.repeat(near_receivers, patch.shape[0]))
+        columns.append(np.tile(patch, near_receivers.shape[0]))
+        values.append(block.ravel())
+    near_matrix = sparse.csr_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+                                    shape=(n_receivers, n_emitters))
+    logger.debug(f'{near_matrix.nnz} of {n_receivers * n_emitters} couplings of faces evaluated exactly')
+
+    # summation of irradiating faces of each patch
+    membership = sparse.csr_matrix((np.ones(n_emitters), (np.repeat(np.arange(len(patches)), patch_sizes),
+                                                          np.concatenate(patches))),
+                                   shape=(len(patches), n_emitters))
+    return sparse_linalg.aslinearoperator(far_matrix) * sparse_linalg.aslinearoperator(membership) + \
+        sparse_linalg.aslinearoperator(near_matrix)
+
+
+def tiled_irradiation(receiver_centres, receiver_normals, emitter_centres, emitter_normals, emitter_ldc,
+                      emitter_vector, tile_size, parallel=False):
+    """
+    Calculates irradiation sums::
+
+        sum_j(Q_ij * D(gamma_j) * emitter_vector_j)
+
+    for each irradiated face `i` where QAB = (cos gamma_i)*cos(gamma_j)/d_ij**2. Irradiated faces are evaluated in
+    blocks of `tile_size` faces, so only irradiation matrix of a single block is stored in memory.
+
+    :param receiver_centres: numpy.array; (a, 3) centres of irradiated faces
+    :param receiver_normals: numpy.array; (a, 3) normals of irradiated faces
+    :param emitter_centres: numpy.array; (b, 3) centres of irradiating faces
+    :param emitter_normals: numpy.array; (b, 3) normals of irradiating faces
+    :param emitter_ldc: numpy.array; (c, b) limb darkening coefficients of irradiating faces
+    :param emitter_vector: numpy.array; (b, ) vector part of reflection effect correction (r_j * t_effj^4 * areas_j)
+    :param tile_size: int; number of irradiated faces evaluated at once
+    :param parallel: bool; if True, multithreaded kernel is used (see `elisa.utils.numba_threads`)
+    :return: numpy.array; (a, )
     """
-    shape = (np.sum(vis_test['primary']), np.sum(vis_test['secondary']), 3)
-    shape_reduced = (np.sum(system.primary.symmetry_faces(vis_test['primary'])),
-                     np.sum(system.secondary.symmetry_faces(vis_test['secondary'])))
-    return shape, shape_reduced
+    ld_law = re_numba.LD_LAW_CODES[settings.LIMB_DARKENING_LAW]
+    result = np.empty(receiver_centres.shape[0], dtype=float)
+    for start in range(0, receiver_centres.shape[0], tile_size):
+        tile = slice(start, start + tile_size)
+        matrix = get_irradiation_matrix(receiver_centres[tile], receiver_normals[tile], emitter_centres,
+                                        emitter_normals, emitter_ldc, ld_law, parallel=parallel)
+        result[tile] = up.matmul(matrix, emitter_vector)
+    return result
 
 
 def interpolate_albedo(temperature):
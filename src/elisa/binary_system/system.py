@@ -6,7 +6,7 @@ from scipy import optimize
 
 from . import graphic
 from . orbit import orbit
-from . curves import lc, rv
+from . curves import lc, rv, lcrv
 from . surface import mesh
 from . surface.temperature import interpolate_albedo
 from . transform import BinarySystemProperties
@@ -1292,3 +1292,38 @@ class BinarySystem(System):
 
     def _compute_eccentric_rv_curve_no_spots(self, **kwargs):
         return rv.compute_eccentric_rv_curve_no_spots(self, **kwargs)
+
+    # joint light curves and radial velocity curves ********************************************************************
+    def compute_lc_rv(self, **kwargs):
+        """
+        Computes light curves and radiometric radial velocities in a single pass, where geometry, surface coverage and
+        radiances at each orbital position are evaluated only once for both observables.
+
+        :param kwargs: Dict; arguments to be passed into curve generator functions
+        :**kwargs options**:
+            * ** passband ** * - Dict[str, elisa.observer.PassbandContainer]
+            * ** left_bandwidth ** * - float
+            * ** right_bandwidth ** * - float
+            * ** phases ** * - numpy.array
+            * ** position_method ** * - method
+
+        :return: Dict; {`passband`: numpy.array, `primary`: numpy.array, `secondary`: numpy.array}
+        """
+        curve_fn = c_router.resolve_curve_method(self, curve='lc_rv')
+        kwargs = rv_utils.include_passband_data_to_kwargs(**kwargs)
+        return curve_fn(**kwargs)
+
+    def _compute_circular_synchronous_lc_rv_curve(self, **kwargs):
+        return lcrv.compute_circular_synchronous_lc_rv_curve(self, **kwargs)
+
+    def _compute_circular_spotty_asynchronous_lc_rv_curve(self, **kwargs):
+        return lcrv.compute_circular_spotty_asynchronous_lc_rv_curve(self, **kwargs)
+
+    def _compute_circular_pulsating_lc_rv_curve(self, **kwargs):
+        return lcrv.compute_circular_pulsating_lc_rv_curve(self, **kwargs)
+
+    def _compute_eccentric_spotty_lc_rv_curve(self, **kwargs):
+        return lcrv.compute_eccentric_spotty_lc_rv_curve(self, **kwargs)
+
+    def _compute_eccentric_lc_rv_curve_no_spots(self, **kwargs):
+        return lcrv.compute_eccentric_lc_rv_curve_no_spots(self, **kwargs)
@@ -1,3 +1,6 @@
+import threading
+
+
 class Buffer(object):
     """
     Buffers for parameters loaded from external files in singleton format
@@ -8,6 +11,15 @@ class Buffer(object):
 
     LD_CFS_TABLES = dict()
     ATMOSPHERE_TABLES = dict()
+    # face topologies of triangulated surfaces (see `elisa.base.surface.faces.convex_hull_triangulation`)
+    SURFACE_TOPOLOGIES = dict()
+    SURFACE_TOPOLOGIES_MAX_STORAGE = 10
+    # solutions of radius solvers used as initial guesses (see `elisa.binary_system.radius.get_solver_seed`)
+    SOLVER_SEEDS = dict()
+    SOLVER_SEEDS_MAX_STORAGE = 20
+
+    # guards modifications of buffers shared by concurrently running threads
+    LOCK = threading.RLock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -20,22 +32,40 @@ class Buffer(object):
         return {
             "LD_CFS_TABLES": cls.LD_CFS_TABLES,
             "ATMOSPHERE_TABLES": cls.ATMOSPHERE_TABLES,
+            "SURFACE_TOPOLOGIES": cls.SURFACE_TOPOLOGIES,
+            "SOLVER_SEEDS": cls.SOLVER_SEEDS,
+            "SOLVER_SEEDS_MAX_STORAGE": cls.SOLVER_SEEDS_MAX_STORAGE,
             "MAX_STORAGE": cls.MAX_STORAGE
         }
 
     @classmethod
-    def reduce_buffer(cls, storage):
+    def reduce_buffer(cls, storage, max_storage=None):
         """
         If buffer exceeds allowed size, the first items are deleted.
 
         :param storage: Dict; buffer
+        :param max_storage: int; allowed size of the buffer, default is `MAX_STORAGE`
         :return: Dict; reduced buffer
         """
-        if len(storage) > cls.MAX_STORAGE:
-            start_idx = len(storage)-cls.MAX_STORAGE
-            for key in list(storage.keys())[:start_idx]:
-                del storage[key]
+        max_storage = cls.MAX_STORAGE if max_storage is None else max_storage
+        with cls.LOCK:
+            if len(storage) > max_storage:
+                start_idx = len(storage)-max_storage
+                for key in list(storage.keys())[:start_idx]:
+                    del storage[key]
         return storage
 
+    @classmethod
+    def store(cls, storage, key, value):
+        """
+        Thread-safe insertion of the item to the buffer.
+
+        :param storage: Dict; buffer
+        :param key: str;
+        :param value: object;
+        """
+        with cls.LOCK:
+            storage[key] = value
+
 
 buffer = Buffer()
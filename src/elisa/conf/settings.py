@@ -1,10 +1,13 @@
 import json
 import os
+import threading
 import warnings
 import numpy as np
 import os.path as op
 
 from configparser import ConfigParser
+from contextlib import contextmanager
+from contextvars import ContextVar
 from logging import config as log_conf
 from os.path import dirname, isdir
 
@@ -13,6 +16,11 @@ from .. managers.settings_manager import SettingsManager, DefaultSettings
 
 
 first_time_user = False
+# settings overridden within the current context (thread or asyncio task), see `Settings.context`
+_context_overrides = ContextVar('elisa_settings_overrides', default=None)
+# number of contexts entered in any thread, lookup of overrides is installed only while some context is active
+_active_contexts = 0
+_active_contexts_lock = threading.Lock()
 c_parse = ConfigParser()
 env_variable_config = os.environ.get('ELISA_CONFIG', '')
 venv_config = op.join(os.environ.get('VIRTUAL_ENV', ''), 'conf', 'elisa_conf.ini')
@@ -32,6 +40,16 @@ else:
     SettingsManager.run()
 
 
+def _context_getattribute(self, item):
+    """
+    Attribute lookup of `Settings` instance used while some `Settings.context` is active.
+    """
+    overrides = _context_overrides.get()
+    if overrides is not None and item in overrides:
+        return overrides[item]
+    return object.__getattribute__(self, item)
+
+
 class _Const(object):
     # PASSBAND RELATED *************************************************************************************************
     PASSBANDS = [
@@ -164,6 +182,67 @@ class Settings(_Const, DefaultSettings):
 
         return cls._instance
 
+    @classmethod
+    @contextmanager
+    def context(cls, **kwargs):
+        """
+        Overrides settings only within the current context (thread or asyncio task) and nested function calls.
+        Global settings and settings seen by other threads are not affected, therefore independent systems can be
+        evaluated with different settings concurrently in a thread pool::
+
+            def task(system, ld_law):
+                with settings.context(LIMB_DARKENING_LAW=ld_law, NUMBER_OF_PROCESSES=1):
+                    return Observer(passband=['Generic.Bessell.V'], system=system).lc(phases=phases)
+
+            with ThreadPoolExecutor(4) as executor:
+                curves = list(executor.map(task, systems, ld_laws))
+
+        Each thread starts with an empty context, therefore the context has to be entered within the task itself.
+        Contexts can be nested, inner context inherits overrides of the outer one.
+
+        Overrides are visible only through the `settings` instance (`settings.X`), class-level reads (`Settings.X`,
+        `cls.X` within class methods) always return global values. Attribute lookup of the instance is intercepted only
+        while some context is active, so reading settings outside of contexts is not slowed down.
+
+        :param kwargs: Dict; overridden settings
+        """
+        for key in kwargs:
+            if not hasattr(cls, key):
+                raise ValueError("You are about to set configuration which doesn't exist")
+
+        overrides = dict(cls.context_overrides(), **kwargs)
+        if {'CK04_ATM_TABLES', 'K93_ATM_TABLES'} & set(kwargs):
+            overrides['ATLAS_TO_BASE_DIR'] = dict(cls.ATLAS_TO_BASE_DIR, **cls._atlas_to_base_dir(
+                overrides.get('CK04_ATM_TABLES', cls.CK04_ATM_TABLES),
+                overrides.get('K93_ATM_TABLES', cls.K93_ATM_TABLES)
+            ))
+
+        global _active_contexts
+        with _active_contexts_lock:
+            if _active_contexts == 0:
+                cls.__getattribute__ = _context_getattribute
+            _active_contexts += 1
+
+        token = _context_overrides.set(overrides)
+        try:
+            yield
+        finally:
+            _context_overrides.reset(token)
+            with _active_contexts_lock:
+                _active_contexts -= 1
+                if _active_contexts == 0:
+                    del cls.__getattribute__
+
+    @staticmethod
+    def context_overrides():
+        """
+        Returns settings overridden in the current context, e.g. to transfer them to the worker processes.
+
+        :return: Dict;
+        """
+        overrides = _context_overrides.get()
+        return dict() if overrides is None else dict(overrides)
+
     @classmethod
     def settings_serializer(cls):
         return {
@@ -174,6 +253,9 @@ class Settings(_Const, DefaultSettings):
             "HOME": cls.HOME,
             "REFLECTION_EFFECT": cls.REFLECTION_EFFECT,
             "REFLECTION_EFFECT_ITERATIONS": cls.REFLECTION_EFFECT_ITERATIONS,
+            "REFLECTION_EFFECT_MEMORY_LIMIT": cls.REFLECTION_EFFECT_MEMORY_LIMIT,
+            "REFLECTION_EFFECT_SPARSITY_THRESHOLD": cls.REFLECTION_EFFECT_SPARSITY_THRESHOLD,
+            "REFLECTION_EFFECT_OPENING_ANGLE": cls.REFLECTION_EFFECT_OPENING_ANGLE,
             "LIMB_DARKENING_LAW": cls.LIMB_DARKENING_LAW,
             "DEFAULT_TEMPERATURE_PERTURBATION_PHASE_SHIFT": cls.DEFAULT_TEMPERATURE_PERTURBATION_PHASE_SHIFT,
             "SURFACE_DISPLACEMENT_TOL": cls.SURFACE_DISPLACEMENT_TOL,
@@ -185,6 +267,7 @@ class Settings(_Const, DefaultSettings):
             "NUMBER_OF_THREADS": cls.NUMBER_OF_THREADS,
             "NUMBER_OF_PROCESSES": cls.NUMBER_OF_PROCESSES,
             "NUMBER_OF_MCMC_PROCESSES": cls.NUMBER_OF_MCMC_PROCESSES,
+            "MCMC_CORE_BUDGET": cls.MCMC_CORE_BUDGET,
             "MAX_NU_SEPARATION": cls.MAX_NU_SEPARATION,
             "MAX_D_FLUX": cls.MAX_D_FLUX,
             "MAX_SPOT_D_LONGITUDE": cls.MAX_SPOT_D_LONGITUDE,
@@ -206,6 +289,9 @@ class Settings(_Const, DefaultSettings):
             "USE_INTERPOLATION_APPROXIMATION": cls.USE_INTERPOLATION_APPROXIMATION,
             "USE_SYMMETRICAL_COUNTERPARTS_APPROXIMATION": cls.USE_SYMMETRICAL_COUNTERPARTS_APPROXIMATION,
             "USE_SIMILAR_NEIGHBOURS_APPROXIMATION": cls.USE_SIMILAR_NEIGHBOURS_APPROXIMATION,
+            "USE_RIGID_SPOT_ROTATION": cls.USE_RIGID_SPOT_ROTATION,
+            "USE_SINGLE_PRECISION_SURFACE_PARAMS": cls.USE_SINGLE_PRECISION_SURFACE_PARAMS,
+            "USE_CONCURRENT_COMPONENT_BUILD": cls.USE_CONCURRENT_COMPONENT_BUILD,
             "MAGNITUDE_SYSTEM": cls.MAGNITUDE_SYSTEM
         }
 
@@ -278,6 +364,20 @@ class Settings(_Const, DefaultSettings):
             cls.REFLECTION_EFFECT = c_parse.getboolean('physics', 'reflection_effect', fallback=cls.REFLECTION_EFFECT)
             cls.REFLECTION_EFFECT_ITERATIONS = c_parse.getint('physics', 'reflection_effect_iterations',
                                                               fallback=cls.REFLECTION_EFFECT_ITERATIONS)
+            cls.REFLECTION_EFFECT_MEMORY_LIMIT = c_parse.getfloat('physics', 'reflection_effect_memory_limit',
+                                                                  fallback=cls.REFLECTION_EFFECT_MEMORY_LIMIT)
+            if cls.REFLECTION_EFFECT_MEMORY_LIMIT <= 0:
+                raise ValueError("Invalid value for `reflection_effect_memory_limit`, allowed > 0")
+            cls.REFLECTION_EFFECT_SPARSITY_THRESHOLD = c_parse.getfloat(
+                'physics', 'reflection_effect_sparsity_threshold', fallback=cls.REFLECTION_EFFECT_SPARSITY_THRESHOLD
+            )
+            if not 0.0 <= cls.REFLECTION_EFFECT_SPARSITY_THRESHOLD < 1.0:
+                raise ValueError("Invalid value for `reflection_effect_sparsity_threshold`, allowed <0, 1)")
+            cls.REFLECTION_EFFECT_OPENING_ANGLE = c_parse.getfloat(
+                'physics', 'reflection_effect_opening_angle', fallback=cls.REFLECTION_EFFECT_OPENING_ANGLE
+            )
+            if cls.REFLECTION_EFFECT_OPENING_ANGLE < 0:
+                raise ValueError("Invalid value for `reflection_effect_opening_angle`, allowed >= 0")
             cls.LIMB_DARKENING_LAW = c_parse.get('physics', 'limb_darkening_law', fallback=cls.LIMB_DARKENING_LAW)
             if cls.LIMB_DARKENING_LAW not in ['linear', 'cosine', 'logarithmic', 'square_root']:
                 raise ValueError(f'{cls.LIMB_DARKENING_LAW} is not valid name of limb darkening law. '
@@ -319,6 +419,12 @@ class Settings(_Const, DefaultSettings):
                     warnings.warn("argument number_of_mcmc_processes is too big, fallback to number of machine cores")
                 cls.NUMBER_OF_MCMC_PROCESSES = int(os.cpu_count())
 
+            cls.MCMC_CORE_BUDGET = c_parse.getint('computational', 'mcmc_core_budget', fallback=cls.MCMC_CORE_BUDGET)
+            if cls.MCMC_CORE_BUDGET > os.cpu_count():
+                if not cls.SUPPRESS_WARNINGS:
+                    warnings.warn("argument mcmc_core_budget is too big, fallback to number of machine cores")
+                cls.MCMC_CORE_BUDGET = int(os.cpu_count())
+
             cls.MAX_NU_SEPARATION = c_parse.getfloat('computational', 'max_nu_separation',
                                                      fallback=cls.MAX_NU_SEPARATION)
             cls.MAX_D_FLUX = c_parse.getfloat('computational', 'max_d_flux', fallback=cls.MAX_D_FLUX)
@@ -366,6 +472,19 @@ class Settings(_Const, DefaultSettings):
                 fallback=cls.USE_SIMILAR_NEIGHBOURS_APPROXIMATION
             )
 
+            cls.USE_RIGID_SPOT_ROTATION = c_parse.getboolean(
+                'computational', 'use_rigid_spot_rotation', fallback=cls.USE_RIGID_SPOT_ROTATION
+            )
+
+            cls.USE_SINGLE_PRECISION_SURFACE_PARAMS = c_parse.getboolean(
+                'computational', 'use_single_precision_surface_params',
+                fallback=cls.USE_SINGLE_PRECISION_SURFACE_PARAMS
+            )
+
+            cls.USE_CONCURRENT_COMPONENT_BUILD = c_parse.getboolean(
+                'computational', 'use_concurrent_component_build', fallback=cls.USE_CONCURRENT_COMPONENT_BUILD
+            )
+
         # **************************************************************************************************************
         if c_parse.has_section('support'):
             cls.LD_TABLES = c_parse.get('support', 'ld_tables', fallback=cls.LD_TABLES)
@@ -407,17 +526,21 @@ class Settings(_Const, DefaultSettings):
             cls.MAGNITUDE_SYSTEM = c_parse.get('support', 'magnitude_system', fallback='vega')
         # **************************************************************************************************************
 
+    @staticmethod
+    def _atlas_to_base_dir(ck04_tables, k93_tables):
+        return {
+            "castelli": ck04_tables,
+            "castelli-kurucz": ck04_tables,
+            "ck": ck04_tables,
+            "ck04": ck04_tables,
+            "kurucz": k93_tables,
+            "k": k93_tables,
+            "k93": k93_tables
+        }
+
     @classmethod
     def _update_atlas_to_base_dir(cls):
-        cls.ATLAS_TO_BASE_DIR.update({
-            "castelli": cls.CK04_ATM_TABLES,
-            "castelli-kurucz": cls.CK04_ATM_TABLES,
-            "ck": cls.CK04_ATM_TABLES,
-            "ck04": cls.CK04_ATM_TABLES,
-            "kurucz": cls.K93_ATM_TABLES,
-            "k": cls.K93_ATM_TABLES,
-            "k93": cls.K93_ATM_TABLES
-        })
+        cls.ATLAS_TO_BASE_DIR.update(cls._atlas_to_base_dir(cls.CK04_ATM_TABLES, cls.K93_ATM_TABLES))
 
 
 settings = Settings()
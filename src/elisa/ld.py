@@ -117,11 +117,12 @@ def interpolate_on_ld_grid(temperature, log_g, metallicity, passband, author=Non
 
         # for table in relevant_tables:
         for table in relevant_tables:
-            if table in buffer.LD_CFS_TABLES:
-                _df = buffer.LD_CFS_TABLES[table]
-            else:
+            # tables are buffered under full path since the location of tables may differ in settings contexts
+            buffer_key = os.path.join(settings.LD_TABLES, table)
+            _df = buffer.LD_CFS_TABLES.get(buffer_key)
+            if _df is None:
                 _df = get_ld_table_by_name(table)[csv_columns]
-                buffer.LD_CFS_TABLES[table] = _df
+                buffer.store(buffer.LD_CFS_TABLES, buffer_key, _df)
             df = df.append(_df)
         buffer.reduce_buffer(buffer.LD_CFS_TABLES)
 
@@ -16,6 +16,9 @@ class DefaultSettings(object):
     # physics
     REFLECTION_EFFECT = True
     REFLECTION_EFFECT_ITERATIONS = 2
+    REFLECTION_EFFECT_MEMORY_LIMIT = 1024.0  # in MB
+    REFLECTION_EFFECT_SPARSITY_THRESHOLD = 0.0
+    REFLECTION_EFFECT_OPENING_ANGLE = 0.0
     LIMB_DARKENING_LAW = 'cosine'
     PULSATION_MODEL = 'uniform'
     DEFAULT_TEMPERATURE_PERTURBATION_PHASE_SHIFT = np.pi / 3.0
@@ -30,6 +33,7 @@ class DefaultSettings(object):
     NUMBER_OF_THREADS = 1
     NUMBER_OF_PROCESSES = -1  # int(os.cpu_count())
     NUMBER_OF_MCMC_PROCESSES = -1
+    MCMC_CORE_BUDGET = -1
     MAX_NU_SEPARATION = 0.08
     MAX_D_FLUX = 2e-4
     MAX_SPOT_D_LONGITUDE = np.pi / 180.0  # in radians
@@ -43,6 +47,9 @@ class DefaultSettings(object):
     USE_INTERPOLATION_APPROXIMATION = True
     USE_SYMMETRICAL_COUNTERPARTS_APPROXIMATION = True
     USE_SIMILAR_NEIGHBOURS_APPROXIMATION = True
+    USE_RIGID_SPOT_ROTATION = False
+    USE_SINGLE_PRECISION_SURFACE_PARAMS = False
+    USE_CONCURRENT_COMPONENT_BUILD = False
 
 
     TIMER = 0.0
@@ -0,0 +1,136 @@
+from numba import jit
+import numpy as np
+
+
+@jit(nopython=True, cache=True)
+def polygon_signed_area(polygon, n_vertices):
+    """
+    Calculates signed area of the 2D polygon (positive for counter-clockwise order of vertices).
+
+    :param polygon: numpy.array; (a, 2) vertices of the polygon, only the first `n_vertices` are used
+    :param n_vertices: int; number of vertices of the polygon
+    :return: float;
+    """
+    area = 0.0
+    for ii in range(n_vertices):
+        jj = (ii + 1) % n_vertices
+        area += polygon[ii, 0] * polygon[jj, 1] - polygon[jj, 0] * polygon[ii, 1]
+    return 0.5 * area
+
+
+@jit(nopython=True, cache=True)
+def triangle_hull_intersection_areas(triangles, hull):
+    """
+    Calculates areas of intersections of the triangles with convex polygon using Sutherland–Hodgman clipping of each
+    triangle by the edges of the polygon.
+
+    :param triangles: numpy.array; (a, 3, 2) vertices of the triangles
+    :param hull: numpy.array; (b, 2) vertices of the convex polygon ordered in either direction
+    :return: numpy.array; (a, ) areas of the intersections
+    """
+    n_hull = hull.shape[0]
+    # orientation of the hull, the inner side of each edge is on the left for counter-clockwise hull
+    orientation = 1.0 if polygon_signed_area(hull, n_hull) >= 0.0 else -1.0
+
+    # each clipping edge adds at most one vertex to the clipped polygon
+    max_vertices = 3 + n_hull
+    subject = np.empty((max_vertices, 2))
+    clipped = np.empty((max_vertices, 2))
+    distances = np.empty(max_vertices)
+    result = np.zeros(triangles.shape[0])
+
+    for tt in range(triangles.shape[0]):
+        n_subject = 3
+        for ii in range(3):
+            subject[ii, 0] = triangles[tt, ii, 0]
+            subject[ii, 1] = triangles[tt, ii, 1]
+
+        for ee in range(n_hull):
+            a_y, a_z = hull[ee, 0], hull[ee, 1]
+            e_y, e_z = hull[(ee + 1) % n_hull, 0] - a_y, hull[(ee + 1) % n_hull, 1] - a_z
+
+            # oriented distances of vertices from the edge (positive inside)
+            outside = False
+            for ii in range(n_subject):
+                distances[ii] = orientation * (e_y * (subject[ii, 1] - a_z) - e_z * (subject[ii, 0] - a_y))
+                outside = outside or distances[ii] < 0.0
+            if not outside:
+                continue
+
+            n_clipped = 0
+            for ii in range(n_subject):
+                jj = (ii + 1) % n_subject
+                d_i, d_j = distances[ii], distances[jj]
+                if d_i >= 0.0:
+                    clipped[n_clipped, 0] = subject[ii, 0]
+                    clipped[n_clipped, 1] = subject[ii, 1]
+                    n_clipped += 1
+                if (d_i >= 0.0) != (d_j >= 0.0):
+                    ratio = d_i / (d_i - d_j)
+                    clipped[n_clipped, 0] = subject[ii, 0] + ratio * (subject[jj, 0] - subject[ii, 0])
+                    clipped[n_clipped, 1] = subject[ii, 1] + ratio * (subject[jj, 1] - subject[ii, 1])
+                    n_clipped += 1
+
+            n_subject = n_clipped
+            for ii in range(n_subject):
+                subject[ii, 0] = clipped[ii, 0]
+                subject[ii, 1] = clipped[ii, 1]
+            if n_subject < 3:
+                break
+
+        if n_subject >= 3:
+            result[tt] = abs(polygon_signed_area(subject, n_subject))
+
+    return result
+
+
+@jit(nopython=True, cache=True)
+def points_in_convex_polygon(points, polygon):
+    """
+    Tests whether points lie inside the convex polygon. Points outside of the circle circumscribed around the centre
+    of the polygon and points inside the circle inscribed into the polygon are resolved without the test against
+    each edge of the polygon.
+
+    :param points: numpy.array; (a, 2) tested points
+    :param polygon: numpy.array; (b, 2) vertices of the convex polygon ordered in either direction
+    :return: numpy.array; (a, ) bool, True for points inside the polygon
+    """
+    n_vertices = polygon.shape[0]
+    orientation = 1.0 if polygon_signed_area(polygon, n_vertices) >= 0.0 else -1.0
+
+    c_y, c_z = 0.0, 0.0
+    for ii in range(n_vertices):
+        c_y += polygon[ii, 0] / n_vertices
+        c_z += polygon[ii, 1] / n_vertices
+
+    outer_radius_sqr, inner_radius = 0.0, np.inf
+    for ii in range(n_vertices):
+        jj = (ii + 1) % n_vertices
+        outer_radius_sqr = max(outer_radius_sqr, (polygon[ii, 0] - c_y) ** 2 + (polygon[ii, 1] - c_z) ** 2)
+        e_y, e_z = polygon[jj, 0] - polygon[ii, 0], polygon[jj, 1] - polygon[ii, 1]
+        length = (e_y ** 2 + e_z ** 2) ** 0.5
+        if length > 0.0:
+            distance = orientation * (e_y * (c_z - polygon[ii, 1]) - e_z * (c_y - polygon[ii, 0])) / length
+            inner_radius = min(inner_radius, distance)
+    inner_radius_sqr = max(inner_radius, 0.0) ** 2
+
+    result = np.empty(points.shape[0], dtype=np.bool_)
+    for pp in range(points.shape[0]):
+        distance_sqr = (points[pp, 0] - c_y) ** 2 + (points[pp, 1] - c_z) ** 2
+        if distance_sqr > outer_radius_sqr:
+            result[pp] = False
+            continue
+        if distance_sqr < inner_radius_sqr:
+            result[pp] = True
+            continue
+
+        inside = True
+        for ii in range(n_vertices):
+            jj = (ii + 1) % n_vertices
+            e_y, e_z = polygon[jj, 0] - polygon[ii, 0], polygon[jj, 1] - polygon[ii, 1]
+            if orientation * (e_y * (points[pp, 1] - polygon[ii, 1]) - e_z * (points[pp, 0] - polygon[ii, 0])) < 0.0:
+                inside = False
+                break
+        result[pp] = inside
+
+    return result
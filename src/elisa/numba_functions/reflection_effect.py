@@ -1,7 +1,11 @@
-from numba import jit
+from numba import jit, prange
 import numpy as np
 
 
+# codes of limb darkening laws supported by numba kernels
+LD_LAW_CODES = {'linear': 0, 'cosine': 0, 'logarithmic': 1, 'square_root': 2}
+
+
 @jit(nopython=True, cache=True)
 def gamma_primary(normals, join_vector):
     """
@@ -41,3 +45,93 @@ def gamma_secondary(normals, join_vector):
 
     return result
 
+
+@jit(nopython=True, cache=True)
+def irradiation_row(result, ii, receiver_centres, receiver_normals, emitter_centres, emitter_normals, emitter_ldc,
+                    ld_law):
+    """
+    Fills `ii`-th row of irradiation matrix by::
+
+        Q_ij * D(gamma_j)
+
+    where QAB = (cos gamma_i)*cos(gamma_j)/d_ij**2 and D(gamma_j) is limb darkening factor of irradiating face `j`.
+    Distances, direction cosines and limb darkening factors are evaluated on the fly, so no auxiliary matrices are
+    allocated.
+
+    :param result: numpy.array; (a, b) irradiation matrix
+    :param ii: int; index of irradiated face
+    :param receiver_centres: numpy.array; (a, 3) centres of irradiated faces
+    :param receiver_normals: numpy.array; (a, 3) normals of irradiated faces
+    :param emitter_centres: numpy.array; (b, 3) centres of irradiating faces
+    :param emitter_normals: numpy.array; (b, 3) normals of irradiating faces
+    :param emitter_ldc: numpy.array; (c, b) limb darkening coefficients of irradiating faces
+    :param ld_law: int; code of limb darkening law from `LD_LAW_CODES`
+    """
+    for jj in range(emitter_centres.shape[0]):
+        d_x = emitter_centres[jj, 0] - receiver_centres[ii, 0]
+        d_y = emitter_centres[jj, 1] - receiver_centres[ii, 1]
+        d_z = emitter_centres[jj, 2] - receiver_centres[ii, 2]
+        distance_sqr = d_x ** 2 + d_y ** 2 + d_z ** 2
+        distance = distance_sqr ** 0.5
+
+        # non visible face combinations do not contribute
+        cos_receiver = (receiver_normals[ii, 0] * d_x + receiver_normals[ii, 1] * d_y +
+                        receiver_normals[ii, 2] * d_z) / distance
+        cos_emitter = - (emitter_normals[jj, 0] * d_x + emitter_normals[jj, 1] * d_y +
+                         emitter_normals[jj, 2] * d_z) / distance
+        if cos_receiver <= 0.0 or cos_emitter <= 0.0:
+            result[ii, jj] = 0.0
+            continue
+
+        if ld_law == 0:
+            ld_factor = 1.0 - emitter_ldc[0, jj] + emitter_ldc[0, jj] * cos_emitter
+        elif ld_law == 1:
+            ld_factor = 1.0 - emitter_ldc[0, jj] * (1.0 - cos_emitter) - \
+                        emitter_ldc[1, jj] * cos_emitter * np.log(cos_emitter)
+        else:
+            ld_factor = 1.0 - emitter_ldc[0, jj] * (1.0 - cos_emitter) - \
+                        emitter_ldc[1, jj] * (1.0 - cos_emitter ** 0.5)
+
+        result[ii, jj] = cos_receiver * cos_emitter / distance_sqr * ld_factor
+
+
+@jit(nopython=True, cache=True)
+def irradiation_matrix(receiver_centres, receiver_normals, emitter_centres, emitter_normals, emitter_ldc, ld_law):
+    """
+    Calculates matrix of contributions of irradiating faces to irradiated faces Q_ij * D(gamma_j).
+
+    :param receiver_centres: numpy.array; (a, 3) centres of irradiated faces
+    :param receiver_normals: numpy.array; (a, 3) normals of irradiated faces
+    :param emitter_centres: numpy.array; (b, 3) centres of irradiating faces
+    :param emitter_normals: numpy.array; (b, 3) normals of irradiating faces
+    :param emitter_ldc: numpy.array; (c, b) limb darkening coefficients of irradiating faces
+    :param ld_law: int; code of limb darkening law from `LD_LAW_CODES`
+    :return: numpy.array; (a, b)
+    """
+    result = np.empty((receiver_centres.shape[0], emitter_centres.shape[0]))
+    for ii in range(receiver_centres.shape[0]):
+        irradiation_row(result, ii, receiver_centres, receiver_normals, emitter_centres, emitter_normals,
+                        emitter_ldc, ld_law)
+    return result
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def irradiation_matrix_parallel(receiver_centres, receiver_normals, emitter_centres, emitter_normals, emitter_ldc,
+                                ld_law):
+    """
+    Multithreaded version of `irradiation_matrix`, rows of irradiated faces are distributed among numba threads.
+    Has to be called only from the main thread of the main process (see `elisa.utils.numba_threads`).
+
+    :param receiver_centres: numpy.array; (a, 3) centres of irradiated faces
+    :param receiver_normals: numpy.array; (a, 3) normals of irradiated faces
+    :param emitter_centres: numpy.array; (b, 3) centres of irradiating faces
+    :param emitter_normals: numpy.array; (b, 3) normals of irradiating faces
+    :param emitter_ldc: numpy.array; (c, b) limb darkening coefficients of irradiating faces
+    :param ld_law: int; code of limb darkening law from `LD_LAW_CODES`
+    :return: numpy.array; (a, b)
+    """
+    result = np.empty((receiver_centres.shape[0], emitter_centres.shape[0]))
+    for ii in prange(receiver_centres.shape[0]):
+        irradiation_row(result, ii, receiver_centres, receiver_normals, emitter_centres, emitter_normals,
+                        emitter_ldc, ld_law)
+    return result
@@ -1,11 +1,131 @@
+import os
+import multiprocessing
+import numba
+
 from multiprocessing.pool import Pool
 
 from .. import utils
 from .. logger import getLogger
 from .. import settings
 
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
 logger = getLogger('observer.mp')
 
+# environment variables limiting thread pools of BLAS/OpenMP libraries, inherited by the child processes
+THREAD_LIMIT_VARIABLES = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS',
+                          'NUMEXPR_NUM_THREADS']
+
+# estimated fraction of the curve computation which is not split between phase-level processes (system build,
+# start-up of the pool, transfer of results)
+INNER_SERIAL_FRACTION = 0.25
+
+
+class NonDaemonProcess(multiprocessing.Process):
+    """
+    Process which is allowed to have children (e.g. pool of phase-level workers within walker-level worker).
+    """
+    @property
+    def daemon(self):
+        return False
+
+    @daemon.setter
+    def daemon(self, value):
+        pass
+
+
+class NonDaemonContext(type(multiprocessing.get_context())):
+    Process = NonDaemonProcess
+
+
+class NestablePool(Pool):
+    """
+    Pool of non-daemonic worker processes which can create their own pools.
+    """
+    def __init__(self, *args, **kwargs):
+        kwargs['context'] = NonDaemonContext()
+        super(NestablePool, self).__init__(*args, **kwargs)
+
+
+def limit_threads(n_threads):
+    """
+    Limits number of threads used by BLAS/OpenMP libraries and numba parallel kernels in the current process and
+    in processes started from it, so nested parallelism does not oversubscribe the cores.
+
+    :param n_threads: int;
+    """
+    n_threads = max(int(n_threads), 1)
+    for variable in THREAD_LIMIT_VARIABLES:
+        os.environ[variable] = str(n_threads)
+    # libraries already loaded in the process do not read environment variables again
+    if threadpool_limits is not None:
+        threadpool_limits(limits=n_threads)
+    try:
+        numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+    except Exception as e:
+        logger.debug(f'unable to limit numba threads: {e}')
+
+
+def split_core_budget(n_cores, n_tasks, n_points):
+    """
+    Splits cores between outer (e.g. MCMC walkers) and inner (phases of the curve) level of parallelism.
+    Outer level is preferred since it does not require inter-process communication within task. Split minimizes
+    the wall time estimated as the number of rounds of outer tasks over the inner speed-up given by Amdahl's law
+    with serial fraction `INNER_SERIAL_FRACTION`.
+
+    :param n_cores: int; total number of available cores
+    :param n_tasks: int; number of outer tasks evaluated concurrently
+    :param n_points: int; number of phases (orbital positions) of single task, inner level is limited by it
+    :return: Tuple[int, int]; number of outer processes, number of inner processes per outer process
+    """
+    n_cores, n_tasks, n_points = max(int(n_cores), 1), max(int(n_tasks), 1), max(int(n_points), 1)
+    best, best_cost = (1, 1), None
+    for n_outer in range(1, min(n_cores, n_tasks) + 1):
+        n_inner = min(n_cores // n_outer, n_points)
+        speed_up = n_inner / (1.0 + INNER_SERIAL_FRACTION * (n_inner - 1))
+        cost = -(-n_tasks // n_outer) / speed_up
+        # `<=` prefers higher number of outer processes with the same cost
+        if best_cost is None or cost <= best_cost:
+            best, best_cost = (n_outer, n_inner), cost
+    return best
+
+
+def init_nested_worker(n_inner, overrides):
+    """
+    Initializer of the outer worker processes. Each outer worker is allowed to run `n_inner` phase-level processes
+    and all libraries are limited to single thread.
+
+    :param n_inner: int; number of phase-level processes of the worker
+    :param overrides: Dict; settings overridden in the context of the parent process
+    """
+    settings.configure(**{**overrides, **dict(NUMBER_OF_PROCESSES=n_inner if n_inner > 1 else 1)})
+    limit_threads(1)
+
+
+def nested_pool(n_outer, n_inner):
+    """
+    Creates pool of outer worker processes. Non-daemonic workers are used only if they require pools of their own.
+
+    :param n_outer: int; number of outer processes
+    :param n_inner: int; number of phase-level processes of each outer process
+    :return: multiprocessing.pool.Pool;
+    """
+    pool_cls = NestablePool if n_inner > 1 else Pool
+    return pool_cls(processes=n_outer, initializer=init_nested_worker,
+                    initargs=(n_inner, settings.context_overrides()))
+
+
+def init_worker(overrides):
+    """
+    Initializer of the worker processes applying settings overridden in the context of the parent process.
+
+    :param overrides: Dict; see `settings.context`
+    """
+    settings.configure(**overrides)
+
 
 def manage_observations(fn, fn_args, position, **kwargs):
     """
@@ -21,7 +141,9 @@ def manage_observations(fn, fn_args, position, **kwargs):
     if len(position) >= settings.NUMBER_OF_PROCESSES > 1:
         logger.info("starting multiprocessor workers")
         phase_batches = utils.split_to_batches(array=position, n_proc=settings.NUMBER_OF_PROCESSES)
-        pool = Pool(processes=settings.NUMBER_OF_PROCESSES)
+        # context-local settings are not inherited by the worker processes
+        pool = Pool(processes=settings.NUMBER_OF_PROCESSES, initializer=init_worker,
+                    initargs=(settings.context_overrides(), ))
 
         result = [pool.apply_async(fn, args[:2] + (batch, ) + args[2:]) for batch in phase_batches]
         pool.close()
@@ -1,8 +1,10 @@
 import os
 import sys
+import asyncio
 import numpy as np
 import pandas as pd
 
+from copy import copy
 from . import utils as outils
 from .plot import Plot
 from .passband import PassbandContainer, init_bolometric_passband
@@ -23,6 +25,11 @@ class Observables(object):
     def __init__(self, observer):
         self.observer = observer
 
+    def __call__(self, lc=True, rv=True, from_phase=None, to_phase=None, phase_step=None, phases=None,
+                 from_time=None, to_time=None, time_step=None, times=None):
+        return self.observer.lc_rv(lc, rv, from_phase, to_phase, phase_step, phases,
+                                   from_time, to_time, time_step, times)
+
     def lc(self, from_phase=None, to_phase=None, phase_step=None, phases=None, normalize=False,
            from_time=None, to_time=None, time_step=None, times=None, flux_unit=None):
         return self.observer.lc(from_phase, to_phase, phase_step, phases, normalize,
@@ -33,9 +40,35 @@ class Observables(object):
         return self.observer.rv(from_phase, to_phase, phase_step, phases, normalize, method,
                                 from_time, to_time, time_step, times)
 
+    async def lc_async(self, *args, **kwargs):
+        return await self.observer.lc_async(*args, **kwargs)
+
+    async def rv_async(self, *args, **kwargs):
+        return await self.observer.rv_async(*args, **kwargs)
+
+
+def _observe(observer, method, args, kwargs, overrides=None):
+    """
+    Runs the observation of given kind. Module level function, so it can be submitted to the process pool executor.
+
+    :param observer: elisa.observer.observer.Observer;
+    :param method: str; `lc` or `rv`
+    :param args: Tuple; positional arguments of the observation method
+    :param kwargs: Dict; keyword arguments of the observation method
+    :param overrides: Dict; context-local settings of the caller, see `settings.context`
+    :return: Tuple[elisa.observer.observer.Observer, Tuple]; observer in state after observation and its result
+    """
+    with settings.context(**(overrides or dict())):
+        result = getattr(observer, method)(*args, **kwargs)
+    return observer, result
+
 
 class Observer(object):
-    def __init__(self, passband=None, system=None):
+    # attributes which are bound to the running process or to the instance itself and they are not transferred to the
+    # executor workers (`plot` and `observe` are rebuilt for the new instance)
+    _NOT_SERIALIZABLE = ['executor', '_async_limit', 'plot', 'observe']
+
+    def __init__(self, passband=None, system=None, executor=None, max_concurrency=None):
         """
         The observer class is responsible for the calculation of synthetic observations. Initialization of the Observer
         class instance requires the initialized System instance (SingleSystem, BinarySystem) and in case of light curves
@@ -52,6 +85,14 @@ class Observer(object):
         `observer_instance.lc` or `observer_instance.rv` (see documentation for the respective function for
         further details).
 
+        Both observations have also awaitable counterparts `observer_instance.lc_async` and
+        `observer_instance.rv_async` which run the observation in the `executor` supplied during initialization
+        (default executor of the running event loop is used otherwise)::
+
+            observer = Observer(passband=['Generic.Bessell.V'], system=binary,
+                                executor=ProcessPoolExecutor(4), max_concurrency=4)
+            phases, fluxes = await observer.lc_async(phases=phases)
+
         After initialization, the following attributes are available for each instances of Observer class:
 
             - left_bandwidth, right_bandwidth: the smallest interval of wavelengths encompassing all desired passbands
@@ -60,6 +101,8 @@ class Observer(object):
 
         :param passband: Union[string, list]; for valid filter name see settings.py file
         :param system: Union[SingleSystem, BinarySystem]; system instance (BinarySystem or SingleSystem)
+        :param executor: concurrent.futures.Executor; thread or process pool executor used by asynchronous observations
+        :param max_concurrency: int; maximal number of concurrently running asynchronous observations
         """
         if passband is None:
             passband = list()
@@ -86,6 +129,19 @@ class Observer(object):
         self.plot = Plot(self)
         self.observe = Observables(self)
 
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._async_limit = None
+
+    def __getstate__(self):
+        return {key: val for key, val in self.__dict__.items() if key not in self._NOT_SERIALIZABLE}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.executor, self._async_limit = None, None
+        self.plot = Plot(self)
+        self.observe = Observables(self)
+
     @property
     def system_cls(self):
         return self._system_cls
@@ -176,20 +232,25 @@ class Observer(object):
                                        provided the supplied 'from_phase`, `to_phase` `phase_step` becomes irrelevant
         :param flux_unit: astropy.Units; unit of flux
         :return: Dict;
+
+        Phases (or times) can be also supplied separately for each passband as dictionary
+        {passband: Iterable float, ...}. Surface geometry is then computed only once in the union of all supplied
+        phases. Fluxes of all passbands are integrated in each phase of the union, however, each light curve is
+        returned only in phases requested for its passband. In such case, `phases` attribute of the observer is
+        dictionary {passband: numpy.array, ...} as well.
         """
-        if normalize:
-            if flux_unit in [None, u.dimensionless_unscaled]:
-                self.flux_unit = u.dimensionless_unscaled
-            else:
-                raise ValueError('You can either produce normalized light curve or specify `flux_unit` other '
-                                 'than dimensionless unscaled. Change input parameters.')
+        self._setup_flux_unit(normalize, flux_unit)
+        if isinstance(phases, dict) or isinstance(times, dict):
+            union_phases, union_to_origin = self.manage_band_time_series(phases, times)
+            # geometry is computed only once in unique phases of all passbands
+            base_phases, base_phases_to_union = self.phase_interval_reduce(union_phases)
+            base_phases_to_origin = {band: base_phases_to_union[mask] for band, mask in union_to_origin.items()}
+            phases = {band: union_phases[mask] for band, mask in union_to_origin.items()}
         else:
-            self.flux_unit = u.Unit(flux_unit) if flux_unit is not None else self.flux_unit
-
-        phases = self.manage_time_series(from_phase, to_phase, phase_step, phases, from_time, to_time, time_step, times)
-
-        # reduce phases to only unique ones from interval (0, 1) in general case without pulsations
-        base_phases, base_phases_to_origin = self.phase_interval_reduce(phases)
+            phases = self.manage_time_series(from_phase, to_phase, phase_step, phases,
+                                             from_time, to_time, time_step, times)
+            # reduce phases to only unique ones from interval (0, 1) in general case without pulsations
+            base_phases, base_phases_to_origin = self.phase_interval_reduce(phases)
 
         logger.info(f"observation is running")
         # calculates lines of sight for corresponding phases
@@ -204,16 +265,48 @@ class Observer(object):
         )
 
         curves = self._system.compute_lightcurve(**lc_kwargs)
+        self.phases = {band: band_phases + self._system.phase_shift for band, band_phases in phases.items()} \
+            if isinstance(phases, dict) else phases + self._system.phase_shift
+        self._process_lc(curves, base_phases_to_origin, normalize)
+
+        logger.info("observation finished")
+        return self.phases, self.fluxes
 
+    def _setup_flux_unit(self, normalize, flux_unit):
+        """
+        Sets flux unit of the light curve observation.
+
+        :param normalize: bool; if True, the output is normalized to maximum=1
+        :param flux_unit: astropy.Units; unit of flux
+        """
+        if normalize:
+            if flux_unit in [None, u.dimensionless_unscaled]:
+                self.flux_unit = u.dimensionless_unscaled
+            else:
+                raise ValueError('You can either produce normalized light curve or specify `flux_unit` other '
+                                 'than dimensionless unscaled. Change input parameters.')
+        else:
+            self.flux_unit = u.Unit(flux_unit) if flux_unit is not None else self.flux_unit
+
+    def _process_lc(self, curves, base_phases_to_origin, normalize):
+        """
+        Remaps light curves calculated in base phases back to the original phases, adds additional light and
+        converts fluxes to the required units.
+
+        :param curves: Dict[str, numpy.array]; light curves in base phases
+        :param base_phases_to_origin: Union[numpy.array, Dict[str, numpy.array]]; mask reconstructing original phases
+                                      from base phases (common or for each passband separately)
+        :param normalize: bool; if True, the output is normalized to maximum=1
+        """
         # remap unique phases back to original phase interval
         for items in curves:
-            curves[items] = np.array(curves[items])[base_phases_to_origin]
+            mask = base_phases_to_origin[items] if isinstance(base_phases_to_origin, dict) else base_phases_to_origin
+            curves[items] = np.array(curves[items])[mask]
 
             # adding additional light
             correction = np.mean(curves[items]) * self._system.additional_light / (1.0 - self._system.additional_light)
             curves[items] += correction
 
-        self.phases = phases + self._system.phase_shift
         if normalize or self.flux_unit == u.dimensionless_unscaled:
             self.fluxes, _ = outils.normalize_light_curve(y_data=curves, kind='maximum', top_fraction_to_average=0.0)
         else:
@@ -228,9 +321,6 @@ class Observer(object):
             else:
                 raise ValueError(f'Unknown value for `Observer.flux_unit`: {self.flux_unit}')
 
-        logger.info("observation finished")
-        return self.phases, self.fluxes
-
     def rv(self, from_phase=None, to_phase=None, phase_step=None, phases=None, normalize=False, method=None,
            from_time=None, to_time=None, time_step=None, times=None):
         """
@@ -261,7 +351,7 @@ class Observer(object):
         # reduce phases to only unique ones from interval (0, 1) in general case without pulsations
         base_phases, base_phases_to_origin = self.phase_interval_reduce(phases)
 
-        self.radial_velocities = self._system.compute_rv(
+        radial_velocities = self._system.compute_rv(
             **dict(
                 phases=base_phases,
                 position_method=self._system.get_positions_method(),
@@ -269,18 +359,156 @@ class Observer(object):
             )
         )
 
+        self.phases = phases + self._system.phase_shift
+        self._process_rv(radial_velocities, base_phases_to_origin, normalize)
+        return self.phases, self.radial_velocities
+
+    def _process_rv(self, radial_velocities, base_phases_to_origin, normalize):
+        """
+        Remaps radial velocities calculated in base phases back to the original phases and normalizes them if
+        required.
+
+        :param radial_velocities: Dict[str, numpy.array]; radial velocities in base phases
+        :param base_phases_to_origin: numpy.array; mask reconstructing original phases from base phases
+        :param normalize: bool;
+        """
         # remap unique phases back to original phase interval
-        for items in self.radial_velocities:
-            self.radial_velocities[items] = np.array(self.radial_velocities[items])[base_phases_to_origin]
+        self.radial_velocities = {
+            items: np.array(radial_velocities[items])[base_phases_to_origin] for items in radial_velocities
+        }
 
-        self.phases = phases + self._system.phase_shift
         self.rv_unit = u.m / u.s
         if normalize:
             self.rv_unit = u.dimensionless_unscaled
             _max = np.max([np.max(item) for item in self.radial_velocities.values()])
             self.radial_velocities = {key: value / _max for key, value in self.radial_velocities.items()}
 
-        return self.phases, self.radial_velocities
+    def lc_rv(self, lc=True, rv=True, from_phase=None, to_phase=None, phase_step=None, phases=None,
+              from_time=None, to_time=None, time_step=None, times=None):
+        """
+        Joint observation of light curves and radial velocity curves at the same phases. In case of radiometric
+        radial velocities of binary systems, geometry, surface coverage and radiances are evaluated only once
+        at each orbital position and they are shared by photometric passbands and radial velocities. Otherwise
+        the observation is equivalent to the subsequent calls of `Observer.lc` and `Observer.rv`.
+
+        Usage::
+
+            phases, fluxes, rvs = observer.observe(lc=dict(normalize=True), rv=dict(method='radiometric'),
+                                                   phases=phases)
+
+        :param lc: Union[bool, Dict]; whether to observe light curves, keyword arguments (`normalize`, `flux_unit`)
+                                      of the light curve observation can be supplied as dictionary
+        :param rv: Union[bool, Dict]; whether to observe radial velocities, keyword arguments (`normalize`, `method`)
+                                      of the radial velocity observation can be supplied as dictionary
+        :param from_time: float; starting time of the observation
+        :param to_time: float; end time of the observation
+        :param time_step: float; time increment of the observations
+        :param times: Iterable float; array of times at which to perform an observations
+        :param from_phase: float; starting phase of the observation
+        :param to_phase: float; end phase of the observation
+        :param phase_step: float; phase increment of the observations
+        :param phases: Iterable float; array of phases at which to perform an observations
+        :return: Tuple[numpy.array, Dict, Dict]; phases, light curves and radial velocities
+                 (None for not observed quantity)
+        """
+        if isinstance(phases, dict) or isinstance(times, dict):
+            raise ValueError('Time series supplied for each passband separately are supported only by `Observer.lc`.')
+        time_series = dict(from_phase=from_phase, to_phase=to_phase, phase_step=phase_step, phases=phases,
+                           from_time=from_time, to_time=to_time, time_step=time_step, times=times)
+        lc_kwargs = lc if isinstance(lc, dict) else dict()
+        rv_kwargs = rv if isinstance(rv, dict) else dict()
+        method = rv_kwargs.get('method', None) or settings.RV_METHOD
+
+        joint_test = lc is not False and rv is not False and method == 'radiometric' and \
+            hasattr(self._system, 'compute_lc_rv')
+        if not joint_test:
+            fluxes = self.lc(**time_series, **lc_kwargs)[1] if lc is not False else None
+            rvs = self.rv(**time_series, **rv_kwargs)[1] if rv is not False else None
+            return self.phases, fluxes, rvs
+
+        normalize_lc = lc_kwargs.get('normalize', False)
+        self._setup_flux_unit(normalize_lc, lc_kwargs.get('flux_unit', None))
+        phases = self.manage_time_series(**time_series)
+        base_phases, base_phases_to_origin = self.phase_interval_reduce(phases)
+
+        logger.info(f"joint observation is running")
+        curves = self._system.compute_lc_rv(
+            passband=self.passband,
+            left_bandwidth=self.left_bandwidth,
+            right_bandwidth=self.right_bandwidth,
+            phases=base_phases,
+            position_method=self._system.get_positions_method()
+        )
+
+        self.phases = phases + self._system.phase_shift
+        light_curves = {band: curves[band] for band in self.passband}
+        self._process_lc(light_curves, base_phases_to_origin, normalize_lc)
+        radial_velocities = {component: curves[component] for component in settings.BINARY_COUNTERPARTS}
+        self._process_rv(radial_velocities, base_phases_to_origin, rv_kwargs.get('normalize', False))
+
+        logger.info("joint observation finished")
+        return self.phases, self.fluxes, self.radial_velocities
+
+    def _get_async_limit(self):
+        """
+        Returns semaphore limiting concurrent asynchronous observations within the running event loop.
+
+        :return: Union[asyncio.Semaphore, None];
+        """
+        if self.max_concurrency is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._async_limit is None or self._async_limit[0] is not loop:
+            self._async_limit = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._async_limit[1]
+
+    async def _observe_async(self, method, args, kwargs):
+        """
+        Schedules observation on the executor and awaits its result. Observation runs on a shallow copy of the
+        observer, so concurrent observations do not overwrite each other's results. Cancellation of the awaiting task
+        cancels observations which did not start yet.
+
+        :param method: str; `lc` or `rv`
+        :param args: Tuple; positional arguments of the observation method
+        :param kwargs: Dict; keyword arguments of the observation method
+        :return: Tuple; result of the observation method
+        """
+        async def _run():
+            loop = asyncio.get_running_loop()
+            # executor threads and processes do not share context of the caller
+            return await loop.run_in_executor(self.executor, _observe, copy(self), method, args, kwargs,
+                                              settings.context_overrides())
+
+        limit = self._get_async_limit()
+        if limit is None:
+            observer, result = await _run()
+        else:
+            async with limit:
+                observer, result = await _run()
+
+        attributes = ['phases', 'fluxes', 'magnitudes', '_flux_unit', 'zero_points'] if method == 'lc' else \
+            ['phases', 'radial_velocities', 'rv_unit']
+        for attr in attributes:
+            setattr(self, attr, getattr(observer, attr))
+        return result
+
+    async def lc_async(self, *args, **kwargs):
+        """
+        Awaitable version of `Observer.lc` evaluated in the observer's executor. Arguments are the same as in case
+        of `Observer.lc`.
+
+        :return: Tuple[numpy.array, Dict]; phases and light curves
+        """
+        return await self._observe_async('lc', args, kwargs)
+
+    async def rv_async(self, *args, **kwargs):
+        """
+        Awaitable version of `Observer.rv` evaluated in the observer's executor. Arguments are the same as in case
+        of `Observer.rv`.
+
+        :return: Tuple[numpy.array, Dict]; phases and radial velocities
+        """
+        return await self._observe_async('rv', args, kwargs)
 
     def phase_interval_reduce(self, phases):
         """
@@ -372,3 +600,30 @@ class Observer(object):
         phases = np.array(phases) - self._system.phase_shift
 
         return phases
+
+    def manage_band_time_series(self, phases=None, times=None):
+        """
+        Converts time series supplied separately for each passband into the union of photometric phases.
+
+        :param phases: Dict[str, Iterable float]; phases of the observation in each passband {passband: phases, ...}
+        :param times: Dict[str, Iterable float]; times of the observation in each passband {passband: times, ...}
+        :return: Tuple[numpy.array, Dict[str, numpy.array]]; unique phases of all passbands and masks reconstructing
+                 phases of each passband from unique phases
+        """
+        if phases is not None and times is not None:
+            raise ValueError("You specified time series in phase and time domain at once.")
+        domain = 'phases' if phases is not None else 'times'
+        series = phases if phases is not None else times
+        if not isinstance(series, dict):
+            raise ValueError(f"Time series supplied for each passband separately has to be dictionary "
+                             f"{{passband: {domain}}}.")
+        if set(series) != set(self.passband):
+            raise ValueError(f"Supplied {domain} have to cover exactly observed passbands: "
+                             f"{', '.join(self.passband)}.")
+
+        band_phases = {band: self.manage_time_series(**{domain: series[band]}) for band in self.passband}
+        union_phases, inverse = np.unique(np.concatenate([band_phases[band] for band in self.passband]),
+                                          return_inverse=True)
+        splits = np.cumsum([len(band_phases[band]) for band in self.passband])[:-1]
+        union_to_origin = dict(zip(self.passband, np.split(inverse, splits)))
+        return union_phases, union_to_origin
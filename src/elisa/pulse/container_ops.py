@@ -196,7 +196,7 @@ def velocity_perturbation(
     velocity_pert_face = velocity_pert[star.faces].mean(axis=1)
 
     if update_container:
-        star.velocities += velocity_pert_face
+        star.velocities = star.velocities + velocity_pert_face
 
     if return_perturbation:
         if spherical_perturbation:
@@ -279,7 +279,7 @@ def temp_perturbation(star, scale=1.0, update_container=False, return_perturbati
 
     temp_pert_face = temp_pert[star.faces].mean(axis=1) * star.temperatures
     if update_container:
-        star.temperatures += temp_pert_face
+        star.temperatures = star.temperatures + temp_pert_face
 
     if return_perturbation:
         return temp_pert*star.t_eff if point_perturbations else temp_pert_face
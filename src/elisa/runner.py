@@ -0,0 +1,219 @@
+"""
+Command line batch runner evaluating binary systems stored in JSON lines file (one binary definition per line in
+format accepted by `BinarySystem.from_json` or flat `component@parameter` format)::
+
+    elisa-run systems.jsonl --passband Generic.Bessell.V Generic.Bessell.B --phase-range 0 1 0.01 --processes 8
+
+Results are appended to the output JSON lines file (`systems.results.jsonl` by default) as soon as each system is
+evaluated. In case of interruption, the same command resumes the run and evaluates only systems missing in the
+output file.
+"""
+
+import argparse
+import json
+import os
+import os.path as op
+import time
+import numpy as np
+
+from tqdm import tqdm
+
+from . import settings, batch
+from . logger import getLogger
+
+logger = getLogger('runner')
+
+
+def default_output_path(path):
+    """
+    Default path of the output file derived from the path of the input file.
+
+    :param path: str; input JSON lines file
+    :return: str;
+    """
+    root, ext = op.splitext(path)
+    return f'{root}.results{ext or ".jsonl"}'
+
+
+def load_done_indices(path):
+    """
+    Reads indices of already evaluated systems from the output file of the previous run. Incomplete record at the end
+    of the file (written during interruption) is removed.
+
+    :param path: str; output JSON lines file
+    :return: Set[int];
+    """
+    done = set()
+    if not op.isfile(path):
+        return done
+
+    valid_size = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                done.add(json.loads(line.decode('utf-8'))['index'])
+            except (ValueError, KeyError, TypeError):
+                break
+            valid_size += len(line)
+
+    if valid_size < op.getsize(path):
+        logger.warning(f'removing incomplete record at the end of {path}')
+        with open(path, 'r+b') as f:
+            f.truncate(valid_size)
+    return done
+
+
+def scan_input(path):
+    """
+    Validates that each line of the input file is JSON object without keeping definitions in memory.
+
+    :param path: str; input JSON lines file
+    :return: Tuple[int, Dict[int, str]]; number of systems, errors of invalid lines {index: error message}
+    """
+    n_systems, invalid = 0, dict()
+    with open(path, 'r') as f:
+        for idx, line in enumerate(f):
+            n_systems += 1
+            try:
+                if not isinstance(json.loads(line), dict):
+                    invalid[idx] = 'ValueError: Binary system definition has to be JSON object.'
+            except ValueError as e:
+                invalid[idx] = f'JSONDecodeError: {e}'
+    return n_systems, invalid
+
+
+def iter_input(path):
+    """
+    Lazily reads binary system definitions from JSON lines file. Invalid lines are yielded as empty definitions and
+    they have to be skipped.
+
+    :param path: str; input JSON lines file
+    :return: Generator[Dict];
+    """
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield dict()
+
+
+def _record(idx, status, result, phases):
+    """
+    Creates output record of single evaluated system.
+
+    :param idx: int; index (line number) of the system in the input file
+    :param status: str; `ok`, `error` or `timeout`
+    :param result: Union[Dict, str]; curves or error message
+    :param phases: numpy.array;
+    :return: Dict;
+    """
+    if status != 'ok':
+        return dict(index=idx, status=status, error=result)
+    curves = {label: [None if np.isnan(value) else float(value) for value in curve] for label, curve in result.items()}
+    return dict(index=idx, status=status, phases=phases.tolist(), curves=curves)
+
+
+def run(path, observation, output=None, n_processes=None, timeout=None, chunksize=1, config=None, progress=True):
+    """
+    Evaluates all binary systems from JSON lines file and writes results incrementally to the output file.
+    Systems already present in the output file are not evaluated again.
+
+    :param path: str; input JSON lines file
+    :param observation: Dict; see `elisa.batch.evaluate`
+    :param output: str; output JSON lines file
+    :param n_processes: int; number of worker processes, default is `settings.NUMBER_OF_PROCESSES`
+    :param timeout: float; time limit in seconds for evaluation of each system (POSIX only)
+    :param chunksize: int; number of systems sent to the worker at once
+    :param config: Dict; settings applied in each worker
+    :param progress: bool; show progress bar
+    :return: Dict; summary of the run (numbers of `evaluated`, `failed` and `skipped` systems, `elapsed` time and
+                   `throughput` in systems per second)
+    """
+    output = default_output_path(path) if output is None else output
+    phases = np.asarray(observation['phases'], dtype=float)
+
+    done = load_done_indices(output)
+    n_systems, invalid = scan_input(path)
+    invalid = {idx: error for idx, error in invalid.items() if idx not in done}
+    skip = done | set(invalid)
+    n_todo = n_systems - len(skip)
+    if done:
+        logger.info(f'resuming run, {len(done)} out of {n_systems} systems are already evaluated')
+
+    evaluated, failed = 0, len(invalid)
+    start = time.time()
+    with open(output, 'a') as f, tqdm(total=n_todo, disable=not progress, unit='system') as progress_bar:
+        for idx, error in invalid.items():
+            f.write(json.dumps(_record(idx, 'error', error, phases)) + '\n')
+        f.flush()
+
+        results = batch.iter_batch(iter_input(path), observation, n_processes=n_processes, timeout=timeout,
+                                   chunksize=chunksize, config=config, skip=skip, ordered=False)
+        for idx, status, result in results:
+            f.write(json.dumps(_record(idx, status, result, phases)) + '\n')
+            f.flush()
+            evaluated += 1
+            failed += status != 'ok'
+            progress_bar.update(1)
+
+    elapsed = time.time() - start
+    summary = dict(
+        evaluated=evaluated,
+        failed=failed,
+        skipped=len(done),
+        elapsed=elapsed,
+        throughput=evaluated / elapsed if elapsed > 0 else np.nan
+    )
+    logger.info(f"evaluated {evaluated} systems ({failed} failed) in {elapsed:.1f} s, "
+                f"throughput {summary['throughput']:.2f} systems/s")
+    return summary
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(prog='elisa-run', description='Evaluates binary systems from JSON lines file.')
+    parser.add_argument('input', help='JSON lines file with one binary system definition per line')
+    parser.add_argument('--passband', nargs='+', default=['bolometric'], help='passbands of light curves')
+    phases = parser.add_mutually_exclusive_group(required=True)
+    phases.add_argument('--phases', nargs='+', type=float, help='photometric phases')
+    phases.add_argument('--phase-range', nargs=3, type=float, metavar=('START', 'STOP', 'STEP'),
+                        help='photometric phases from START to STOP (excluded) with STEP')
+    parser.add_argument('--no-lc', dest='lc', action='store_false', help='do not compute light curves')
+    parser.add_argument('--rv', action='store_true', help='compute radial velocity curves')
+    parser.add_argument('--rv-method', choices=['kinematic', 'radiometric'], default=None,
+                        help='method of radial velocity calculation (default: RV_METHOD setting)')
+    parser.add_argument('--normalize', action='store_true', help='normalize light curves')
+    parser.add_argument('--output', default=None, help='output JSON lines file (default: <input>.results.jsonl)')
+    parser.add_argument('--processes', dest='n_processes', type=int, default=None,
+                        help='number of worker processes (default: NUMBER_OF_PROCESSES setting)')
+    parser.add_argument('--timeout', type=float, default=None, help='time limit of single evaluation in seconds')
+    parser.add_argument('--chunksize', type=int, default=1, help='number of systems sent to worker at once')
+    parser.add_argument('--config', default=None, help='path to ELISa configuration file')
+    parser.add_argument('--no-progress', dest='progress', action='store_false', help='hide progress bar')
+    args = parser.parse_args(args)
+
+    if not op.isfile(args.input):
+        parser.error(f'input file {args.input} does not exist')
+    return args
+
+
+def main(args=None):
+    args = parse_args(args)
+
+    if args.config is not None:
+        # workers started by `spawn` import the package again and read configuration from environment variable
+        os.environ['ELISA_CONFIG'] = op.abspath(args.config)
+        settings.read_and_update_config(args.config)
+
+    phases = np.array(args.phases) if args.phases is not None else np.arange(*args.phase_range)
+    observation = dict(passband=tuple(args.passband), phases=phases, lc=args.lc, rv=args.rv,
+                       normalize=args.normalize, rv_method=args.rv_method)
+
+    summary = run(args.input, observation, output=args.output, n_processes=args.n_processes, timeout=args.timeout,
+                  chunksize=args.chunksize, progress=args.progress)
+    print(f"evaluated: {summary['evaluated']}, failed: {summary['failed']}, skipped: {summary['skipped']}, "
+          f"elapsed: {summary['elapsed']:.1f} s, throughput: {summary['throughput']:.2f} systems/s")
+
+
+if __name__ == '__main__':
+    main()
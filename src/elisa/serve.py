@@ -0,0 +1,291 @@
+"""
+Local model-evaluation server keeping the package imported, atmosphere and limb darkening buffers warm and
+pool of worker processes alive between requests.
+
+Server is started from command line::
+
+    python -m elisa.serve --port 8765 --processes 4
+    python -m elisa.serve --socket /tmp/elisa.sock
+
+and evaluates binary systems posted as JSON to `/evaluate`::
+
+    curl -X POST localhost:8765/evaluate -d '{"system": {...}, "observation": {"passband": ["Generic.Bessell.V"],
+                                                                             "phases": [0.0, 0.25, 0.5]}}'
+
+Response contains phases and curves in the flat format of `elisa.batch.evaluate` ({'lc@passband': flux, ...}).
+"""
+
+import argparse
+import json
+import os
+import os.path as op
+import signal
+import socket
+import threading
+import numpy as np
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from multiprocessing import TimeoutError as PoolTimeoutError
+from multiprocessing.pool import Pool
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+from . import settings, batch, get_default_binary_definition
+from . logger import getLogger
+
+logger = getLogger('serve')
+
+# additional time in seconds given to the worker to report its own timeout before the server stops waiting
+WORKER_TIMEOUT_GRACE = 5.0
+
+OBSERVATION_DEFAULTS = dict(passband=('bolometric', ), lc=True, rv=False, normalize=False, rv_method=None)
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def warmup_worker():
+    """
+    Evaluates default binary system to load atmosphere and limb darkening tables before the first request.
+    """
+    try:
+        batch.evaluate(get_default_binary_definition(), dict(OBSERVATION_DEFAULTS, phases=np.array([0.0])))
+    except Exception as e:
+        logger.warning(f'warm-up of the worker failed: {e}')
+
+
+def init_worker(config=None, warmup=True):
+    """
+    Initializer of the server worker processes. Worker is configured in the same way as batch worker.
+
+    :param config: Dict; settings applied in each worker
+    :param warmup: bool; evaluate default binary system on start
+    """
+    batch.init_worker(config)
+    # interruption is handled by the server process which terminates the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if warmup:
+        warmup_worker()
+
+
+class Evaluator(object):
+    """
+    Dispatches evaluation of binary systems either to the pool of worker processes or, in case of single process
+    without time limit, to the server process itself.
+    """
+    def __init__(self, n_processes=None, config=None, timeout=None, warmup=True):
+        """
+        :param n_processes: int; number of worker processes, default is `settings.NUMBER_OF_PROCESSES`
+        :param config: Dict; settings applied in each worker
+        :param timeout: float; time limit in seconds for evaluation of each system
+        :param warmup: bool; evaluate default binary system on start of each worker
+        """
+        self.n_processes = settings.NUMBER_OF_PROCESSES if n_processes is None else n_processes
+        self.timeout = timeout
+        self.pool = None
+        # settings and buffers are process-global, serial evaluations in threads of the server have to be serialized
+        self._lock = threading.Lock()
+
+        # time limit is enforced by alarm signal available only in the main thread of the worker process,
+        # requests handled in threads of the server are therefore evaluated in the pool even in single process mode
+        if self.n_processes > 1 or self.timeout is not None:
+            n_workers = max(self.n_processes, 1)
+            logger.info(f"starting {n_workers} server workers")
+            self.pool = Pool(processes=n_workers, initializer=init_worker, initargs=(config, warmup))
+        else:
+            batch.init_worker(config)
+            if warmup:
+                warmup_worker()
+
+    def evaluate(self, definition, observation):
+        """
+        Evaluates single binary system.
+
+        :param definition: Dict; binary system definition in format accepted by `BinarySystem.from_json`
+        :param observation: Dict; see `elisa.batch.evaluate`
+        :return: Tuple[str, Union[Dict, str]]; status (`ok`, `error`, `timeout`) and curves or error message
+        """
+        if self.pool is not None:
+            # time limit is enforced within the worker, so the worker is freed for the next requests
+            result = self.pool.apply_async(batch._evaluate_task, ((0, definition, observation, self.timeout), ))
+            try:
+                wait = None if self.timeout is None else self.timeout + WORKER_TIMEOUT_GRACE
+                _, status, retval = result.get(timeout=wait)
+            except PoolTimeoutError:
+                # worker did not respond to the alarm in time (e.g. it is stuck in compiled code)
+                return 'timeout', "Evaluation of the binary system exceeded the time limit."
+            return status, retval
+
+        with self._lock:
+            _, status, retval = batch._evaluate_task((0, definition, observation, self.timeout))
+        return status, retval
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+
+def parse_observation(observation):
+    """
+    Validates and fills defaults of the observation part of the request.
+
+    :param observation: Dict;
+    :return: Dict; observation in format accepted by `elisa.batch.evaluate`
+    """
+    if not isinstance(observation, dict):
+        raise ValueError('Observation has to be JSON object.')
+    if 'phases' not in observation:
+        raise ValueError('Missing argument `phases` in observation.')
+    unknown = set(observation) - set(OBSERVATION_DEFAULTS) - {'phases'}
+    if unknown:
+        raise ValueError(f'Unknown observation arguments: {", ".join(sorted(unknown))}.')
+
+    observation = dict(OBSERVATION_DEFAULTS, **observation)
+    observation['phases'] = np.asarray(observation['phases'], dtype=float)
+    observation['passband'] = tuple(str(band) for band in np.atleast_1d(observation['passband']))
+    return observation
+
+
+def _to_json_list(array):
+    """
+    Converts curve to JSON serializable list with NaN values replaced by null.
+
+    :param array: numpy.array;
+    :return: List[float];
+    """
+    return [None if np.isnan(value) else float(value) for value in np.asarray(array, dtype=float)]
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """
+    Handler of the requests:
+
+        - GET /health - state of the server
+        - POST /evaluate - JSON {'system': binary definition, 'observation': observation}
+    """
+    server_version = 'ElisaServe'
+    protocol_version = 'HTTP/1.1'
+
+    def _send_json(self, code, content):
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip('/') != '/health':
+            return self._send_json(404, dict(status='error', error=f'Unknown path {self.path}.'))
+        evaluator = self.server.evaluator
+        return self._send_json(200, dict(status='ok', processes=max(evaluator.n_processes, 1)))
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/evaluate':
+            return self._send_json(404, dict(status='error', error=f'Unknown path {self.path}.'))
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            if not isinstance(request, dict) or not isinstance(request.get('system'), dict):
+                raise ValueError('System has to be JSON object.')
+            definition = batch.flat_to_nested(request['system'])
+            observation = parse_observation(request.get('observation', dict()))
+        except (ValueError, KeyError, TypeError) as e:
+            return self._send_json(400, dict(status='error', error=f'Invalid request: {e}'))
+
+        status, result = self.server.evaluator.evaluate(definition, observation)
+        if status == 'ok':
+            curves = {label: _to_json_list(curve) for label, curve in result.items()}
+            return self._send_json(200, dict(status=status, phases=_to_json_list(observation['phases']),
+                                             curves=curves))
+        code = 504 if status == 'timeout' else 422
+        return self._send_json(code, dict(status=status, error=result))
+
+    def address_string(self):
+        # unix socket does not provide (host, port) address of the client
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix-socket'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def make_server(host='127.0.0.1', port=8765, socket_path=None, n_processes=None, config=None, timeout=None,
+                warmup=True):
+    """
+    Creates server evaluating binary systems. Server is listening either on TCP `host`:`port` or on Unix socket
+    `socket_path`.
+
+    :param host: str;
+    :param port: int; use 0 to select arbitrary free port
+    :param socket_path: str; path of the Unix socket, if supplied, `host` and `port` are ignored
+    :param n_processes: int; number of worker processes, default is `settings.NUMBER_OF_PROCESSES`
+    :param config: Dict; settings applied in each worker
+    :param timeout: float; time limit in seconds for evaluation of each system
+    :param warmup: bool; evaluate default binary system on start of each worker
+    :return: socketserver.BaseServer;
+    """
+    if socket_path is not None:
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ValueError('Unix sockets are not supported on this platform.')
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, RequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RequestHandler)
+
+    try:
+        server.evaluator = Evaluator(n_processes=n_processes, config=config, timeout=timeout, warmup=warmup)
+    except Exception:
+        server.server_close()
+        raise
+    return server
+
+
+def serve(host='127.0.0.1', port=8765, socket_path=None, n_processes=None, config=None, timeout=None, warmup=True):
+    """
+    Runs server until interrupted. For description of arguments see `make_server`.
+    """
+    server = make_server(host, port, socket_path, n_processes, config, timeout, warmup)
+    address = socket_path if socket_path is not None else '{}:{}'.format(*server.server_address[:2])
+    logger.info(f"serving on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logger.info("shutting down server")
+        server.evaluator.close()
+        server.server_close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m elisa.serve', description='Local ELISa model-evaluation server.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port to listen on')
+    parser.add_argument('--socket', dest='socket_path', default=None, help='listen on Unix socket instead of TCP')
+    parser.add_argument('--processes', dest='n_processes', type=int, default=None,
+                        help='number of worker processes (default: NUMBER_OF_PROCESSES setting)')
+    parser.add_argument('--timeout', type=float, default=None, help='time limit of single evaluation in seconds')
+    parser.add_argument('--config', default=None, help='path to ELISa configuration file used by workers')
+    parser.add_argument('--no-warmup', dest='warmup', action='store_false', help='skip warm-up of the workers')
+    args = parser.parse_args(args)
+
+    if args.config is not None:
+        # workers started by `spawn` import the package again and read configuration from environment variable
+        os.environ['ELISA_CONFIG'] = op.abspath(args.config)
+        settings.read_and_update_config(args.config)
+
+    serve(args.host, args.port, args.socket_path, args.n_processes, None, args.timeout, args.warmup)
+
+
+if __name__ == '__main__':
+    main()
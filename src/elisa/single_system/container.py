@@ -1,6 +1,5 @@
 import numpy as np
 
-from copy import deepcopy
 from . surface import (
     mesh,
     faces,
@@ -78,10 +77,6 @@ class SinglePositionContainer(PositionContainer):
         star = StarContainer.from_star_instance(single_system.star)
         return cls(star, position, **single_system.properties_serializer())
 
-    def copy(self):
-        """Returns a deep copy of the SinglePositionContainer."""
-        return deepcopy(self)
-
     def has_spots(self):
         """Returns True if the star contains spots."""
         return self.star.has_spots()
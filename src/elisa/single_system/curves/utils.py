@@ -1,7 +1,7 @@
 from ... import atm, ld
 from ... import settings
 from ... observer.passband import init_bolometric_passband
-from ... base.curves.utils import get_component_limbdarkening_cfs
+from ... base.curves.utils import get_component_limbdarkening_cfs, cast_surface_params
 
 
 def prep_surface_params(system, return_values=True, write_to_containers=False, **kwargs):
@@ -39,6 +39,7 @@ def prep_surface_params(system, return_values=True, write_to_containers=False, *
         bol_ld_cfs = get_limbdarkening_cfs(system, **bol_kwargs)
 
     normal_radiance = atm.correct_normal_radiance_to_optical_depth(normal_radiance, bol_ld_cfs)
+    normal_radiance, ld_cfs = cast_surface_params(normal_radiance, ld_cfs)
 
     if write_to_containers:
         star = getattr(system, 'star')
@@ -1,9 +1,13 @@
 import re
+import numba
+import threading
 import numpy as np
+import multiprocessing as mp
 import pandas as pd
 import scipy as sp
 
 from typing import Sized
+from contextlib import contextmanager
 from queue import Empty
 from numpy.linalg import norm
 from scipy.spatial import distance_matrix as dstm
@@ -242,6 +246,25 @@ def arbitrary_rotation(theta, omega, vector, degrees=False, omega_normalized=Fal
     return up.matmul(vector, matrix)
 
 
+def arbitrary_rotations(thetas, omega, vectors, omega_normalized=False):
+    """
+    Vectorized Rodrigues's Rotation Formula.
+    Function rotates each of `vectors` around common axis defined by `omega` vector by corresponding amount
+    in `thetas`. Rotation follows the same convention as `arbitrary_rotation`.
+
+    :param thetas: numpy.array; rotation angles in radians, one for each vector
+    :param omega: Union[List, numpy.array]; 3d list of floats; arbitrary vector to rotate around
+    :param vectors: numpy.array; 2d array of vectors in shape (N, 3)
+    :param omega_normalized: bool; if True, then in-function normalization of omega is not performed
+    :return: numpy.array; rotated vectors in shape (N, 3)
+    """
+    omega = np.array(omega) if omega_normalized else np.array(omega) / np.linalg.norm(np.array(omega))
+    cos_thetas, sin_thetas = up.cos(thetas)[:, np.newaxis], up.sin(thetas)[:, np.newaxis]
+    projections = np.sum(vectors * omega, axis=1)[:, np.newaxis]
+    return vectors * cos_thetas + np.cross(omega, vectors) * sin_thetas + \
+        omega * projections * (1.0 - cos_thetas)
+
+
 def around_axis_rotation(theta, vector, axis, inverse=False, degrees=False):
     """
     Rotation of `vector` around `axis` by an amount `theta`.
@@ -414,6 +437,32 @@ def calculate_distance_matrix(points1, points2, return_join_vector_matrix=False)
         return distance_matrix, None
 
 
+@contextmanager
+def numba_threads(n_threads):
+    """
+    Context manager setting number of threads used by numba parallel kernels. Yields True if parallel kernels can be
+    used, that is when more than one thread is requested (and allowed by `NUMBA_NUM_THREADS`) and the code runs in
+    the main thread of the main process. The default numba threading layer is neither thread-safe nor fork-safe,
+    therefore serial kernels have to be used in worker threads and processes. Previous number of threads is restored
+    on exit.
+
+    :param n_threads: int; requested number of threads
+    """
+    n_threads = min(int(n_threads), numba.config.NUMBA_NUM_THREADS)
+    parallel = n_threads > 1 and threading.current_thread() is threading.main_thread() and \
+        mp.current_process().name == 'MainProcess'
+    if not parallel:
+        yield False
+        return
+
+    previous = numba.get_num_threads()
+    numba.set_num_threads(n_threads)
+    try:
+        yield True
+    finally:
+        numba.set_num_threads(previous)
+
+
 def find_face_centres(faces):
     """
     Function calculates centres (center of mass) of each supplied face.
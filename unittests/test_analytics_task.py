@@ -149,6 +149,10 @@ class McMcLCTestCase(AbstractFitTestCase):
                                          expected_morphology="detached", method='mcmc')
             task.fit(x0=lc_initial, nsteps=10, discretization=5.0)
 
+    def test_mcmc_lc_fit_core_budget(self):
+        settings.configure(MCMC_CORE_BUDGET=4)
+        self.test_mcmc_lc_fit_std_params_detached()
+
     def test_mcmc_lc_fit_community_params_detached(self):
         dinit = {
             "system": {
@@ -0,0 +1,110 @@
+# keep it first
+# due to stupid astropy units/constants implementation
+from unittests import set_astropy_units
+
+import os.path as op
+import tempfile
+import numpy as np
+import pandas as pd
+
+from copy import deepcopy
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from elisa import settings, batch
+from elisa.binary_system.system import BinarySystem
+from elisa.observer.observer import Observer
+from unittests.utils import ElisaTestCase
+
+set_astropy_units()
+
+
+DEFINITION = {
+    "system": {
+        "argument_of_periastron": 90.0,
+        "gamma": 0.0,
+        "period": 5.0,
+        "eccentricity": 0.0,
+        "inclination": 90.0,
+        "primary_minimum_time": 0.0,
+        "phase_shift": 0.0
+    },
+    "primary": {
+        "mass": 2.0,
+        "surface_potential": 5.0,
+        "synchronicity": 1.0,
+        "t_eff": 6500.0,
+        "gravity_darkening": 1.0,
+        "albedo": 1.0,
+        "metallicity": 0.0,
+        "discretization_factor": 10
+    },
+    "secondary": {
+        "mass": 1.0,
+        "surface_potential": 5.0,
+        "synchronicity": 1.0,
+        "t_eff": 6500.0,
+        "gravity_darkening": 1.0,
+        "albedo": 1.0,
+        "metallicity": 0.0
+    }
+}
+
+
+class BatchTestCase(ElisaTestCase):
+    def setUp(self):
+        super(BatchTestCase, self).setUp()
+        self.lc_base_path = op.join(op.dirname(op.abspath(__file__)), "data", "light_curves")
+        self.config = {
+            "LD_TABLES": op.join(self.lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(self.lc_base_path, "atmosphere")
+        }
+        settings.configure(**self.config)
+        self.phases = np.linspace(0.0, 1.0, 7)
+
+    def expected_lc(self, definition):
+        o = Observer(passband=['Generic.Bessell.V'], system=BinarySystem.from_json(definition))
+        return o.lc(phases=self.phases)[1]['Generic.Bessell.V']
+
+    def test_flat_to_nested(self):
+        flat = {'system@period': 5.0, 'primary@mass': 2.0, 'secondary@t_eff': 6000.0, 'primary@albedo': np.nan}
+        expected = {'system': {'period': 5.0}, 'primary': {'mass': 2.0}, 'secondary': {'t_eff': 6000.0}}
+        self.assertDictEqual(expected, batch.flat_to_nested(flat))
+        self.assertDictEqual(DEFINITION, batch.flat_to_nested(DEFINITION))
+
+    def test_compute_batch_reports_invalid_system(self):
+        invalid = deepcopy(DEFINITION)
+        invalid["primary"]["surface_potential"] = 1.0
+        result = batch.compute_batch([DEFINITION, invalid], passband='Generic.Bessell.V', phases=self.phases,
+                                     rv=True, n_processes=1, config=self.config)
+
+        assert_array_equal(['ok', 'error'], result['status'])
+        self.assertEqual((2, self.phases.shape[0]), result['lc@Generic.Bessell.V'].shape)
+        self.assertTrue(np.all(np.isnan(result['lc@Generic.Bessell.V'][1])))
+        self.assertTrue(np.all(np.isnan(result['rv@primary'][1])))
+        assert_array_almost_equal(self.expected_lc(DEFINITION), result['lc@Generic.Bessell.V'][0])
+
+    def test_serial_batch_keeps_caller_state(self):
+        law = settings.LIMB_DARKENING_LAW
+        other_law = 'logarithmic' if law != 'logarithmic' else 'linear'
+        batch.compute_batch([DEFINITION], passband='Generic.Bessell.V', phases=self.phases, n_processes=1,
+                            config=dict(self.config, LIMB_DARKENING_LAW=other_law))
+        self.assertEqual(law, settings.LIMB_DARKENING_LAW)
+        self.assertDictEqual(dict(), batch._OBSERVERS)
+
+    def test_compute_batch_from_table_multiprocess(self):
+        definitions = [deepcopy(DEFINITION) for _ in range(3)]
+        for definition, t_eff in zip(definitions, [5500.0, 6000.0, 6500.0]):
+            definition["secondary"]["t_eff"] = t_eff
+        table = pd.DataFrame([{f'{component}@{param}': value for component, params in definition.items()
+                               for param, value in params.items()} for definition in definitions])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = op.join(tmp, 'batch.npz')
+            batch.compute_batch(table, passband=['Generic.Bessell.V'], phases=self.phases, n_processes=2,
+                                config=self.config, output=output)
+            result = np.load(output)
+
+            assert_array_equal(['ok'] * 3, result['status'])
+            assert_array_equal(self.phases, result['phases'])
+            for idx, definition in enumerate(definitions):
+                assert_array_almost_equal(self.expected_lc(definition), result['lc@Generic.Bessell.V'][idx])
@@ -3,9 +3,12 @@
 from unittests import set_astropy_units
 
 import numpy as np
+from unittest import mock
 from numpy.testing import assert_array_equal
 
 from elisa import umpy as up
+from elisa.base.surface import faces as bfaces
+from elisa.buffer import buffer
 from elisa.binary_system.container import OrbitalPositionContainer
 from elisa.utils import is_empty
 from elisa import units as u
@@ -175,7 +178,84 @@ class BuildSpottyFacesTestCase(ElisaTestCase):
         self.assertTrue(testutils.surface_closed(faces=faces, points=points))
 
 
-class BuildSurfaceAreasTestCase(ElisaTestCase):
+class SurfaceTopologyTemplateTestCase(ElisaTestCase):
+    def setUp(self):
+        super(SurfaceTopologyTemplateTestCase, self).setUp()
+        buffer.SURFACE_TOPOLOGIES.clear()
+
+    @staticmethod
+    def sorted_faces(faces):
+        faces = np.sort(faces, axis=1)
+        return faces[np.lexsort(faces.T[::-1])]
+
+    @staticmethod
+    def build_faces(system, components_distance):
+        orbital_position_container = testutils.prepare_orbital_position_container(system)
+        orbital_position_container.build_mesh(components_distance=components_distance)
+        orbital_position_container.build_faces(components_distance=components_distance)
+        return orbital_position_container
+
+    def test_convex_hull_triangulation_repairs_template(self):
+        np.random.seed(1)
+        directions = np.random.normal(0.0, 1.0, (500, 3))
+        directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        template = bfaces.convex_hull_triangulation(directions, 'key')
+
+        # deformation of the sphere changes connectivity of its convex hull
+        radii = 1.0 + 0.1 * (directions[:, 0] * directions[:, 1] + directions[:, 2] ** 2)
+        points = directions * radii[:, np.newaxis]
+        expected = bfaces.Delaunay(points).convex_hull
+        self.assertFalse(np.array_equal(self.sorted_faces(expected), self.sorted_faces(template)))
+        with mock.patch.object(bfaces, 'Delaunay') as delaunay:
+            obtained = bfaces.convex_hull_triangulation(points, 'key')
+            delaunay.assert_not_called()
+        assert_array_equal(self.sorted_faces(expected), self.sorted_faces(obtained))
+
+        # different layout of the points is triangulated again
+        points = np.random.normal(0.0, 1.0, (500, 3))
+        points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+        obtained = bfaces.convex_hull_triangulation(points, 'key')
+        assert_array_equal(self.sorted_faces(bfaces.Delaunay(points).convex_hull), self.sorted_faces(obtained))
+
+    def test_canonical_triangulation_of_planar_quadrilaterals(self):
+        # each side of the cube is planar quadrilateral split by one of its diagonals
+        points = np.array([[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)])
+        faces = bfaces.Delaunay(points).convex_hull
+        partners = bfaces.get_surface_topology(faces)
+        diagonals = (np.abs(bfaces.get_edge_heights(points, faces, partners)) <= bfaces.PLANARITY_TOLERANCE) & \
+            (np.arange(partners.shape[0]) < partners)
+        flipped = bfaces.flip_edges(faces, partners, np.flatnonzero(diagonals))
+        self.assertFalse(np.array_equal(self.sorted_faces(faces), self.sorted_faces(flipped)))
+
+        expected, unique = bfaces.canonical_triangulation(points, faces, partners)
+        self.assertTrue(unique)
+        obtained, unique = bfaces.canonical_triangulation(points, flipped, bfaces.get_surface_topology(flipped))
+        self.assertTrue(unique)
+        assert_array_equal(expected, obtained)
+        self.assertEqual(12, len(obtained))
+
+        # planar region of more than four points does not have unique triangulation
+        points = np.vstack([points, [[0.5, 0.5, 1.0]]])
+        faces = bfaces.Delaunay(points).convex_hull
+        self.assertFalse(bfaces.canonical_triangulation(points, faces, bfaces.get_surface_topology(faces))[1])
+
+    def test_triangulation_reused_on_eccentric_orbit(self):
+        s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['detached.ecc'],
+                                            spots_primary=testutils.SPOTS_META["primary"],
+                                            spots_secondary=testutils.SPOTS_META["secondary"])
+        self.build_faces(s, 0.8)
+        with mock.patch.object(bfaces, 'Delaunay', wraps=bfaces.Delaunay) as delaunay:
+            obtained = self.build_faces(s, 0.82)
+            delaunay.assert_not_called()
+
+        # faces do not depend on previously triangulated surfaces
+        buffer.SURFACE_TOPOLOGIES.clear()
+        expected = self.build_faces(s, 0.82)
+        for component in ['primary', 'secondary']:
+            expected_star, obtained_star = getattr(expected, component), getattr(obtained, component)
+            assert_array_equal(expected_star.faces, obtained_star.faces)
+            for spot_index, spot in expected_star.spots.items():
+                assert_array_equal(spot.faces, obtained_star.spots[spot_index].faces)
     def generator_test_surface_areas(self, key, kind, less=None):
         params = testutils.BINARY_SYSTEM_PARAMS[key].copy()
         params.update({"primary_discretization_factor": 10})
@@ -4,8 +4,9 @@ from unittests import set_astropy_units
 
 import os.path as op
 import numpy as np
+import matplotlib.path as mpltpath
 
-from unittest import skip
+from unittest import skip, mock
 from numpy.testing import assert_array_equal, assert_allclose
 from pypex.poly2d import polygon
 from copy import deepcopy
@@ -16,9 +17,10 @@ from elisa import settings
 from elisa.observer.observer import Observer
 from elisa.binary_system.orbit.container import OrbitalSupplements
 from elisa.binary_system import surface
-from elisa.binary_system.curves import utils as crv_utils
+from elisa.binary_system.curves import utils as crv_utils, c_managed
 from elisa.base.surface import coverage
 from elisa.base.container import PositionContainer
+from elisa.numba_functions import clipping
 
 from elisa.binary_system import (
     utils as bsutils,
@@ -322,6 +324,56 @@ class SupportMethodsTestCase(ElisaTestCase):
         expected = np.round(0.5 / up.cos(up.pi / 4.0), 10)
         self.assertTrue(np.all(obtained == expected))
 
+    @staticmethod
+    def test_triangle_hull_intersection_areas_vs_pypex():
+        rng = np.random.default_rng(42)
+        angles = np.sort(rng.uniform(0.0, const.FULL_ARC, 100))
+        hull = np.column_stack((np.cos(angles), np.sin(angles)))
+        triangles = rng.uniform(-1.2, 1.2, (500, 1, 2)) + rng.normal(0.0, 0.1, (500, 3, 2))
+
+        pypex_intersection = bsutils.pypex_poly_hull_intersection(bsutils.faces_to_pypex_poly(triangles),
+                                                                  bsutils.hull_to_pypex_poly(hull))
+        expected = np.array(bsutils.pypex_poly_surface_area(pypex_intersection))
+        for clockwise in [False, True]:
+            obtained = clipping.triangle_hull_intersection_areas(triangles, hull[::-1].copy() if clockwise else hull)
+            assert_allclose(expected, obtained, rtol=0.0, atol=1e-12)
+
+    @staticmethod
+    def test_triangle_hull_intersection_areas_inside_outside():
+        hull = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]])
+        triangles = np.array([
+            [[0.5, 0.5], [1.5, 0.5], [1.0, 1.5]],
+            [[3.0, 3.0], [4.0, 3.0], [3.0, 4.0]],
+            [[-1.0, 1.0], [1.0, 1.0], [-1.0, 3.0]]
+        ])
+        obtained = clipping.triangle_hull_intersection_areas(triangles, hull)
+        assert_allclose([0.5, 0.0, 0.5], obtained, rtol=0.0, atol=1e-12)
+
+    @staticmethod
+    def test_points_in_convex_polygon_vs_matplotlib():
+        rng = np.random.default_rng(42)
+        angles = np.sort(rng.uniform(0.0, const.FULL_ARC, 100))
+        polygon = np.column_stack((0.3 * np.cos(angles) + 0.1, 0.2 * np.sin(angles)))
+        points = rng.uniform(-0.5, 0.5, (5000, 2))
+
+        expected = mpltpath.Path(polygon).contains_points(points)
+        for clockwise in [False, True]:
+            obtained = clipping.points_in_convex_polygon(points, polygon[::-1].copy() if clockwise else polygon)
+            assert_array_equal(expected, obtained)
+
+    def test_faces_visibility_mask(self):
+        obj = MockSelf()
+        obj.points = np.zeros((6, 3))
+        obj.faces = np.array([[0, 1, 2], [2, 3, 4], [3, 4, 5], [0, 4, 5]])
+        obj.indices = np.array([0, 1, 3])
+        visible_point_indices = np.array([0, 2, 3, 4])
+
+        undercover_faces = np.full(obj.faces.shape, -1, dtype=int)
+        undercover_faces[obj.indices] = obj.faces[obj.indices]
+        expected = np.isin(undercover_faces, visible_point_indices)
+        obtained = surface.coverage.faces_visibility_mask(obj, visible_point_indices)
+        assert_array_equal(expected, obtained)
+
     @staticmethod
     def test_resolve_spots_geometry_update():
         settings.configure(**{"MAX_SPOT_D_LONGITUDE": 0.06})
@@ -362,6 +414,42 @@ class SupportMethodsTestCase(ElisaTestCase):
         system.apply_darkside_filter()
         self.assertTrue((not is_empty(system.primary.indices)) and (not is_empty(system.secondary.indices)))
 
+    def test_cached_eclipse_boundary_path(self):
+        settings.configure(**{
+            "LD_TABLES": op.join(self.lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(self.lc_base_path, "atmosphere")
+        })
+
+        bs = prepare_binary_system(BINARY_SYSTEM_PARAMS['detached-physical'])
+        from_this = dict(binary_system=bs, position=const.Position(0, 1.0, 0.0, 0.0, 0.0))
+        system = OrbitalPositionContainer.from_binary_system(**from_this)
+        system.build(components_distance=1.0)
+        surface.coverage.prepare_eclipse_outlines(system)
+
+        positions = bs.calculate_orbital_motion(np.linspace(-0.1, 0.6, 8), return_nparray=False,
+                                                calculate_from='phase')
+        for position in positions:
+            on_pos = bsutils.move_sys_onpos(system, position, on_copy=True)
+            for component in ['primary', 'secondary']:
+                star = getattr(on_pos, component)
+                expected = surface.coverage.get_eclipse_boundary_path(utils.get_visible_projection(star))
+                obtained = surface.coverage.get_cached_eclipse_boundary_path(on_pos, star)
+                assert_allclose(np.sort(expected.vertices, axis=0), np.sort(obtained.vertices, axis=0), atol=1e-10)
+                # vertices have to be ordered along the outline
+                obtained_area = np.sum(np.cross(obtained.vertices, np.roll(obtained.vertices, -1, axis=0)))
+                expected_area = np.sum(np.cross(expected.vertices, np.roll(expected.vertices, -1, axis=0)))
+                self.assertAlmostEqual(abs(expected_area), abs(obtained_area))
+
+
+    def test_eclipse_outlines_not_cached_for_over_contact(self):
+        bs = prepare_binary_system(BINARY_SYSTEM_PARAMS['over-contact'])
+        from_this = dict(binary_system=bs, position=const.Position(0, 1.0, 0.0, 0.0, 0.0))
+        system = OrbitalPositionContainer.from_binary_system(**from_this)
+        system.build_mesh(components_distance=1.0)
+        surface.coverage.prepare_eclipse_outlines(system)
+        for component in ['primary', 'secondary']:
+            self.assertEqual(0, len(getattr(system, component).outline_simplices))
+
 
 class ComputeLightCurvesTestCase(ElisaTestCase):
     def setUp(self):
@@ -462,6 +550,28 @@ class ComputeLightCurvesTestCase(ElisaTestCase):
         bs = prepare_binary_system(PARAMS["detached-async-ecc"], spots_primary=SPOTS_META["primary"])
         self.do_comparison(bs, "detached.ecc.spotty.async.generic.bessel.v.json", TOL, -0.2, 1.2, 0.1)
 
+    def test_cicular_spotty_asynchronous_detached_system_rigid_spots(self):
+        settings.configure(**{"MAX_SPOT_D_LONGITUDE": up.pi / 45.0})
+        bs = prepare_binary_system(PARAMS["detached-async"], spots_primary=SPOTS_META["primary"])
+        o = Observer(passband=['Generic.Bessell.V'], system=bs)
+        rebuilt = o.lc(from_phase=-0.2, to_phase=1.2, phase_step=0.05)[1]["Generic.Bessell.V"]
+
+        settings.configure(**{"USE_RIGID_SPOT_ROTATION": True})
+        with mock.patch.object(c_managed, 'add_spots_to_mesh') as add_spots:
+            rigid = o.lc(from_phase=-0.2, to_phase=1.2, phase_step=0.05)[1]["Generic.Bessell.V"]
+        add_spots.assert_not_called()
+        assert_allclose(rigid, rebuilt, rtol=1e-3)
+        self.do_comparison(bs, "detached.circ.spotty.async.generic.bessel.v.json", TOL, -0.2, 1.2, 0.2)
+
+    def test_circular_synchronous_detached_system_single_precision_surface_params(self):
+        bs = prepare_binary_system(PARAMS["detached"])
+        o = Observer(passband=['Generic.Bessell.V'], system=bs)
+        double = o.lc(from_phase=-0.2, to_phase=1.2, phase_step=0.05)[1]["Generic.Bessell.V"]
+
+        settings.configure(**{"USE_SINGLE_PRECISION_SURFACE_PARAMS": True})
+        single = o.lc(from_phase=-0.2, to_phase=1.2, phase_step=0.05)[1]["Generic.Bessell.V"]
+        assert_allclose(single, double, rtol=1e-6)
+
 
 class CompareSingleVsMultiprocess(ElisaTestCase):
     def setUp(self):
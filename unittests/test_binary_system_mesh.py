@@ -3,12 +3,15 @@
 from unittests import set_astropy_units
 
 import numpy as np
-from numpy.testing import assert_array_equal
+from unittest import mock
+from numpy.testing import assert_array_equal, assert_allclose
 
-from elisa import umpy as up, const, units as u, settings
+from elisa import umpy as up, const, units as u, settings, utils
 from elisa.base.container import StarContainer
-from elisa.binary_system import model
+from elisa.binary_system import model, radius as bsradius
+from elisa.buffer import buffer
 from elisa.binary_system.container import OrbitalPositionContainer
+from elisa.binary_system.surface import mesh
 from elisa.const import Position
 from elisa.utils import is_empty, find_nearest_dist_3d
 from unittests import utils as testutils
@@ -78,6 +81,38 @@ class BuildMeshSpotsFreeTestCase(ElisaTestCase):
                                 bad_points.append(point)
                 self.assertFalse(distance < 1e-10)
 
+    def test_spot_azimuths(self):
+        lon, lat = 0.7, 1.2
+        center_vector = utils.spherical_to_cartesian([1.0, lon, lat])
+        thetas = np.linspace(lat, lat + 0.3, num=4, endpoint=True)
+        num_azimuthal = np.array([1, 6, 12, 18])
+
+        expected = []
+        for theta, num in zip(thetas, num_azimuthal):
+            for delta in np.linspace(0., const.FULL_ARC, num=num, endpoint=False):
+                vector = utils.spherical_to_cartesian([1.0, lon, theta])
+                rotated = utils.arbitrary_rotation(delta, center_vector, vector, omega_normalized=True)
+                expected.append(utils.cartesian_to_spherical(rotated)[1:])
+
+        obtained = np.column_stack(mesh.get_spot_azimuths(center_vector, lon, thetas, num_azimuthal))
+        assert_allclose(obtained, expected, rtol=0, atol=1e-12)
+
+    def test_spot_beyond_neck_is_omitted(self):
+        spots = [{"longitude": 0, "latitude": 90, "angular_radius": 10, "temperature_factor": 0.9}]
+        s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS["over-contact"], spots_primary=spots)
+        s.init()
+        orbital_position_container = OrbitalPositionContainer.from_binary_system(s, Position(*(0, 1.0, 0.0, 0.0, 0.0)))
+        orbital_position_container.build_mesh(components_distance=1.0)
+        self.assertEqual(len(orbital_position_container.primary.spots), 0)
+
+    def test_secondary_spot_beyond_neck_is_omitted(self):
+        spots = [{"longitude": 0, "latitude": 60, "angular_radius": 15, "temperature_factor": 0.9}]
+        s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS["over-contact"], spots_secondary=spots)
+        s.init()
+        orbital_position_container = OrbitalPositionContainer.from_binary_system(s, Position(*(0, 1.0, 0.0, 0.0, 0.0)))
+        orbital_position_container.build_mesh(components_distance=1.0)
+        self.assertEqual(len(orbital_position_container.secondary.spots), 0)
+
     def test_outliers(self):
         """
         checking if the spacing between vertices is beyond reasonable limits
@@ -354,3 +389,114 @@ class MeshUtilsTestCase(ElisaTestCase):
 
         obtained = np.round(obtained, 3)
         assert_array_equal(expected, obtained)
+
+    def test_overcontact_neck_points(self):
+        s = prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['over-contact'])
+        # coarse discretization covers slices with small number of azimuths
+        s.primary.discretization_factor = up.radians(10)
+        s.secondary.discretization_factor = up.radians(10)
+        neck_position, neck_polynomial = mesh.calculate_neck_position(s, return_polynomial=True)
+        delta_z = s.primary.discretization_factor * s.primary.polar_radius
+        for component in ['primary', 'secondary']:
+            _, _, z_ns, r_neck, _ = mesh._generate_neck_zs(delta_z, component, neck_position, neck_polynomial)
+            phi, z, separator = mesh.trapezoidal_overcontact_neck_points(
+                s.primary.discretization_factor, neck_position, neck_polynomial, s.primary.polar_radius, component)
+
+            # slice by slice reference
+            nums = [int(const.HALF_PI * r // delta_z) for r in r_neck]
+            expected_phi = [np.linspace(0, const.HALF_PI, num=num + 1 if num < 5 else num, endpoint=False)[1:]
+                            for num in nums]
+            expected_z = [np.full(phis.shape, zz) for phis, zz in zip(expected_phi, z_ns)]
+
+            assert_array_equal(phi[separator[1]:], np.concatenate(expected_phi))
+            assert_array_equal(z[separator[1]:], np.concatenate(expected_z))
+            self.assertEqual(separator[-1], len(phi))
+
+            star = getattr(s, component)
+            star_delta_z = star.discretization_factor * star.polar_radius
+            _, _, z_ns, r_neck, _ = mesh._generate_neck_zs(star_delta_z, component, neck_position, neck_polynomial)
+            phi, z, separator = mesh.improved_trapezoidal_overcontact_neck_points(
+                star.discretization_factor, neck_position, neck_polynomial, star.polar_radius, star.side_radius,
+                component)
+
+            # slice by slice reference including obliqueness correction
+            eq_coeff = star.side_radius / star.polar_radius
+            expected_phi = []
+            for r in r_neck:
+                num = const.HALF_PI * r // star_delta_z
+                phis = np.linspace(0, const.HALF_PI, num=int(num + 1 if num < 4 else num), endpoint=False)[1:]
+                tan_phis = np.tan(phis)
+                expected_phi.append(phis + up.arctan((eq_coeff - 1) * tan_phis / (1 + eq_coeff * tan_phis ** 2)))
+            expected_z = [np.full(phis.shape, zz) for phis, zz in zip(expected_phi, z_ns)]
+
+            assert_array_equal(phi[separator[1]:], np.concatenate(expected_phi))
+            assert_array_equal(z[separator[1]:], np.concatenate(expected_z))
+            self.assertEqual(separator[-1], len(phi))
+
+
+class WarmStartedRadiusTestCase(ElisaTestCase):
+    def setUp(self):
+        super(WarmStartedRadiusTestCase, self).setUp()
+        buffer.SOLVER_SEEDS.clear()
+        self.binary = prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['detached.ecc'])
+
+    def build_points(self, distance):
+        orbital_position_container = testutils.prepare_orbital_position_container(self.binary)
+        orbital_position_container.build_mesh(components_distance=distance)
+        return {component: getattr(orbital_position_container, component).points
+                for component in ['primary', 'secondary']}
+
+    def test_warm_started_radii(self):
+        fns = [bsradius.calculate_polar_radius, bsradius.calculate_side_radius,
+               bsradius.calculate_backward_radius, bsradius.calculate_forward_radius]
+        args = [(self.binary.primary.synchronicity, self.binary.mass_ratio, distance, potential, 'primary')
+                for distance, potential in [(1.0, self.binary.primary.surface_potential), (1.02, 4.9)]]
+        expected = [fn(*args[1]) for fn in fns]
+
+        buffer.SOLVER_SEEDS.clear()
+        for fn in fns:
+            fn(*args[0])
+        with mock.patch.object(bsradius, 'fsolve') as fsolve:
+            obtained = [fn(*args[1]) for fn in fns]
+            fsolve.assert_not_called()
+        assert_allclose(expected, obtained, rtol=1e-10)
+
+    def test_rejected_seed_is_solved_from_scratch(self):
+        args = (self.binary.primary.synchronicity, self.binary.mass_ratio, 1.0, self.binary.primary.surface_potential,
+                'primary')
+        expected = bsradius.calculate_side_radius(*args)
+
+        key = ('radius', 'primary', self.binary.primary.synchronicity, self.binary.mass_ratio,
+               const.HALF_PI, const.HALF_PI)
+        buffer.SOLVER_SEEDS[key] = [(1.0, self.binary.primary.surface_potential, 0.95)]
+        with mock.patch.object(bsradius, 'fsolve', wraps=bsradius.fsolve) as fsolve:
+            obtained = bsradius.calculate_side_radius(*args)
+            fsolve.assert_called_once()
+        self.assertAlmostEqual(expected, obtained, places=10)
+
+    def test_stored_seeds_are_bounded(self):
+        for i in range(2 * bsradius.MAX_SOLVER_SEEDS):
+            bsradius.store_solver_seed('radius', 1.0 + i, 5.0, 1.0)
+        self.assertEqual(len(buffer.SOLVER_SEEDS['radius']), bsradius.MAX_SOLVER_SEEDS)
+        self.assertEqual(buffer.SOLVER_SEEDS['radius'][-1][0], 2.0 * bsradius.MAX_SOLVER_SEEDS)
+
+        size = bsradius.MAX_SOLVER_SEEDS_SIZE // 8
+        for i in range(3):
+            bsradius.store_solver_seed('surface', 1.0 + i, 5.0, np.full(size // 2, 1.0 + i))
+        self.assertEqual(len(buffer.SOLVER_SEEDS['surface']), 2)
+        bsradius.store_solver_seed('surface', 4.0, 5.0, np.ones(2 * size))
+        self.assertEqual(len(buffer.SOLVER_SEEDS['surface']), 1)
+
+        for i in range(2 * buffer.SOLVER_SEEDS_MAX_STORAGE):
+            bsradius.store_solver_seed(('radius', i), 1.0, 5.0, 1.0)
+        self.assertEqual(len(buffer.SOLVER_SEEDS), buffer.SOLVER_SEEDS_MAX_STORAGE)
+
+    def test_warm_started_mesh(self):
+        expected = self.build_points(1.02)
+        buffer.SOLVER_SEEDS.clear()
+        self.build_points(1.0)
+        with mock.patch.object(bsradius, 'warm_start_newton', wraps=bsradius.warm_start_newton) as warm_start:
+            obtained = self.build_points(1.02)
+            self.assertTrue(warm_start.called)
+        for component in ['primary', 'secondary']:
+            assert_allclose(expected[component], obtained[component], rtol=1e-10, atol=1e-12)
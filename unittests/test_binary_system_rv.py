@@ -509,4 +509,51 @@ class CompareApproxVsExact(ElisaTestCase):
         # plt.show()
 
         self.assertTrue(np.all((up.abs(ex_p - ap_p) / np.abs(np.max(ex_p))) < 3e-3))
-        self.assertTrue(np.all((up.abs(ex_s - ap_s) / np.abs(np.max(ex_s))) < 3e-3))
\ No newline at end of file
+        self.assertTrue(np.all((up.abs(ex_s - ap_s) / np.abs(np.max(ex_s))) < 3e-3))
+
+class CompareJointVsSeparate(ElisaTestCase):
+    def setUp(self):
+        super(CompareJointVsSeparate, self).setUp()
+        self.lc_base_path = op.join(op.dirname(op.abspath(__file__)), "data", "light_curves")
+
+        settings.configure(**{
+            "LD_TABLES": op.join(self.lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(self.lc_base_path, "atmosphere")
+        })
+
+    def do_comparison(self, system, start_phs=-0.2, stop_phs=1.2, step=0.1, tol=1e-8):
+        o = Observer(passband=['Generic.Bessell.V', 'bolometric'], system=system)
+
+        phases, fluxes, rvs = o.observe(lc=True, rv=dict(method='radiometric'),
+                                        from_phase=start_phs, to_phase=stop_phs, phase_step=step)
+        _, exp_fluxes = o.lc(from_phase=start_phs, to_phase=stop_phs, phase_step=step)
+        exp_phases, exp_rvs = o.rv(from_phase=start_phs, to_phase=stop_phs, phase_step=step, method='radiometric')
+
+        assert_array_equal(exp_phases, phases)
+        for band, flux in exp_fluxes.items():
+            self.assertTrue(np.all(up.abs(flux - fluxes[band]) / np.max(flux) < tol))
+        for component, exp_rv in exp_rvs.items():
+            obt_rv, exp_rv = np.array(rvs[component]), np.array(exp_rv)
+            assert_array_equal(np.isnan(exp_rv), np.isnan(obt_rv))
+            valid = ~np.isnan(exp_rv)
+            self.assertTrue(np.all(up.abs(obt_rv[valid] - exp_rv[valid]) / np.max(np.abs(exp_rv[valid])) < tol))
+
+    def test_circular_sync(self):
+        bs = prepare_binary_system(PARAMS["detached"])
+        self.do_comparison(bs)
+
+    def test_circular_spotty_async(self):
+        bs = prepare_binary_system(PARAMS["detached-async"], spots_primary=SPOTS_META["primary"])
+        self.do_comparison(bs)
+
+    def test_eccentric_no_approximation(self):
+        settings.configure(**APPROX_SETTINGS["no_approx"])
+        bs = prepare_binary_system(PARAMS["eccentric"])
+        self.do_comparison(bs)
+
+    def test_kinematic_rv_fallback(self):
+        bs = prepare_binary_system(PARAMS["detached"])
+        o = Observer(passband=['Generic.Bessell.V'], system=bs)
+        _, _, rvs = o.observe(lc=False, rv=dict(method='kinematic'), phases=[0.0, 0.25])
+        exp_rvs = o.rv(phases=[0.0, 0.25], method='kinematic')[1]
+        assert_array_equal(exp_rvs['primary'], rvs['primary'])
@@ -5,9 +5,14 @@ from unittests import set_astropy_units
 import numpy as np
 import os.path as op
 from copy import copy
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from numpy.testing import assert_allclose
 
-from elisa import umpy as up
+from elisa import umpy as up, ld, utils
 from elisa import settings, BinarySystem
+from elisa.binary_system.surface import temperature as bs_temperature
+from elisa.numba_functions import reflection_effect as re_numba
 from elisa.utils import is_empty
 from unittests import utils as testutils
 from unittests.utils import ElisaTestCase
@@ -96,6 +101,144 @@ class BuildSpottyTemperatureTestCase(ElisaTestCase):
         self.generator_test_temperatures('semi-detached')
 
 
+class ReflectionEffectModesTestCase(ElisaTestCase):
+    def setUp(self):
+        super(ReflectionEffectModesTestCase, self).setUp()
+        settings.configure(**{
+            "LIMB_DARKENING_LAW": "linear",
+            "LD_TABLES": op.join(op.dirname(op.abspath(__file__)), "data", "light_curves", "limbdarkening")
+        })
+
+    @staticmethod
+    def build_temperatures(key, spots=False, **overrides):
+        spots = dict(spots_primary=testutils.SPOTS_META["primary"],
+                     spots_secondary=testutils.SPOTS_META["secondary"]) if spots else dict()
+        s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS[key], **spots)
+        s.primary.discretization_factor = up.radians(10)
+        s.secondary.discretization_factor = up.radians(10)
+        with settings.context(**overrides):
+            orbital_position_container = testutils.prepare_orbital_position_container(s)
+            orbital_position_container.build(components_distance=1.0)
+        orbital_position_container.flat_it()
+        return {component: getattr(orbital_position_container, component).temperatures
+                for component in ['primary', 'secondary']}
+
+    def compare_modes(self, key, spots, rtol, **overrides):
+        expected = self.build_temperatures(key, spots)
+        obtained = self.build_temperatures(key, spots, **overrides)
+        for component in ['primary', 'secondary']:
+            assert_allclose(expected[component], obtained[component], rtol=rtol, atol=0.0)
+
+    def test_memory_bounded_reflection_over_contact(self):
+        self.compare_modes('over-contact', False, 1e-10, REFLECTION_EFFECT_MEMORY_LIMIT=0.05)
+
+    def test_memory_bounded_reflection_spotty(self):
+        self.compare_modes('semi-detached', True, 1e-10, REFLECTION_EFFECT_MEMORY_LIMIT=0.05)
+
+    def test_symmetric_reflection_uses_ld_of_visible_faces(self):
+        def bolometric_ld_coefficients(temperature, log_g, metallicity, custom_ld_coefs=None):
+            # strongly varying coefficients make the coefficients of wrong faces visible in the result
+            span = np.ptp(temperature) if np.ptp(temperature) > 0 else 1.0
+            return ((temperature - temperature.min()) / span)[np.newaxis, :]
+
+        s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['over-contact'])
+        s.primary.discretization_factor = up.radians(10)
+        s.secondary.discretization_factor = up.radians(10)
+        with settings.context(REFLECTION_EFFECT=False):
+            orbital_position_container = testutils.prepare_orbital_position_container(s)
+            orbital_position_container.build(components_distance=1.0)
+
+        obtained = dict()
+        with mock.patch.object(ld, 'get_bolometric_ld_coefficients', side_effect=bolometric_ld_coefficients):
+            for use_symmetry in [True, False]:
+                system = orbital_position_container.copy()
+                bs_temperature.apply_reflection_effect(system, 1.0, settings.REFLECTION_EFFECT_ITERATIONS,
+                                                       use_symmetry=use_symmetry)
+                obtained[use_symmetry] = {component: getattr(system, component).temperatures
+                                          for component in ['primary', 'secondary']}
+
+        for component in ['primary', 'secondary']:
+            assert_allclose(obtained[False][component], obtained[True][component], rtol=1e-10, atol=0.0)
+
+    def test_sparse_reflection_matrices(self):
+        self.compare_modes('over-contact', False, 1e-12, REFLECTION_EFFECT_SPARSITY_THRESHOLD=1e-12)
+        self.compare_modes('semi-detached', True, 1e-4, REFLECTION_EFFECT_SPARSITY_THRESHOLD=1e-4)
+
+    def test_hierarchical_reflection(self):
+        self.compare_modes('over-contact', False, 1e-5, REFLECTION_EFFECT_OPENING_ANGLE=0.1)
+        self.compare_modes('over-contact', False, 5e-3, REFLECTION_EFFECT_OPENING_ANGLE=0.5)
+        self.compare_modes('semi-detached', True, 2e-3, REFLECTION_EFFECT_OPENING_ANGLE=0.2)
+
+    def test_hierarchical_irradiation_matrix_error_bound(self):
+        np.random.seed(1)
+        receiver_centres = np.random.uniform(-0.5, 0.0, (40, 3))
+        emitter_centres = np.random.uniform(1.0, 1.5, (400, 3))
+        receiver_normals = np.tile([1.0, 0.0, 0.0], (40, 1))
+        emitter_normals = np.tile([-1.0, 0.0, 0.0], (400, 1))
+        ldc = np.random.uniform(0.1, 0.4, (1, 400))
+        emitter_vector = np.random.uniform(0.5, 1.5, 400)
+        args = (receiver_centres, receiver_normals, emitter_centres, emitter_normals, ldc, 0)
+
+        expected = bs_temperature.get_irradiation_matrix(*args).dot(emitter_vector)
+        errors = [np.max(np.abs(bs_temperature.get_hierarchical_irradiation_matrix(*args, opening_angle=angle)
+                                .dot(emitter_vector) / expected - 1.0))
+                  for angle in [1e-3, 0.05, 0.8]]
+        self.assertLess(errors[0], 1e-12)
+        self.assertLess(errors[1], errors[2])
+        self.assertLess(errors[2], 1e-2)
+
+        patches = bs_temperature.get_irradiating_patches(emitter_centres, 20)
+        assert_allclose(np.arange(400), np.sort(np.concatenate(patches)))
+        self.assertTrue(all(len(patch) <= 20 for patch in patches))
+
+    def test_irradiation_kernel_ld_laws(self):
+        np.random.seed(1)
+        receiver_centres = np.random.uniform(-0.5, 0.0, (20, 3))
+        emitter_centres = np.random.uniform(1.0, 1.5, (30, 3))
+        receiver_normals = np.random.normal(0.0, 1.0, (20, 3)) + [2.0, 0.0, 0.0]
+        receiver_normals /= np.linalg.norm(receiver_normals, axis=1)[:, np.newaxis]
+        emitter_normals = np.random.normal(0.0, 1.0, (30, 3)) - [2.0, 0.0, 0.0]
+        emitter_normals /= np.linalg.norm(emitter_normals, axis=1)[:, np.newaxis]
+        emitter_vector = np.random.uniform(0.5, 1.5, 30)
+
+        distance, join_vector = utils.calculate_distance_matrix(receiver_centres, emitter_centres,
+                                                                return_join_vector_matrix=True)
+        gamma_receiver = np.clip(re_numba.gamma_primary(receiver_normals, join_vector), 0.0, None)
+        gamma_emitter = np.clip(re_numba.gamma_secondary(emitter_normals, join_vector), 0.0, None)
+        q_ab = gamma_receiver * gamma_emitter / distance ** 2
+
+        for law, n_coefficients in [('linear', 1), ('logarithmic', 2), ('square_root', 2)]:
+            ldc = np.random.uniform(0.1, 0.4, (n_coefficients, 30))
+            d_gamma = ld.limb_darkening_factor(coefficients=ldc.T, limb_darkening_law=law,
+                                               cos_theta=gamma_emitter.T).T
+            args = (receiver_centres, receiver_normals, emitter_centres, emitter_normals, ldc,
+                    re_numba.LD_LAW_CODES[law])
+            assert_allclose(q_ab * d_gamma, re_numba.irradiation_matrix(*args), rtol=1e-12, atol=1e-14)
+            # parallel kernel can't be launched in process forking workers later, its logic is tested in python
+            assert_allclose(q_ab * d_gamma, re_numba.irradiation_matrix_parallel.py_func(*args),
+                            rtol=1e-12, atol=1e-14)
+
+    def test_numba_threads_serial_in_worker_thread(self):
+        def use_parallel():
+            with utils.numba_threads(4) as parallel:
+                return parallel
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertFalse(executor.submit(use_parallel).result())
+        with utils.numba_threads(1) as parallel:
+            self.assertFalse(parallel)
+
+    def test_reflection_in_thread_pool(self):
+        expected = self.build_temperatures('over-contact', False, NUMBER_OF_THREADS=4)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self.build_temperatures, 'over-contact', False, NUMBER_OF_THREADS=4)
+                       for _ in range(2)]
+            results = [future.result(timeout=300) for future in futures]
+        for obtained in results:
+            for component in ['primary', 'secondary']:
+                assert_allclose(expected[component], obtained[component], rtol=1e-12)
+
+
 class GravityDarkeningAlbedoTestCase(ElisaTestCase):
     def setUp(self):
         super(GravityDarkeningAlbedoTestCase, self).setUp()
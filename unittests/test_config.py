@@ -2,6 +2,7 @@
 # due to stupid astropy units/constants implementation
 from unittests import set_astropy_units
 
+import threading
 import numpy as np
 
 from numpy.testing import assert_array_equal
@@ -44,3 +45,54 @@ class TestConfig(ElisaTestCase):
         settings._update_atlas_to_base_dir()
         ck_values = [v for k, v in settings.ATLAS_TO_BASE_DIR.items() if str(k).startswith("c")]
         self.assertTrue(np.all(ck_values == ['x'] * len(ck_values)))
+
+    def test_context(self):
+        law = settings.LIMB_DARKENING_LAW
+        with settings.context(LIMB_DARKENING_LAW='linear', NUMBER_OF_PROCESSES=1):
+            self.assertEqual('linear', settings.LIMB_DARKENING_LAW)
+            with settings.context(LIMB_DARKENING_LAW='logarithmic'):
+                self.assertEqual('logarithmic', settings.LIMB_DARKENING_LAW)
+                self.assertEqual(1, settings.NUMBER_OF_PROCESSES)
+            self.assertDictEqual(dict(LIMB_DARKENING_LAW='linear', NUMBER_OF_PROCESSES=1),
+                                 settings.context_overrides())
+        self.assertEqual(law, settings.LIMB_DARKENING_LAW)
+        self.assertDictEqual(dict(), settings.context_overrides())
+
+        with self.assertRaises(ValueError):
+            with settings.context(NON_EXISTING_SETTING=1):
+                pass
+
+    def test_context_lookup_installed_only_within_context(self):
+        settings_cls = type(settings)
+        self.assertNotIn('__getattribute__', settings_cls.__dict__)
+        with settings.context(LIMB_DARKENING_LAW='linear'):
+            self.assertIn('__getattribute__', settings_cls.__dict__)
+            with settings.context(NUMBER_OF_PROCESSES=1):
+                pass
+            self.assertEqual('linear', settings.LIMB_DARKENING_LAW)
+        self.assertNotIn('__getattribute__', settings_cls.__dict__)
+
+    def test_context_atlas_to_base_dir(self):
+        with settings.context(CK04_ATM_TABLES="x"):
+            self.assertEqual("x", settings.ATLAS_TO_BASE_DIR["ck04"])
+        self.assertNotEqual("x", settings.ATLAS_TO_BASE_DIR["ck04"])
+
+    def test_context_is_thread_local(self):
+        law = settings.LIMB_DARKENING_LAW
+        entered, checked = threading.Event(), threading.Event()
+        obtained = list()
+
+        def task():
+            with settings.context(LIMB_DARKENING_LAW='cosine'):
+                entered.set()
+                checked.wait(10)
+                obtained.append(settings.LIMB_DARKENING_LAW)
+
+        thread = threading.Thread(target=task)
+        thread.start()
+        entered.wait(10)
+        obtained.append(settings.LIMB_DARKENING_LAW)
+        checked.set()
+        thread.join()
+
+        self.assertListEqual([law, 'cosine'], obtained)
@@ -3,8 +3,10 @@
 from unittests import set_astropy_units
 
 import os.path as op
+import numpy as np
 
-from elisa import umpy as up, settings
+from numpy.testing import assert_array_equal, assert_array_almost_equal, assert_allclose
+from elisa import umpy as up, settings, utils, const
 from elisa.base.container import (
     StarContainer,
     StarPropertiesContainer,
@@ -13,7 +15,9 @@ from elisa.base.container import (
 from elisa.binary_system.container import OrbitalPositionContainer
 from elisa.single_system.container import SinglePositionContainer
 from elisa.binary_system.system import BinarySystem
+from elisa.binary_system import utils as bsutils
 from elisa.const import Position
+from elisa.buffer import buffer
 from unittests import utils as testutils
 from unittests.utils import ElisaTestCase
 
@@ -103,3 +107,99 @@ class IndempotenceTestCase(ElisaTestCase):
         flatt_1 = system.flat_it()
         flatt_2 = system.flat_it()
         self.assertTrue(len(flatt_1.star.points) == len(flatt_2.star.points))
+
+
+class ContainerCopyTestCase(ElisaTestCase):
+    def setUp(self):
+        super(ContainerCopyTestCase, self).setUp()
+        self.s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['detached-physical'],
+                                                 testutils.SPOTS_META["primary"])
+        self.s.primary.discretization_factor = up.radians(10)
+        self.s.secondary.discretization_factor = up.radians(10)
+        self.base_path = op.dirname(op.abspath(__file__))
+        settings.configure(LD_TABLES=op.join(self.base_path, "data", "light_curves", "limbdarkening"))
+
+    def test_copy_shares_surface_arrays(self):
+        system = OrbitalPositionContainer.from_binary_system(self.s, Position(0, 1.0, 0.0, 0.0, 0.0))
+        system.build(components_distance=1.0, build_pulsations=False)
+        copied = system.copy()
+
+        for component in ['primary', 'secondary']:
+            star, star_copy = getattr(system, component), getattr(copied, component)
+            self.assertIsNot(star, star_copy)
+            for prop in ['points', 'faces', 'areas', 'temperatures']:
+                self.assertIs(getattr(star, prop), getattr(star_copy, prop))
+        self.assertIsNot(system.primary.spots, copied.primary.spots)
+        self.assertIsNot(system.primary.spots[0], copied.primary.spots[0])
+
+    def test_move_sys_onpos_on_copy_keeps_original(self):
+        system = OrbitalPositionContainer.from_binary_system(self.s, Position(0, 1.0, 0.0, 0.0, 0.0))
+        system.build(components_distance=1.0, build_pulsations=False)
+        system.gamma = 1e4
+        points, velocities = np.copy(system.primary.points), np.copy(system.primary.velocities)
+
+        on_pos = bsutils.move_sys_onpos(system, Position(1, 1.0, 1.0, 0.0, 0.2), on_copy=True)
+        self.assertIsNot(on_pos.primary.points, system.primary.points)
+        assert_array_equal(points, system.primary.points)
+        assert_array_equal(velocities, system.primary.velocities)
+        self.assertIsNone(system.primary.indices)
+
+
+class LazyRotationTestCase(ElisaTestCase):
+    def setUp(self):
+        super(LazyRotationTestCase, self).setUp()
+        self.s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['detached-physical'])
+        self.s.primary.discretization_factor = up.radians(10)
+        self.s.secondary.discretization_factor = up.radians(10)
+        self.base_path = op.dirname(op.abspath(__file__))
+        settings.configure(LD_TABLES=op.join(self.base_path, "data", "light_curves", "limbdarkening"))
+
+    def test_lazy_rotation_matches_eager_rotation(self):
+        system = OrbitalPositionContainer.from_binary_system(self.s, Position(0, 1.0, 0.0, 0.0, 0.0))
+        system.build(components_distance=1.0)
+        system.gamma = 1e4
+        position = Position(1, 1.0, 1.0, 0.0, 0.2)
+        props = ['points', 'normals', 'velocities', 'face_centres']
+        expected = {prop: utils.rotate_item(getattr(system.primary, prop), position, system.inclination)
+                    for prop in props}
+        expected['velocities'][:, 0] += system.gamma
+
+        on_pos = bsutils.move_sys_onpos(system, position, on_copy=True)
+        star = on_pos.primary
+        self.assertEqual(set(props), set(star._transformations))
+
+        assert_array_almost_equal(np.dot(expected['normals'], const.LINE_OF_SIGHT), star.los_cosines, 12)
+        indices = star.indices
+        for prop in props:
+            assert_allclose(expected[prop][indices], star.get_transformed_subset(prop, indices), rtol=1e-12, atol=1e-12)
+        self.assertEqual(set(props), set(star._transformations))
+
+        for prop in props:
+            assert_allclose(expected[prop], getattr(star, prop), rtol=1e-12, atol=1e-12)
+        self.assertEqual(0, len(star._transformations))
+
+
+class ConcurrentBuildTestCase(ElisaTestCase):
+    def setUp(self):
+        super(ConcurrentBuildTestCase, self).setUp()
+        self.s = testutils.prepare_binary_system(testutils.BINARY_SYSTEM_PARAMS['detached-physical'],
+                                                 testutils.SPOTS_META["primary"])
+        self.s.primary.discretization_factor = up.radians(7)
+        self.s.secondary.discretization_factor = up.radians(7)
+        self.base_path = op.dirname(op.abspath(__file__))
+        settings.configure(LD_TABLES=op.join(self.base_path, "data", "light_curves", "limbdarkening"))
+
+    def build_container(self, concurrent):
+        # radii are not warm-started from the previous build (which changes them within the tolerance of the solver)
+        buffer.SOLVER_SEEDS.clear()
+        with settings.context(USE_CONCURRENT_COMPONENT_BUILD=concurrent, MESH_GENERATOR='improved_trapezoidal'):
+            system = OrbitalPositionContainer.from_binary_system(self.s, Position(0, 1.0, 0.0, 0.0, 0.0))
+            return system.build(components_distance=1.0)
+
+    def test_concurrent_build_matches_sequential_build(self):
+        expected = self.build_container(concurrent=False)
+        obtained = self.build_container(concurrent=True)
+        for component in ['primary', 'secondary']:
+            for prop in ['points', 'faces', 'areas', 'temperatures']:
+                assert_array_equal(getattr(getattr(expected, component), prop),
+                                   getattr(getattr(obtained, component), prop))
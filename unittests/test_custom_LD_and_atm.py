@@ -1,4 +1,5 @@
 import numpy as np
+import os.path as op
 from numpy.testing import assert_array_equal
 
 from elisa import (
@@ -14,6 +15,11 @@ from elisa.base.curves.utils import get_component_limbdarkening_cfs
 class BinarySystemSeparatedAtmospheres(ElisaTestCase):
     def setUp(self):
         super(BinarySystemSeparatedAtmospheres, self).setUp()
+        lc_base_path = op.join(op.dirname(op.abspath(__file__)), "data", "light_curves")
+        settings.configure(**{
+            "LD_TABLES": op.join(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(lc_base_path, "atmosphere")
+        })
 
     @staticmethod
     def test_atmospheres_of_components_differs():
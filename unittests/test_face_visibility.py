@@ -85,7 +85,7 @@ class VisibilityTestCase(ElisaTestCase):
         self.assertEqual(primary_vis_faces, expected_values['primary'])
         self.assertEqual(secondary_vis_faces, expected_values['secondary'])
 
-        expected_sums = {'primary': 3.3529083384789416e+16, 'secondary': 2.093212371790947e+19}
+        expected_sums = {'primary': 3.352908338478941e+16, 'secondary': 2.093212371790947e+19}
         vis_area_p = np.sum(retval['primary'])
         vis_area_s = np.sum(retval['secondary'])
         self.assertEqual(vis_area_p, expected_sums['primary'], 5)
@@ -0,0 +1,40 @@
+# keep it first
+# due to stupid astropy units/constants implementation
+from unittests import set_astropy_units
+
+import os
+
+from multiprocessing.pool import Pool
+
+from elisa import settings
+from elisa.observer import mp_manager
+from unittests.utils import ElisaTestCase
+
+set_astropy_units()
+
+
+def _inner_task(x):
+    return x ** 2
+
+
+def _outer_task(x):
+    with Pool(processes=settings.NUMBER_OF_PROCESSES) as pool:
+        return sum(pool.map(_inner_task, range(x))), settings.NUMBER_OF_PROCESSES, os.environ['OMP_NUM_THREADS']
+
+
+class NestedParallelismTestCase(ElisaTestCase):
+    def test_split_core_budget(self):
+        # enough walkers to occupy all cores
+        self.assertTupleEqual((8, 1), mp_manager.split_core_budget(8, 16, 100))
+        # few walkers, remaining cores are used for phases
+        self.assertTupleEqual((2, 4), mp_manager.split_core_budget(8, 2, 100))
+        # 10 walkers on 16 cores, all walkers at once is preferred
+        self.assertTupleEqual((10, 1), mp_manager.split_core_budget(16, 10, 100))
+        # inner level limited by number of phases
+        self.assertTupleEqual((1, 3), mp_manager.split_core_budget(8, 1, 3))
+        self.assertTupleEqual((1, 1), mp_manager.split_core_budget(1, 10, 100))
+
+    def test_nested_pool(self):
+        with mp_manager.nested_pool(2, 2) as pool:
+            result = pool.map(_outer_task, [3, 4])
+        self.assertListEqual([(5, 2, '1'), (14, 2, '1')], result)
@@ -2,16 +2,20 @@
 # due to stupid astropy units/constants implementation
 from unittests import set_astropy_units
 
+import asyncio
+import pickle
 import random
 import sys
 import os
 import numpy as np
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from copy import copy
 from os.path import dirname
 from os.path import join as pjoin
 
-from numpy.testing import assert_array_equal, assert_equal
+from numpy.testing import assert_array_equal, assert_equal, assert_array_almost_equal
 from pandas.testing import assert_frame_equal
 
 from elisa.binary_system.system import BinarySystem
@@ -23,7 +27,7 @@ from elisa.observer.passband import PassbandContainer
 from elisa.observer.passband import bolometric
 from elisa.observer.utils import convert_to_magnitudes
 from elisa.photometric_standards.standards_handlers import load_standard
-from unittests.utils import ElisaTestCase
+from unittests.utils import ElisaTestCase, prepare_binary_system, BINARY_SYSTEM_PARAMS
 
 set_astropy_units()
 
@@ -258,6 +262,123 @@ class TestObserver(ElisaTestCase):
                 assert_equal(mags[passband][0], zm)
 
 
+class TestObserverAsync(ElisaTestCase):
+    def setUp(self):
+        super(TestObserverAsync, self).setUp()
+        lc_base_path = pjoin(dirname(os.path.abspath(__file__)), "data", "light_curves")
+        settings.configure(**{
+            "LD_TABLES": pjoin(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": pjoin(lc_base_path, "atmosphere")
+        })
+        self.write_default_support(ld_tables=settings.LD_TABLES, atm_tables=settings.CK04_ATM_TABLES)
+        self.binary = prepare_binary_system(BINARY_SYSTEM_PARAMS["detached-physical"])
+        self.phases = np.linspace(0.0, 1.0, 5)
+
+    @staticmethod
+    def run_until_complete(coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def do_comparison(self, executor):
+        o = Observer(passband='Generic.Bessell.V', system=self.binary, executor=executor, max_concurrency=2)
+        expected_lc = o.lc(phases=self.phases)[1]['Generic.Bessell.V']
+        expected_rv = o.rv(phases=self.phases, method='kinematic')[1]
+
+        async def observe():
+            return await asyncio.gather(o.lc_async(phases=self.phases),
+                                        o.observe.lc_async(phases=self.phases, normalize=True),
+                                        o.rv_async(phases=self.phases, method='kinematic'))
+
+        lc, lc_normalized, rv = self.run_until_complete(observe())
+
+        assert_array_almost_equal(expected_lc, lc[1]['Generic.Bessell.V'])
+        assert_array_almost_equal(expected_lc / np.max(expected_lc), lc_normalized[1]['Generic.Bessell.V'])
+        for component in ['primary', 'secondary']:
+            assert_array_almost_equal(expected_rv[component], rv[1][component])
+        assert_array_almost_equal(expected_rv['primary'], o.radial_velocities['primary'])
+
+    def test_copy_rebuilds_observables(self):
+        o = Observer(passband='Generic.Bessell.V', system=self.binary, executor=ThreadPoolExecutor(max_workers=1))
+        for other in [copy(o), pickle.loads(pickle.dumps(o))]:
+            self.assertIs(other, other.observe.observer)
+            self.assertIs(other, other.plot.observer)
+            self.assertIsNone(other.executor)
+        o.executor.shutdown()
+
+    def test_lc_async_thread_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.do_comparison(executor)
+
+    def test_lc_async_process_executor(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.do_comparison(executor)
+
+    def test_cancel_pending_observation(self):
+        o = Observer(passband='Generic.Bessell.V', system=self.binary, max_concurrency=1)
+
+        async def observe():
+            running = asyncio.ensure_future(o.lc_async(phases=self.phases))
+            pending = asyncio.ensure_future(o.lc_async(phases=self.phases))
+            await asyncio.sleep(0)
+            pending.cancel()
+            await running
+            return pending
+
+        pending = self.run_until_complete(observe())
+        self.assertTrue(pending.cancelled())
+
+    def test_lc_async_respects_settings_context(self):
+        o = Observer(passband='Generic.Bessell.V', system=self.binary)
+        with settings.context(LIMB_DARKENING_LAW='logarithmic'):
+            expected = o.lc(phases=self.phases)[1]['Generic.Bessell.V']
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            o.executor = executor
+            with settings.context(LIMB_DARKENING_LAW='logarithmic'):
+                obtained = self.run_until_complete(o.lc_async(phases=self.phases))[1]['Generic.Bessell.V']
+        assert_array_almost_equal(expected / np.max(expected), obtained / np.max(expected))
+
+
+class TestObserverPerBandPhases(ElisaTestCase):
+    def setUp(self):
+        super(TestObserverPerBandPhases, self).setUp()
+        lc_base_path = pjoin(dirname(os.path.abspath(__file__)), "data", "light_curves")
+        settings.configure(**{
+            "LD_TABLES": pjoin(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": pjoin(lc_base_path, "atmosphere")
+        })
+        self.write_default_support(ld_tables=settings.LD_TABLES, atm_tables=settings.CK04_ATM_TABLES)
+        self.binary = prepare_binary_system(BINARY_SYSTEM_PARAMS["detached-physical"])
+        self.phases = np.linspace(0.0, 1.0, 5)
+
+    def test_lc_per_band_phases(self):
+        passbands = ['Generic.Bessell.V', 'bolometric']
+        band_phases = {'Generic.Bessell.V': np.array([0.0, 0.25, 0.5, 1.25]),
+                       'bolometric': np.array([0.1, 0.25, 0.75])}
+        o = Observer(passband=passbands, system=self.binary)
+        phases, fluxes = o.lc(phases=band_phases)
+
+        for band in passbands:
+            expected = Observer(passband=band, system=self.binary).lc(phases=band_phases[band])[1][band]
+            assert_array_almost_equal(band_phases[band], phases[band])
+            assert_array_almost_equal(expected / np.max(expected), fluxes[band] / np.max(expected))
+
+        normalized = o.lc(phases=band_phases, normalize=True)[1]
+        for band in passbands:
+            self.assertEqual(len(band_phases[band]), len(normalized[band]))
+            self.assertAlmostEqual(1.0, np.max(normalized[band]))
+
+    def test_lc_per_band_phases_invalid_passbands(self):
+        o = Observer(passband=['Generic.Bessell.V', 'bolometric'], system=self.binary)
+        with self.assertRaises(ValueError):
+            o.lc(phases={'Generic.Bessell.V': self.phases})
+        with self.assertRaises(ValueError):
+            o.lc_rv(phases={'Generic.Bessell.V': self.phases, 'bolometric': self.phases})
+
+
 class BinarySystemMock(object):
     class Star(object):
         def __init__(self, p=False):
@@ -294,3 +415,31 @@ class SingleSystemMock(object):
 
     def __init__(self, p=False, s=False):
         self.star = self.Star(p, s)
+
+
+class TestObserverThreadContext(ElisaTestCase):
+    def setUp(self):
+        super(TestObserverThreadContext, self).setUp()
+        lc_base_path = pjoin(dirname(os.path.abspath(__file__)), "data", "light_curves")
+        settings.configure(**{
+            "LD_TABLES": pjoin(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": pjoin(lc_base_path, "atmosphere")
+        })
+        self.binary = prepare_binary_system(BINARY_SYSTEM_PARAMS["detached-physical"])
+        self.phases = np.linspace(0.0, 1.0, 5)
+        self.laws = ['linear', 'logarithmic', 'square_root', 'linear']
+
+    def observe(self, law):
+        with settings.context(LIMB_DARKENING_LAW=law, NUMBER_OF_PROCESSES=1):
+            o = Observer(passband='Generic.Bessell.V', system=self.binary)
+            return o.lc(phases=self.phases)[1]['Generic.Bessell.V']
+
+    def test_concurrent_observations_with_different_settings(self):
+        expected = [self.observe(law) for law in self.laws]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            obtained = list(executor.map(self.observe, self.laws))
+
+        for exp, obt in zip(expected, obtained):
+            assert_array_almost_equal(exp / np.max(exp), obt / np.max(exp))
+        # different limb darkening laws have to produce different light curves
+        self.assertFalse(np.allclose(expected[0], expected[1], rtol=1e-6, atol=0.0))
@@ -33,6 +33,17 @@ def test_get_approx_ecl_angular_width():
     assert_array_equal(expected_inner, result_inner)
 
 
+def test_solve_kepler_equation():
+    mean_anomaly = np.linspace(-c.FULL_ARC, 2.0 * c.FULL_ARC, 1001)
+    for eccentricity in [0.0, 0.1, 0.5, 0.9, 0.99]:
+        eccentric_anomaly = orbit.solve_kepler_equation(mean_anomaly, eccentricity)
+        assert np.all((eccentric_anomaly >= 0) & (eccentric_anomaly < c.FULL_ARC))
+        obtained = (eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly)) % c.FULL_ARC
+        expected = mean_anomaly % c.FULL_ARC
+        difference = np.abs(obtained - expected)
+        assert np.all(np.minimum(difference, c.FULL_ARC - difference) < 1e-10)
+
+
 class OrbitTestCase(ElisaTestCase):
 
     def setUp(self):
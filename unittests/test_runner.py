@@ -0,0 +1,75 @@
+# keep it first
+# due to stupid astropy units/constants implementation
+from unittests import set_astropy_units
+
+import json
+import tempfile
+import os.path as op
+import numpy as np
+
+from copy import deepcopy
+from numpy.testing import assert_array_almost_equal
+
+from elisa import settings, batch, runner
+from unittests.test_batch import DEFINITION
+from unittests.utils import ElisaTestCase
+
+set_astropy_units()
+
+
+class RunnerTestCase(ElisaTestCase):
+    def setUp(self):
+        super(RunnerTestCase, self).setUp()
+        lc_base_path = op.join(op.dirname(op.abspath(__file__)), "data", "light_curves")
+        self.config = {
+            "LD_TABLES": op.join(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(lc_base_path, "atmosphere")
+        }
+        settings.configure(**self.config)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = op.join(self.tmp.name, 'systems.jsonl')
+        invalid = deepcopy(DEFINITION)
+        invalid["primary"]["surface_potential"] = 1.0
+        lines = [json.dumps(DEFINITION), '{"system": ', json.dumps(invalid), json.dumps(DEFINITION)]
+        with open(self.input, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        self.observation = dict(passband=('Generic.Bessell.V', ), phases=np.array([0.0, 0.25, 0.5]))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        super(RunnerTestCase, self).tearDown()
+
+    @staticmethod
+    def read_records(path):
+        with open(path, 'r') as f:
+            return {record['index']: record for record in map(json.loads, f)}
+
+    def test_run(self):
+        summary = runner.run(self.input, self.observation, n_processes=1, config=self.config, progress=False)
+        records = self.read_records(runner.default_output_path(self.input))
+
+        self.assertEqual(3, summary['evaluated'])
+        self.assertEqual(2, summary['failed'])
+        self.assertListEqual(['ok', 'error', 'error', 'ok'], [records[idx]['status'] for idx in range(4)])
+        self.assertIn('JSONDecodeError', records[1]['error'])
+
+        expected = batch.evaluate(DEFINITION, self.observation)['lc@Generic.Bessell.V']
+        assert_array_almost_equal(expected, records[3]['curves']['lc@Generic.Bessell.V'])
+
+    def test_resume(self):
+        output = op.join(self.tmp.name, 'output.jsonl')
+        runner.run(self.input, self.observation, output=output, n_processes=1, config=self.config, progress=False)
+
+        # simulate interruption during writing of the last record
+        with open(output, 'r') as f:
+            lines = f.readlines()
+        with open(output, 'w') as f:
+            f.writelines(lines[:-1] + [lines[-1][:10]])
+
+        summary = runner.run(self.input, self.observation, output=output, n_processes=1, config=self.config,
+                             progress=False)
+        self.assertEqual(1, summary['evaluated'])
+        self.assertEqual(3, summary['skipped'])
+        self.assertListEqual(list(range(4)), sorted(self.read_records(output).keys()))
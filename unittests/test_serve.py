@@ -0,0 +1,129 @@
+# keep it first
+# due to stupid astropy units/constants implementation
+from unittests import set_astropy_units
+
+import json
+import time
+import threading
+import os.path as op
+import numpy as np
+
+from urllib import request
+from urllib.error import HTTPError
+from numpy.testing import assert_array_almost_equal
+
+from elisa import settings, batch, serve
+from unittests.test_batch import DEFINITION
+from unittests.utils import ElisaTestCase
+
+set_astropy_units()
+
+
+class ServeTestCase(ElisaTestCase):
+    def setUp(self):
+        super(ServeTestCase, self).setUp()
+        lc_base_path = op.join(op.dirname(op.abspath(__file__)), "data", "light_curves")
+        self.config = {
+            "LD_TABLES": op.join(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(lc_base_path, "atmosphere")
+        }
+        settings.configure(**self.config)
+
+        self.server = serve.make_server(port=0, n_processes=1, config=self.config, warmup=False)
+        self.url = 'http://{}:{}'.format(*self.server.server_address[:2])
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.evaluator.close()
+        self.server.server_close()
+        super(ServeTestCase, self).tearDown()
+
+    def post(self, content):
+        req = request.Request(self.url + '/evaluate', data=json.dumps(content).encode('utf-8'), method='POST')
+        with request.urlopen(req) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def test_evaluate(self):
+        phases = [0.0, 0.25, 0.5]
+        observation = dict(passband=['Generic.Bessell.V'], phases=phases, rv=True)
+        response = self.post(dict(system=DEFINITION, observation=observation))
+
+        expected = batch.evaluate(DEFINITION, serve.parse_observation(observation))
+        self.assertEqual('ok', response['status'])
+        self.assertListEqual(phases, response['phases'])
+        self.assertSetEqual(set(expected.keys()), set(response['curves'].keys()))
+        for label, curve in expected.items():
+            assert_array_almost_equal(curve, np.array(response['curves'][label], dtype=float))
+
+    def test_invalid_requests(self):
+        with self.assertRaises(HTTPError) as context:
+            self.post(dict(system=DEFINITION, observation=dict(passband='Generic.Bessell.V')))
+        self.assertEqual(400, context.exception.code)
+
+        for system in [[DEFINITION], 'binary', None]:
+            with self.assertRaises(HTTPError) as context:
+                self.post(dict(system=system, observation=dict(phases=[0.0])))
+            self.assertEqual(400, context.exception.code)
+
+        invalid = dict(DEFINITION, primary=dict(DEFINITION['primary'], surface_potential=1.0))
+        with self.assertRaises(HTTPError) as context:
+            self.post(dict(system=invalid, observation=dict(phases=[0.0])))
+        self.assertEqual(422, context.exception.code)
+        self.assertEqual('error', json.loads(context.exception.read().decode('utf-8'))['status'])
+
+    def test_health(self):
+        with request.urlopen(self.url + '/health') as response:
+            self.assertEqual('ok', json.loads(response.read().decode('utf-8'))['status'])
+
+
+class ServePoolTimeoutTestCase(ElisaTestCase):
+    def setUp(self):
+        super(ServePoolTimeoutTestCase, self).setUp()
+        lc_base_path = op.join(op.dirname(op.abspath(__file__)), "data", "light_curves")
+        self.config = {
+            "LD_TABLES": op.join(lc_base_path, "limbdarkening"),
+            "CK04_ATM_TABLES": op.join(lc_base_path, "atmosphere")
+        }
+        settings.configure(**self.config)
+        self.evaluator = serve.Evaluator(n_processes=2, config=self.config, timeout=1.0, warmup=False)
+
+    def tearDown(self):
+        self.evaluator.close()
+        super(ServePoolTimeoutTestCase, self).tearDown()
+
+    def test_timed_out_workers_are_freed(self):
+        slow = dict(DEFINITION,
+                    system=dict(DEFINITION['system'], eccentricity=0.3),
+                    primary=dict(DEFINITION['primary'], discretization_factor=3))
+        slow_observation = serve.parse_observation(dict(passband=['Generic.Bessell.V'],
+                                                        phases=np.linspace(0, 1, 500)))
+        # occupy both workers
+        for _ in range(2):
+            status, _ = self.evaluator.evaluate(slow, slow_observation)
+            self.assertEqual('timeout', status)
+
+        self.evaluator.timeout = 60.0
+        start = time.time()
+        status, _ = self.evaluator.evaluate(DEFINITION, serve.parse_observation(dict(phases=[0.0, 0.5])))
+        self.assertEqual('ok', status)
+        self.assertLess(time.time() - start, 30.0)
+
+    def test_timeout_in_single_process_mode(self):
+        evaluator = serve.Evaluator(n_processes=1, config=self.config, timeout=1.0, warmup=False)
+        try:
+            self.assertIsNotNone(evaluator.pool)
+            slow = dict(DEFINITION,
+                        system=dict(DEFINITION['system'], eccentricity=0.3),
+                        primary=dict(DEFINITION['primary'], discretization_factor=3))
+            slow_observation = serve.parse_observation(dict(passband=['Generic.Bessell.V'],
+                                                            phases=np.linspace(0, 1, 500)))
+            # evaluated from the thread the same way as requests of the server
+            results = []
+            thread = threading.Thread(target=lambda: results.append(evaluator.evaluate(slow, slow_observation)))
+            thread.start()
+            thread.join()
+            self.assertEqual('timeout', results[0][0])
+        finally:
+            evaluator.close()
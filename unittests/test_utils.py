@@ -107,6 +107,14 @@ class TestElisaEngineUtils(ElisaTestCase):
         self.subtest_arbitrary_rotation(-270, to_rotate, True, expected)
         self.subtest_arbitrary_rotation(-3. * const.PI / 2.0, to_rotate, False, expected)
 
+    def test_arbitrary_rotations(self):
+        to_rotate = np.array([[1.0, 0.0, 0.0], [1.0, 1.0, 1.0], [-1.0, 1.3, -2.1]])
+        omega = np.array([-1.0, 1.0, 1.0])
+        angles = np.array([const.PI / 2.0, 0.3, -3.0])
+        expected = [utils.arbitrary_rotation(angle, omega, vector) for angle, vector in zip(angles, to_rotate)]
+        obtained = utils.arbitrary_rotations(angles, omega, to_rotate)
+        assert_array_equal(np.round(obtained, 12), np.round(expected, 12))
+
     @staticmethod
     def subtest_around_axis_rotation(angle, vectors, axis, degree, expected):
         obtained = np.round(utils.around_axis_rotation(angle, vectors, axis, degrees=degree), 4)